@@ -0,0 +1,83 @@
+"""Compares the memory used by a day 8 map stored as nested lists and as a `Grid`.
+
+Day 8 used to keep the map as a list of rows and a transposed list of columns, each\
+     a list of ints. A `Grid` keeps one byte per tree, and reads rows and columns\
+         through memoryviews. A random map of digits is built for the comparison (5000\
+             x 5000 by default). Run with `poetry run python -m misc.bench_grid`, or\
+                 pass the width and height:
+
+    poetry run python -m misc.bench_grid 2000 3000
+"""
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable
+
+from advent_of_code import grid
+
+SIZE = 5000
+# Maps each byte value to an ASCII digit
+_TO_DIGIT = bytes.maketrans(bytes(range(256)), bytes(48 + i % 10 for i in range(256)))
+
+
+def random_map(width: int, height: int) -> str:
+    """Returns a map of random digits, one row per line."""
+    digits = os.urandom(width * height).translate(_TO_DIGIT).decode()
+    return "\n".join(
+        digits[row * width : (row + 1) * width] for row in range(0, height)
+    )
+
+
+def as_lists(text: str) -> tuple:
+    """Builds the rows and columns of the map the way day 8 used to."""
+    lines = text.split("\n")
+    rows = [[int(i) for i in row] for row in lines]
+    cols = [[int(row[i]) for row in lines] for i in range(0, len(rows[0]))]
+    return rows, cols
+
+
+def measure(build: Callable[[str], object], text: str) -> tuple[int, int, float]:
+    """Builds the map and measures it.
+
+    Args:
+        build (Callable[[str], object]): Builds the map from the text.
+        text (str): The map.
+
+    Returns:
+        tuple[int, int, float]: The bytes still allocated while the map is held, the\
+             peak bytes allocated while building it, and the seconds it took.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+    built = build(text)
+    elapsed = time.perf_counter() - start
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del built
+    return held, peak, elapsed
+
+
+def main() -> None:
+    """Builds the map both ways and prints the results."""
+    width, height = (
+        (int(sys.argv[1]), int(sys.argv[2])) if len(sys.argv) == 3 else (SIZE, SIZE)
+    )
+    text = random_map(width, height)
+    print(
+        "{width} x {height} map ({size} bytes of text)".format(
+            width=width, height=height, size=len(text)
+        )
+    )
+    print("{:>12}  {:>10}  {:>10}  {:>8}".format("", "held MB", "peak MB", "seconds"))
+    for name, build in (("nested lists", as_lists), ("Grid", grid.from_digits)):
+        held, peak, elapsed = measure(build, text)
+        print(
+            "{name:>12}  {held:>10.1f}  {peak:>10.1f}  {elapsed:>8.2f}".format(
+                name=name, held=held / 1e6, peak=peak / 1e6, elapsed=elapsed
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""Times how long the 2022 solutions take to parse their input.
+
+The test inputs are too small to time, so each one is repeated (or, for grids,
+tiled) until it is about `TARGET_BYTES` long. The scaled inputs are not valid
+puzzles, so only parsing is timed, not solving. Run with
+`poetry run python -m misc.bench_parsing`, or pass the target size in bytes:
+
+    poetry run python -m misc.bench_parsing 10000000
+"""
+from importlib import import_module
+import math
+from os import path
+import statistics
+import sys
+import time
+from typing import Callable
+
+REPEATS = 5
+TARGET_BYTES = 1_000_000
+TEST_INPUTS = path.join(
+    path.dirname(path.dirname(__file__)), "tests", "year_2022", "test_inputs"
+)
+
+
+def _repeat(separator: str) -> Callable[[str, int], str]:
+    """Returns a function that repeats a text, with `separator` between copies."""
+    return lambda text, target: separator.join(
+        [text] * max(1, target // (len(text) + len(separator)))
+    )
+
+
+def _repeat_moves(text: str, target: int) -> str:
+    """Repeats the move instructions of day 5, keeping a single drawing of stacks."""
+    stacks, moves = text.split("\n\n")
+    return stacks + "\n\n" + _repeat("\n")(moves, target)
+
+
+def _tile(text: str, target: int) -> str:
+    """Tiles a grid horizontally and vertically, so it stays rectangular."""
+    factor = max(1, math.isqrt(target // len(text)))
+    rows = [row * factor for row in text.split("\n")]
+    return "\n".join(rows * factor)
+
+
+# Test input, and how to scale it, for each day. Every day parses it with parse().
+DAYS = {
+    "1": ("day_1_input.txt", _repeat("\n\n")),
+    "2": ("day_2_input.txt", _repeat("\n")),
+    "3": ("day_3_input.txt", _repeat("\n")),
+    "4": ("day_4_input.txt", _repeat("\n")),
+    "5": ("day_5_input.txt", _repeat_moves),
+    "6": ("day_6_input_1.txt", _repeat("")),
+    "8": ("day_8_input.txt", _tile),
+    "9": ("day_9_input_2.txt", _repeat("\n")),
+    "10": ("day_10_input_2.txt", _repeat("\n")),
+    "11": ("day_11_input.txt", _repeat("\n\n")),
+}
+
+
+def time_parse(day: str, target: int) -> tuple[int, float]:
+    """Parses the scaled input of a day several times.
+
+    Args:
+        day (str): Day of challenge.
+        target (int): Approximate size of the scaled input in bytes.
+
+    Returns:
+        tuple[int, float]: The size of the scaled input in bytes, and the median\
+             time taken to parse it in seconds.
+    """
+    file_name, scale = DAYS[day]
+    with open(path.join(TEST_INPUTS, file_name), "r") as f:
+        text = scale(f.read().rstrip(), target)
+    parse = import_module("advent_of_code.year_2022.day_" + day).parse
+
+    times = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        parse(text)
+        times.append(time.perf_counter() - start)
+    return len(text), statistics.median(times)
+
+
+def main() -> None:
+    """Times the parsing of each day and prints the results."""
+    target = int(sys.argv[1]) if len(sys.argv) == 2 else TARGET_BYTES
+    print("{:>4}  {:>10}  {:>10}  {:>8}".format("day", "bytes", "ms", "MB/s"))
+    for day in DAYS:
+        size, seconds = time_parse(day, target)
+        print(
+            "{day:>4}  {size:>10}  {ms:>10.2f}  {rate:>8.1f}".format(
+                day=day, size=size, ms=seconds * 1000, rate=size / seconds / 1e6
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
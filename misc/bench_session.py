@@ -0,0 +1,93 @@
+"""Compares per-fetch latency of bare requests.get against the shared session.
+
+A local server stands in for the Advent of Code website, so only the cost of setting
+up connections is measured. Run with `poetry run python -m misc.bench_session`, or
+pass a certificate and key file to serve over HTTPS and include the TLS handshake:
+
+    poetry run python -m misc.bench_session cert.pem key.pem
+"""
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import ssl
+import statistics
+import sys
+from threading import Thread
+import time
+from typing import Callable, Union
+
+import requests
+
+from advent_of_code import advent_of_code_requests as aoc_requests
+
+FETCHES = 200
+BODY = b"1000\n2000\n3000\n" * 1000
+
+
+class _InputHandler(BaseHTTPRequestHandler):
+    """Serves the same puzzle input for every request, keeping connections alive."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Responds with the puzzle input."""
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silences the per-request log lines."""
+
+
+def _time_fetches(fetch: Callable[[str], requests.Response], url: str) -> list:
+    """Returns the latency of each fetch in milliseconds."""
+    latencies = []
+    for _ in range(FETCHES):
+        start = time.perf_counter()
+        with fetch(url) as response:
+            response.raise_for_status()
+            _ = response.text
+        latencies.append((time.perf_counter() - start) * 1000)
+    return latencies
+
+
+def main() -> None:
+    """Runs both benchmarks against a local server and prints the results."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _InputHandler)
+    scheme = "http"
+    verify: Union[bool, str] = True
+    if len(sys.argv) == 3:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.load_cert_chain(certfile=sys.argv[1], keyfile=sys.argv[2])
+        server.socket = context.wrap_socket(server.socket, server_side=True)
+        scheme, verify = "https", sys.argv[1]
+    Thread(target=server.serve_forever, daemon=True).start()
+    url = "{scheme}://127.0.0.1:{port}/2022/day/1/input".format(
+        scheme=scheme, port=server.server_address[1]
+    )
+
+    try:
+        results = {
+            "requests.get": _time_fetches(partial(requests.get, verify=verify), url),
+            "shared session": _time_fetches(
+                partial(aoc_requests.get_session().get, verify=verify), url
+            ),
+        }
+    finally:
+        server.shutdown()
+
+    for name, latencies in results.items():
+        print(
+            "{name:>15}: mean {mean:.3f} ms, median {median:.3f} ms over {n} "
+            "fetches".format(
+                name=name,
+                mean=statistics.mean(latencies),
+                median=statistics.median(latencies),
+                n=len(latencies),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""Measures how long the `aoc` entry point takes to import, using `-X importtime`.
+
+Each run imports the CLI in a fresh interpreter, so nothing is already in
+`sys.modules`. The median import time is printed along with the modules that
+contribute the most to it. Run with `poetry run python -m misc.bench_startup`, or
+pass a budget in milliseconds to exit with an error code when it is exceeded:
+
+    poetry run python -m misc.bench_startup 80
+"""
+import statistics
+import subprocess  # noqa: S404
+import sys
+from typing import Optional
+
+RUNS = 10
+TOP = 10
+ENTRY_POINT = "advent_of_code.console"
+
+
+def _import_times() -> dict[str, tuple[int, int]]:
+    """Imports the entry point in a new interpreter.
+
+    Returns:
+        dict[str, tuple[int, int]]: The self and cumulative import time of the\
+             entry point and every module it imported, in microseconds.
+    """
+    completed = subprocess.run(  # noqa: S603
+        [sys.executable, "-X", "importtime", "-c", "import " + ENTRY_POINT],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # Lines look like "import time:  self [us] | cumulative | imported package",
+    #  where the package name is indented by its depth, and a module's imports are
+    #  listed just before it. Modules imported at interpreter start-up (ex. by site)
+    #  come first, so the lines are read backwards from the entry point.
+    times: dict[str, tuple[int, int]] = {}
+    entry_depth: Optional[int] = None
+    for line in reversed(completed.stderr.splitlines()):
+        fields = line.partition(":")[2].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        depth = len(name) - len(name.lstrip())
+        if entry_depth is None:
+            if name.strip() != ENTRY_POINT:
+                continue
+            entry_depth = depth
+        elif depth <= entry_depth:
+            break
+        times[name.strip()] = (int(fields[0]), int(fields[1]))
+    return times
+
+
+def main() -> None:
+    """Imports the entry point several times and prints the results."""
+    runs = [_import_times() for _ in range(RUNS)]
+    totals = [times[ENTRY_POINT][1] / 1000 for times in runs]
+    median_total = statistics.median(totals)
+    print(
+        "{entry_point}: median {median:.1f} ms, min {min:.1f} ms over {n} "
+        "runs".format(
+            entry_point=ENTRY_POINT,
+            median=median_total,
+            min=min(totals),
+            n=len(totals),
+        )
+    )
+
+    # Modules imported by the entry point, ranked by their median cumulative time
+    cumulative = {
+        module: statistics.median(times[module][1] for times in runs) / 1000
+        for module in runs[0]
+        if all(module in times for times in runs)
+    }
+    print("Slowest imports (cumulative):")
+    for module, duration in sorted(cumulative.items(), key=lambda m: -m[1])[:TOP]:
+        print("  {duration:8.1f} ms  {module}".format(duration=duration, module=module))
+
+    if len(sys.argv) == 2 and median_total > float(sys.argv[1]):
+        print("Import time is over the budget of {} ms".format(sys.argv[1]))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+"""Regenerates the manifest of solutions (src/advent_of_code/solutions.json).
+
+Run with `poetry run python -m misc.generate_registry` after adding a solution, or
+after adding parse(), part_1() or part_2() to an existing one.
+"""
+from advent_of_code import registry
+
+
+def main() -> None:
+    """Writes the manifest and prints how many solutions it lists."""
+    manifest = registry.write_manifest()
+    for year, days in manifest.items():
+        print("{year}: {count} solutions".format(year=year, count=len(days)))
+
+
+if __name__ == "__main__":
+    main()
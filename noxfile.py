@@ -50,6 +50,16 @@ def tests(session: Session) -> None:
     session.run("pytest", *args)
 
 
+@nox.session(python=python_versions)
+def benchmarks(session: Session) -> None:
+    """Run the scaling benchmarks, which are skipped by the test suite."""
+    session.run("poetry", "install", "--no-dev", external=True)
+    session.install("pytest", "pytest-mock", "mock")
+    session.run(
+        "pytest", "tests/benchmarks", *session.posargs, env={"AOC_BENCHMARKS": "1"}
+    )
+
+
 @session(python=python_versions)
 def safety(session: Session) -> None:
     """Scan dependencies for insecure packages."""
@@ -1,16 +1,157 @@
 """Gets input text for puzzle."""
-import requests
-from requests.exceptions import HTTPError, SSLError
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from os import getcwd, path
+from threading import Lock
+from time import monotonic, sleep
+from typing import Iterable, Iterator, Optional, TYPE_CHECKING
 
-from advent_of_code import console
+from advent_of_code import input_cache, input_sources, tracing
+
+if TYPE_CHECKING:
+    import requests
+
+# The requests package takes most of the CLI's start-up time, so it is only imported
+#  once a request is actually sent (see `get_session()` and `download_input()`)
+
+BASE_URL = "https://adventofcode.com"
+
+# Puzzles are released at midnight US Eastern Time
+RELEASE_TIMEZONE = timezone(timedelta(hours=-5))
+
+# Every request goes to the same host, so a single pool is enough. The pool is
+# sized so that concurrent fetches each get their own kept-alive connection.
+POOL_CONNECTIONS = 1
+POOL_MAXSIZE = 8
+
+# Seconds to wait for the website to accept a connection, and then for each read of
+#  the response, so that a stalled request fails instead of hanging forever
+REQUEST_TIMEOUT = (10.0, 30.0)
+
+
+class Cookie:
+    """Class to store path to cookie file. Can be accessed with getpath()."""
+
+    def __init__(self) -> None:
+        """Store cookie in current working directory under .conf/cookie/cookie."""
+        self.path = path.join(getcwd(), ".conf", "cookie", "cookie")
+
+    def getpath(self) -> str:
+        """Return path to cookie file."""
+        return self.path
+
+
+cookie = Cookie()
+
+_session: Optional["requests.Session"] = None
+_session_lock = Lock()
+
+
+def get_session() -> "requests.Session":
+    """Returns the shared session, creating it the first time it is needed.
+
+    Reusing one session keeps connections to the website alive between requests, so\
+         only the first request pays for the TCP and TLS handshakes.
+
+    Returns:
+        requests.Session: The session used for every request to the website.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=POOL_CONNECTIONS, pool_maxsize=POOL_MAXSIZE
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _session = session
+    return _session
+
+
+def get_cookie() -> str:
+    """Returns the saved cookie."""
+    try:
+        with open(cookie.getpath(), "r") as f:
+            return f.read()
+    except FileNotFoundError as exc:
+        raise FileNotFoundError(
+            "Error reading file '{file_path}'".format(file_path=cookie.getpath())
+        ) from exc
 
 
 def get_input(year: str, day: str) -> str:
+    """Returns the input from the active input source. By default, this is the\
+         cached input, which is downloaded from the Advent of Code website only if\
+             it is not already cached on disk.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of Challenge.
+
+    Returns:
+        str: The input text for the challenge.
+    """
+    with tracing.instrument("get_input", year=year, day=day):
+        return input_sources.source.read(year, day)
+
+
+def get_input_lines(year: str, day: str) -> Iterator[str]:
+    """Yields the input from the active input source one line at a time.
+
+    Unlike splitting the result of `get_input()`, the whole input is never held in\
+         memory when it comes from a file (including the input cache). The lines are\
+             read as they are used, so only the download (if any) and opening the\
+                 input are traced.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of Challenge.
+
+    Returns:
+        Iterator[str]: The lines of the input text, without line endings.
+    """
+    with tracing.instrument("get_input_lines", year=year, day=day):
+        return input_sources.source.read_lines(year, day)
+
+
+@dataclass(frozen=True)
+class Download:
+    """The response to a request for a puzzle input.
+
+    text (Optional[str]): The input text, or None if the server answered that the\
+         input has not changed since it was cached (304 Not Modified).
+    etag (Optional[str]): The ETag header, used to revalidate the input later.
+    last_modified (Optional[str]): The Last-Modified header, used to revalidate\
+         the input later.
+    """
+
+    text: Optional[str]
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+
+def download_input(
+    year: str,
+    day: str,
+    etag: Optional[str] = None,
+    last_modified: Optional[str] = None,
+) -> Download:
     """Submits a HTTPS request to the Advent of Code website, and returns the input.
 
+    If `etag` or `last_modified` is given, the request is conditional, and the\
+         website only sends the input if it changed since then. Responses are\
+             accepted gzip-compressed to reduce the bytes transferred.
+
     Args:
         year (str): Year of challenge.
         day (str): Day of Challenge.
+        etag (Optional[str]): ETag of the cached input. Defaults to None.
+        last_modified (Optional[str]): Last-Modified date of the cached input.\
+             Defaults to None.
 
     Raises:
         SSLError: This is raised when the certificate is not in the cacert.pem file. \
@@ -18,15 +159,30 @@ def get_input(year: str, day: str) -> str:
         HTTPError: This is commonly raised when the cookie is incorrect or no longer valid.
 
     Returns:
-        str: The input text for the challenge.
+        Download: The input text (or None if it was not modified) and its validators.
     """
-    url = "https://adventofcode.com/" + str(year) + "/day/" + str(day) + "/input"
-    headers = {"Cookie": "session=" + console.get_cookie()}
+    from requests.exceptions import HTTPError, SSLError
+
+    url = BASE_URL + "/" + str(year).strip() + "/day/" + str(day).strip() + "/input"
+    headers = {
+        "Cookie": "session=" + get_cookie(),
+        "Accept-Encoding": "gzip",
+    }
+    if etag is not None:
+        headers["If-None-Match"] = etag
+    if last_modified is not None:
+        headers["If-Modified-Since"] = last_modified
 
     try:
-        with requests.get(url, headers=headers) as response:
+        with tracing.instrument("download", year=year, day=day), get_session().get(
+            url, headers=headers, timeout=REQUEST_TIMEOUT
+        ) as response:
             response.raise_for_status()
-            return response.text.rstrip()
+            return Download(
+                text=None if response.status_code == 304 else response.text.rstrip(),
+                etag=response.headers.get("ETag", etag),
+                last_modified=response.headers.get("Last-Modified", last_modified),
+            )
     except SSLError as exc:
         raise SSLError(
             "Unable to access website due to SSL Error. Please refer to the "
@@ -37,3 +193,147 @@ def get_input(year: str, day: str) -> str:
             "Advent of Code returned an error code. Please try updating your "
             "cookie with 'aoc set-cookie'"
         ) from exc
+
+
+def fetch_input(year: str, day: str, revalidate: bool = False) -> str:
+    """Returns the cached input, downloading and caching it first if required.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of Challenge.
+        revalidate (bool): Ask the website whether the cached input is still\
+             current, instead of trusting it. The input is only downloaded again if\
+                 it changed. Defaults to False.
+
+    Returns:
+        str: The input text for the challenge.
+    """
+    cached_input = input_cache.cache.get(year, day)
+    if cached_input is not None and not revalidate:
+        return cached_input
+
+    validators = (
+        input_cache.cache.get_validators(year, day) if cached_input is not None else {}
+    )
+    download = download_input(year, day, **validators)
+    if download.text is None:
+        # The website only answers 304 Not Modified to the validators of the cached
+        #  input, so the cached input is still current
+        return cached_input or ""
+
+    input_cache.cache.put(
+        year,
+        day,
+        download.text,
+        etag=download.etag,
+        last_modified=download.last_modified,
+    )
+    return download.text
+
+
+def available_days(year: str, now: Optional[datetime] = None) -> list[str]:
+    """Returns the days of the year whose puzzles have been released.
+
+    Puzzles are released at midnight US Eastern Time (UTC-5) from December 1st to\
+         December 25th.
+
+    Args:
+        year (str): Year of challenge.
+        now (Optional[datetime]): The current time. Defaults to the system clock.
+
+    Returns:
+        list[str]: The released days, in order.
+    """
+    release_time = (now or datetime.now(timezone.utc)).astimezone(RELEASE_TIMEZONE)
+    if int(year) < release_time.year:
+        last_day = 25
+    elif int(year) == release_time.year and release_time.month == 12:
+        last_day = min(release_time.day, 25)
+    else:
+        last_day = 0
+    return [str(day) for day in range(1, last_day + 1)]
+
+
+class _RateLimiter:
+    """Spaces out calls to `wait()` so that they are at least `interval` seconds\
+         apart, no matter which thread makes them."""
+
+    def __init__(self, interval: float) -> None:
+        """Initializes the limiter so that the first call does not wait."""
+        self._interval = interval
+        self._next_start = 0.0
+        self._lock = Lock()
+
+    def wait(self) -> None:
+        """Blocks until the caller is allowed to start its request."""
+        with self._lock:
+            start = max(self._next_start, monotonic())
+            self._next_start = start + self._interval
+        sleep(max(0.0, start - monotonic()))
+
+
+def prefetch(
+    year: str,
+    days: Optional[Iterable[str]] = None,
+    max_workers: int = 4,
+    min_interval: float = 0.5,
+) -> dict[str, str]:
+    """Downloads every input of the year that is not cached yet, several at a time.
+
+    Downloads run on a bounded thread pool, and a new request is never started less\
+         than `min_interval` seconds after the previous one to be polite to the\
+         website. Inputs are saved to the input cache as they arrive.
+
+    Args:
+        year (str): Year of challenge.
+        days (Optional[Iterable[str]]): The days to download. Defaults to all\
+             released days of the year.
+        max_workers (int): The maximum number of downloads in flight. Defaults to 4.
+        min_interval (float): The minimum time in seconds between the start of two\
+             requests. Defaults to 0.5.
+
+    Returns:
+        dict[str, str]: The outcome for each day, which is either "cached",\
+             "downloaded", or the error message if the download failed.
+    """
+    days = list(days) if days is not None else available_days(year)
+    outcome = {}
+    missing = []
+    for day in days:
+        if input_cache.cache.get(year, day) is not None:
+            outcome[day] = "cached"
+        else:
+            missing.append(day)
+
+    from concurrent.futures import as_completed, ThreadPoolExecutor
+
+    from requests.exceptions import RequestException
+
+    limiter = _RateLimiter(min_interval)
+
+    def _polite_download(day: str) -> Download:
+        limiter.wait()
+        return download_input(year, day)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(_polite_download, day): day for day in missing}
+        for future in as_completed(futures):
+            day = futures[future]
+            try:
+                # Only this thread writes to the cache, so the index is never
+                #  updated by two downloads at once
+                download = future.result()
+                input_cache.cache.put(
+                    year,
+                    day,
+                    download.text or "",
+                    etag=download.etag,
+                    last_modified=download.last_modified,
+                )
+                outcome[day] = "downloaded"
+            except RequestException as exc:
+                # Any failure (ex. a refused connection or a timeout) only fails
+                #  that day
+                outcome[day] = str(exc)
+
+    return {day: outcome[day] for day in days}
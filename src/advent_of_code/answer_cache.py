@@ -0,0 +1,271 @@
+"""Stores the answers to puzzles on disk, so they are only computed again when the\
+     input or the solution changes."""
+import ast
+from contextlib import contextmanager
+import glob
+import hashlib
+from importlib.util import find_spec
+import json
+from os import getcwd, makedirs, path, remove, rmdir, utime
+import time
+from typing import Iterator, Optional
+
+from advent_of_code.input_cache import atomic_write, locked
+
+# Answers are small, so this is only a ceiling on the number of files in the cache
+DEFAULT_MAX_ENTRIES = 1000
+
+PACKAGE = "advent_of_code"
+
+# Folder holding the modules of the package, which solutions may import
+PACKAGE_DIR = path.dirname(path.abspath(__file__))
+
+
+def digest_text(text: str) -> str:
+    """Returns the SHA-256 digest of an input text."""
+    return hashlib.sha256(text.encode()).hexdigest()
+
+
+def digest_module(module_name: str) -> Optional[str]:
+    """Returns the SHA-256 digest of a module's source file, and of the source files\
+         of every module of the package it imports (directly or not), without\
+             importing any of them.
+
+    Args:
+        module_name (str): Full name of the module (ex.\
+             `advent_of_code.year_2022.day_1`).
+
+    Returns:
+        Optional[str]: The digest, or None if the source file cannot be found.
+    """
+    try:
+        spec = find_spec(module_name)
+    except (ImportError, ValueError):
+        return None
+    origin = getattr(spec, "origin", None)
+    if not isinstance(origin, str) or not path.isfile(origin):
+        return None
+
+    digest = hashlib.sha256()
+    pending = [origin]
+    seen = {origin}
+    while pending:
+        with open(pending.pop(), "rb") as f:
+            source = f.read()
+        digest.update(source)
+        for name in _imported_modules(source):
+            dependency = _package_source(name)
+            if dependency is not None and dependency not in seen:
+                seen.add(dependency)
+                pending.append(dependency)
+    return digest.hexdigest()
+
+
+def _imported_modules(source: bytes) -> Iterator[str]:
+    """Yields the names of the modules imported anywhere in the source, along with\
+         the modules each name imported from a module could be (ex.\
+             `advent_of_code.parsing` for `from advent_of_code import parsing`)."""
+    for node in ast.walk(ast.parse(source)):
+        if isinstance(node, ast.Import):
+            yield from (alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            yield node.module
+            yield from (node.module + "." + alias.name for alias in node.names)
+
+
+def _package_source(module_name: str) -> Optional[str]:
+    """Returns the source file of a module of the package, or None for modules of\
+         other packages and names that are not modules."""
+    names = module_name.split(".")
+    if names[0] != PACKAGE:
+        return None
+    base = path.join(PACKAGE_DIR, *names[1:])
+    for candidate in (base + ".py", path.join(base, "__init__.py")):
+        if path.isfile(candidate):
+            return candidate
+    return None
+
+
+class AnswerCache:
+    """Store for the answer to each part of each puzzle.
+
+    An answer is saved along with the digests of the input and of the solution's\
+         source code it was computed from, and is only returned for the same input\
+             and code. Each answer has its own file (ex. `2022/1/2.json`). When there\
+                 are more than `max_entries` answers, the least recently used ones\
+                     are removed.
+
+    The cache may be used by several processes at once. Reading an answer never\
+         writes a file: it only sets the modification time of the answer's file,\
+             which records when it was last used. Answers are saved and removed\
+                 while holding a lock on `index.lock`.
+    """
+
+    def __init__(
+        self, root: Optional[str] = None, max_entries: int = DEFAULT_MAX_ENTRIES
+    ) -> None:
+        """Store answers in the current working directory under .conf/answers.
+
+        Args:
+            root (Optional[str]): Folder holding the cache. Defaults to\
+                 .conf/answers in the current working directory.
+            max_entries (int): Number of answers kept before the least recently used\
+                 ones are evicted. Defaults to 1000.
+        """
+        self.path = (
+            root if root is not None else path.join(getcwd(), ".conf", "answers")
+        )
+        self.max_entries = max_entries
+
+    def getpath(self) -> str:
+        """Return path to cache folder."""
+        return self.path
+
+    @staticmethod
+    def key(year: str, day: str, part: str) -> str:
+        """Returns the key for a year, day and part (ex. `2022/1/2`)."""
+        return "{year}/{day}/{part}".format(
+            year=int(year), day=int(day), part=int(part)
+        )
+
+    def get(
+        self, year: str, day: str, part: str, input_sha256: str, code_sha256: str
+    ) -> Optional[object]:
+        """Returns the saved answer, or None if there is no answer for this input\
+             and code.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+            part (str): Part of challenge.
+            input_sha256 (str): Digest of the input (see `digest_text`).
+            code_sha256 (str): Digest of the solution's code (see `digest_module`).
+
+        Returns:
+            Optional[object]: The saved answer.
+        """
+        entry_path = self._entry_path(self.key(year, day, part))
+        try:
+            with open(entry_path, "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if entry["input_sha256"] != input_sha256 or entry["code_sha256"] != code_sha256:
+            return None
+
+        self._touch(entry_path)
+        return entry["answer"]
+
+    def put(
+        self,
+        year: str,
+        day: str,
+        part: str,
+        input_sha256: str,
+        code_sha256: str,
+        answer: object,
+    ) -> None:
+        """Saves the answer, replacing any answer computed from another input or code.
+
+        Answers that would not read back the same from JSON (ex. tuples) are not\
+             saved.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+            part (str): Part of challenge.
+            input_sha256 (str): Digest of the input the answer was computed from.
+            code_sha256 (str): Digest of the code the answer was computed with.
+            answer (object): The answer.
+        """
+        try:
+            if answer is None or json.loads(json.dumps(answer)) != answer:
+                return
+        except (TypeError, ValueError):
+            return
+
+        entry = {
+            "input_sha256": input_sha256,
+            "code_sha256": code_sha256,
+            "answer": answer,
+        }
+        entry_path = self._entry_path(self.key(year, day, part))
+        with self._lock():
+            makedirs(path.dirname(entry_path), exist_ok=True)
+            atomic_write(entry_path, json.dumps(entry).encode())
+            self._touch(entry_path)
+            self._evict(keep=entry_path)
+
+    def invalidate(self, year: str, day: str) -> None:
+        """Removes the saved answers to every part of the puzzle.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+        """
+        pattern = path.join(self.path, str(int(year)), str(int(day)), "*.json")
+        with self._lock():
+            self._remove(glob.glob(pattern))
+
+    def clear(self) -> None:
+        """Removes every saved answer."""
+        with self._lock():
+            self._remove(self._entry_paths())
+
+    def _evict(self, keep: str) -> None:
+        """Removes the least recently used answers (other than `keep`) until there\
+             are at most `max_entries`."""
+        last_used = {}
+        for entry_path in self._entry_paths():
+            try:
+                last_used[entry_path] = path.getmtime(entry_path)
+            except FileNotFoundError:
+                pass
+        excess = len(last_used) - self.max_entries
+        if excess <= 0:
+            return
+        candidates = sorted(
+            (p for p in last_used if p != keep), key=last_used.__getitem__
+        )
+        self._remove(candidates[:excess])
+
+    @staticmethod
+    def _remove(entry_paths: list[str]) -> None:
+        """Deletes the answers' files, and the folders left empty."""
+        for entry_path in entry_paths:
+            try:
+                remove(entry_path)
+            except FileNotFoundError:
+                pass
+            try:
+                rmdir(path.dirname(entry_path))
+            except OSError:
+                # Other parts of the day are still saved
+                pass
+
+    @staticmethod
+    def _touch(entry_path: str) -> None:
+        """Records that the answer was just used."""
+        now = time.time_ns()
+        try:
+            # Set to the nanosecond, as the current time the file system would use
+            #  by default may not tell apart uses a few milliseconds apart
+            utime(entry_path, ns=(now, now))
+        except FileNotFoundError:
+            pass
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Holds the lock on the cache while changing it."""
+        makedirs(self.path, exist_ok=True)
+        with locked(path.join(self.path, "index.lock")):
+            yield
+
+    def _entry_path(self, key: str) -> str:
+        return path.join(self.path, *key.split("/")) + ".json"
+
+    def _entry_paths(self) -> list[str]:
+        return glob.glob(path.join(self.path, "*", "*", "*.json"))
+
+
+cache = AnswerCache()
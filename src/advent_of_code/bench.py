@@ -0,0 +1,322 @@
+"""Times solutions repeatedly and compares the timings against a saved baseline."""
+from functools import partial
+import json
+import math
+from os import path
+import statistics
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Optional
+
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import generators, registry
+
+
+def summarize(times: list[float]) -> dict:
+    """Returns the minimum, median, 95th percentile and mean of the timings.
+
+    Args:
+        times (list[float]): Timings in seconds.
+
+    Raises:
+        ValueError: Raised when there are no timings.
+
+    Returns:
+        dict: The summary statistics, along with the timings themselves.
+    """
+    if len(times) == 0:
+        raise ValueError("There are no timings to summarize")
+    ordered = sorted(times)
+    # Nearest-rank percentile, so the value is always one of the measurements
+    p95_index = max(math.ceil(0.95 * len(ordered)) - 1, 0)
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[p95_index],
+        "mean": statistics.mean(ordered),
+        "times": times,
+    }
+
+
+def time_function(function: Callable[[], object], warmup: int, repeats: int) -> dict:
+    """Calls the function `warmup` times without timing it, then times `repeats` calls.
+
+    Args:
+        function (Callable[[], object]): The function to time.
+        warmup (int): Number of untimed calls.
+        repeats (int): Number of timed calls.
+
+    Returns:
+        dict: The summary of the timed calls (see `summarize`).
+    """
+    for _ in range(warmup):
+        function()
+
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+    return summarize(times)
+
+
+def benchmark_day(
+    year: str,
+    day: str,
+    warmup: int = 1,
+    repeats: int = 10,
+    parts: Optional[list[str]] = None,
+) -> dict:
+    """Times each part of the solution for a challenge in the current process.
+
+    The input is read once from the active input source (for example, the input\
+         cache or a local file) and then served from memory, so only the solution\
+             itself is timed. Parsing the input is timed on its own, and each part is\
+                 timed on the parsed input. Solutions that do not parse their input\
+                     separately parse it in each part.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+        warmup (int): Number of untimed runs before timing starts. Defaults to 1.
+        repeats (int): Number of timed runs. Defaults to 10.
+        parts (Optional[list[str]]): The parts to time. Defaults to every part.
+
+    Returns:
+        dict: The year, day, run counts and the timing summary of each benchmark\
+             target, named `parse` and `part_<part>` (see `summarize`).
+    """
+    solution = registry.require(year, day)
+    text = aoc_requests.get_input(year, day)
+    parsed = solution.parse(text)
+
+    results = {}
+    if solution.parser is not None:
+        results["parse"] = time_function(partial(solution.parse, text), warmup, repeats)
+    for part in parts or sorted(solution.parts, key=int):
+        results["part_{part}".format(part=part)] = time_function(
+            partial(solution.solve, part, parsed), warmup, repeats
+        )
+
+    return {
+        "year": year,
+        "day": day,
+        "warmup": warmup,
+        "repeats": repeats,
+        "results": results,
+    }
+
+
+def growth_exponent(sizes: list[float], values: list[float]) -> float:
+    """Returns the exponent `k` for which `values` grow most like `sizes ** k`.
+
+    The exponent is the slope of the least squares line through the logarithms of\
+         the sizes and values, so 1 is linear growth, 2 quadratic and so on.
+
+    Args:
+        sizes (list[float]): The sizes measured, at least two of them different.
+        values (list[float]): The value measured at each size, such as a time.
+
+    Raises:
+        ValueError: Raised when a size or value is not positive, or all the sizes\
+             are the same.
+
+    Returns:
+        float: The growth exponent.
+    """
+    if min(sizes + values) <= 0:
+        raise ValueError("Growth can only be fitted to positive sizes and values")
+    try:
+        fit = statistics.linear_regression(
+            [math.log(size) for size in sizes], [math.log(value) for value in values]
+        )
+    except statistics.StatisticsError as exc:
+        raise ValueError("Growth can only be fitted to different sizes") from exc
+    return fit.slope
+
+
+def _peak_memory(function: Callable[[], object]) -> int:
+    """Calls the function and returns the peak memory it allocated in bytes."""
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+
+def _solve_text(solution: registry.Solution, part: str, text: str) -> object:
+    """Parses the input and returns the answer to the part."""
+    return solution.solve(part, solution.parse(text))
+
+
+def measure_scaling(
+    year: str,
+    day: str,
+    part: str,
+    scales: list[int],
+    repeats: int = 3,
+    seed: int = generators.SEED,
+) -> dict:
+    """Times one part of a solution on generated inputs of each scale, and fits how\
+         its time and memory grow with the scale.
+
+    At each scale, the time to parse the input and solve the part is the fastest\
+         of `repeats` runs, and the peak memory is traced in one more run (as\
+             tracing slows the solution down). Generating the input is not timed.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+        part (str): Part of challenge.
+        scales (list[int]): Scales of the inputs (see `generators.generate`).
+        repeats (int): Number of timed runs at each scale. Defaults to 3.
+        seed (int): Seed of the generated inputs. Defaults to `generators.SEED`.
+
+    Returns:
+        dict: The year, day and part, the `scale`, input `bytes`, `seconds` and\
+             `peak_bytes` at each scale (`points`), and the `time_exponent` and\
+                 `memory_exponent` of their growth (see `growth_exponent`).
+    """
+    solution = registry.require(year, day)
+    points = []
+    for scale in scales:
+        text = generators.generate(year, day, scale, seed=seed)
+        function = partial(_solve_text, solution, part, text)
+        timing = time_function(function, warmup=0, repeats=repeats)
+        points.append(
+            {
+                "scale": scale,
+                "bytes": len(text),
+                "seconds": timing["min"],
+                "peak_bytes": _peak_memory(function),
+            }
+        )
+
+    sizes = [float(scale) for scale in scales]
+    return {
+        "year": year,
+        "day": day,
+        "part": part,
+        "seed": seed,
+        "repeats": repeats,
+        "points": points,
+        "time_exponent": growth_exponent(sizes, [point["seconds"] for point in points]),
+        "memory_exponent": growth_exponent(
+            sizes, [float(point["peak_bytes"]) for point in points]
+        ),
+    }
+
+
+def measure_speedup(
+    year: str,
+    day: str,
+    part: str,
+    scale: int,
+    workers: list[int],
+    repeats: int = 3,
+    seed: int = generators.SEED,
+) -> dict:
+    """Times the `solve_chunked` function of a solution (see `map_reduce.run`) on a\
+         generated input file with each number of workers, and how much faster than\
+             with one worker it is.
+
+    Each time is the fastest of `repeats` runs, including starting the processes\
+         and splitting the file between them. The input is written to a temporary\
+             file one line at a time, so it is never held in memory here, and\
+                 writing it is not timed.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+        part (str): Part of challenge.
+        scale (int): Scale of the input (see `generators.generate`).
+        workers (list[int]): Numbers of processes to time, starting with 1.
+        repeats (int): Number of timed runs with each number of workers. Defaults\
+             to 3.
+        seed (int): Seed of the generated input. Defaults to `generators.SEED`.
+
+    Returns:
+        dict: The year, day, part, scale and input `bytes`, and the `workers`,\
+             `seconds` and `speedup` of each run (`points`).
+    """
+    solve_chunked = registry.require(year, day).load().solve_chunked
+    points: list[dict] = []
+    with tempfile.TemporaryDirectory() as folder:
+        file_path = path.join(folder, "input.txt")
+        with open(file_path, "w") as f:
+            for line in generators.generate_lines(year, day, scale, seed=seed):
+                f.write(line + "\n")
+
+        for count in workers:
+            function = partial(solve_chunked, file_path, int(part), count)
+            seconds = time_function(function, warmup=0, repeats=repeats)["min"]
+            points.append(
+                {
+                    "workers": count,
+                    "seconds": seconds,
+                    "speedup": (points[0]["seconds"] if points else seconds) / seconds,
+                }
+            )
+        size = path.getsize(file_path)
+
+    return {
+        "year": year,
+        "day": day,
+        "part": part,
+        "scale": scale,
+        "bytes": size,
+        "seed": seed,
+        "repeats": repeats,
+        "points": points,
+    }
+
+
+def compare_to_baseline(report: dict, baseline: dict, tolerance: float) -> list[str]:
+    """Returns a description of each target whose median time regressed.
+
+    Args:
+        report (dict): The report from `benchmark_day`.
+        baseline (dict): A previous report for the same challenge.
+        tolerance (float): How much slower than the baseline the median time may\
+             be before it counts as a regression (ex. 0.1 for 10%).
+
+    Returns:
+        list[str]: One message for each regression. Empty if there are none.
+    """
+    regressions = []
+    for target, result in report["results"].items():
+        previous = baseline.get("results", {}).get(target)
+        if previous is None:
+            continue
+        if result["median"] > previous["median"] * (1 + tolerance):
+            # A baseline too fast for the timer to measure is infinitely faster
+            change = (
+                result["median"] / previous["median"] - 1
+                if previous["median"] > 0
+                else math.inf
+            )
+            regressions.append(
+                "{target}: median {now:.6f}s is {change:.1%} slower than the "
+                "baseline's {then:.6f}s".format(
+                    target=target,
+                    now=result["median"],
+                    then=previous["median"],
+                    change=change,
+                )
+            )
+    return regressions
+
+
+def save_report(report: dict, file_path: str) -> None:
+    """Writes the report to a JSON file."""
+    with open(file_path, "w") as f:
+        json.dump(report, f, indent=2)
+
+
+def load_report(file_path: str) -> dict:
+    """Reads a report from a JSON file."""
+    with open(file_path, "r") as f:
+        return json.load(f)
@@ -1,23 +1,22 @@
 """Defines CLI interface."""
-from importlib import import_module
+from contextlib import contextmanager
+from functools import partial
+import json
 from os import getcwd, makedirs, path
+import time
+from typing import Callable, Iterable, Iterator, Optional
 
 import click
 
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import answer_cache, input_sources, registry, tracing
 
-class Cookie:
-    """Class to store path to cookie file. Can be accessed with getpath()."""
 
-    def __init__(self) -> None:
-        """Store cookie in current working directory under .conf/cookie/cookie."""
-        self.path = path.join(getcwd(), ".conf", "cookie", "cookie")
-
-    def getpath(self) -> str:
-        """Return path to cookie file."""
-        return self.path
-
-
-cookie = Cookie()
+# Formats the answers of get-solution can be printed in
+TEXT = "text"
+JSON = "json"
+NDJSON = "ndjson"
+OUTPUT_FORMATS = [TEXT, JSON, NDJSON]
 
 
 @click.group()
@@ -38,17 +37,156 @@ def cli() -> None:
     default="",
     help="Day of Advent of Code",
 )
-def get_solution_prereq(year: str = "", day: str = "") -> None:
+@click.option(
+    "--part",
+    "-p",
+    type=click.Choice(["1", "2"]),
+    default=None,
+    help="Only solve this part. Defaults to both parts",
+)
+@click.option(
+    "--refresh",
+    is_flag=True,
+    default=False,
+    help="Check that the cached input is current, downloading it again if it changed",
+)
+@click.option(
+    "--source",
+    default="http",
+    envvar="AOC_INPUT_SOURCE",
+    show_default=True,
+    help="Where to read the input from: 'http', 'file:<path>', 'dir:<path>' or "
+    "'stdin'. Can also be set with the AOC_INPUT_SOURCE environment variable",
+)
+@click.option(
+    "--input-file",
+    "-i",
+    default=None,
+    help="Read the input from this file ('-' for standard input) instead of the "
+    "website. No cookie is needed. Takes precedence over --source",
+)
+@click.option(
+    "--profile",
+    is_flag=True,
+    default=False,
+    help="Run each part under cProfile and write a .pstats file for it",
+)
+@click.option(
+    "--trace-memory",
+    is_flag=True,
+    default=False,
+    help="Run each part under tracemalloc and print the top allocation sites",
+)
+@click.option(
+    "--profile-dir",
+    default=None,
+    help="Folder to write profiles to. Defaults to .conf/profiles",
+)
+@click.option(
+    "--cache/--no-cache",
+    default=True,
+    show_default=True,
+    help="Reuse the answers from a previous run with the same input and code",
+)
+@click.option(
+    "--server",
+    default=None,
+    envvar="AOC_SERVER",
+    help="Send the puzzle to a server started with 'aoc serve' at this socket path "
+    "or <host>:<port>, instead of solving it in this process. Can also be set with "
+    "the AOC_SERVER environment variable",
+)
+@click.option(
+    "--timeout",
+    type=click.FloatRange(min=0, min_open=True),
+    default=None,
+    help="Run each part in its own process, stopping it after this many seconds",
+)
+@click.option(
+    "--max-memory",
+    type=click.IntRange(min=1),
+    default=None,
+    help="Run each part in its own process, limited to this many MiB of memory",
+)
+@click.option(
+    "--format",
+    "output_format",
+    type=click.Choice(OUTPUT_FORMATS),
+    default=TEXT,
+    show_default=True,
+    help="Print the answers as text, as a JSON list with a record per part, or as "
+    "one JSON record per line. Records include the time spent fetching the input "
+    "and solving each part, and the peak memory used",
+)
+@click.option(
+    "--trace",
+    default=None,
+    help="Write the time spent downloading, reading and parsing the input, and "
+    "solving each part, to this file in the Chrome trace event format",
+)
+def get_solution_prereq(
+    year: str = "",
+    day: str = "",
+    part: Optional[str] = None,
+    refresh: bool = False,
+    source: str = "http",
+    input_file: Optional[str] = None,
+    profile: bool = False,
+    trace_memory: bool = False,
+    profile_dir: Optional[str] = None,
+    cache: bool = True,
+    server: Optional[str] = None,
+    timeout: Optional[float] = None,
+    max_memory: Optional[int] = None,
+    output_format: str = TEXT,
+    trace: Optional[str] = None,
+) -> None:
     """Verifies both year and day is entered before passing them to get_solution.
 
     Args:
         year (str): Year of challenge. Defaults to empty string.
         day (str): Day of challenge. Defaults to empty string.
+        part (Optional[str]): Only solve this part. Defaults to both parts.
+        refresh (bool): Revalidate any cached input for the challenge. Defaults to\
+             False.
+        source (str): Description of the input source (see\
+             `input_sources.from_spec`). Defaults to "http".
+        input_file (Optional[str]): Path of a file to read the input from, or "-"\
+             for standard input. Defaults to None.
+        profile (bool): Profile the solution with cProfile. Defaults to False.
+        trace_memory (bool): Trace the solution's memory allocations. Defaults to\
+             False.
+        profile_dir (Optional[str]): Folder to write profiles to. Defaults to\
+             .conf/profiles.
+        cache (bool): Reuse saved answers. Defaults to True.
+        server (Optional[str]): Address of a running solver server to send the\
+             puzzle to. Defaults to None.
+        timeout (Optional[float]): Seconds each part may run for. Defaults to no\
+             limit.
+        max_memory (Optional[int]): MiB of memory each part may use. Defaults to\
+             no limit.
+        output_format (str): "text", "json" or "ndjson". Defaults to "text".
+        trace (Optional[str]): Path of a file to write a Chrome trace to. Defaults\
+             to None.
 
     Raises:
         ValueError: Raises an error if non-numeric characters are entered.
     """
-    if not path.exists(cookie.getpath()):
+    _check_solve_options(
+        profile or trace_memory,
+        timeout is not None or max_memory is not None or output_format != TEXT,
+        server,
+        trace is not None,
+    )
+    input_sources.source = _input_source(source, input_file)
+
+    # The cookie is only needed when inputs are downloaded from the website, which
+    #  the server does itself
+    if (
+        server is None
+        and isinstance(input_sources.source, input_sources.HttpSource)
+        and not path.exists(aoc_requests.cookie.getpath())
+    ):
         click.secho(
             "No cookie was found, please use the 'aoc set-cookie' option first",
             fg="red",
@@ -70,39 +208,893 @@ def get_solution_prereq(year: str = "", day: str = "") -> None:
             "Please enter a number for year and day, no characters"
         ) from exc
 
-    get_solution(year=year, day=day)
+    if server is not None:
+        solve_on_server(server, year=year, day=day, part=part, input_file=input_file)
+        return
+
+    with _tracing(trace):
+        get_solution(
+            year=year,
+            day=day,
+            part=part,
+            refresh=refresh,
+            profile=profile,
+            trace_memory=trace_memory,
+            profile_dir=profile_dir,
+            cache=cache,
+            timeout=timeout,
+            max_memory=max_memory,
+            output_format=output_format,
+        )
 
 
-def get_solution(year: str, day: str) -> None:
+@contextmanager
+def _tracing(trace: Optional[str]) -> Iterator[None]:
+    """Records spans while in the `with` block and writes them to `trace`, if it is\
+         given (see `tracing.Tracer`)."""
+    if trace is None:
+        yield
+        return
+    tracing.tracer = tracing.Tracer()
+    try:
+        with tracing.instrument("get-solution"):
+            yield
+    finally:
+        tracer, tracing.tracer = tracing.tracer, None
+        tracer.write(trace)
+        # Standard output may hold records, so it is kept parseable
+        click.secho("Trace written to " + trace, fg="green", err=True)
+
+
+def _check_solve_options(
+    profiling: bool, separate_parts: bool, server: Optional[str], traced: bool
+) -> None:
+    """Checks that the options given to get-solution can be used together.
+
+    Profiling runs each part in this process. Limits and records need each\
+         part to run on its own, which a server does not do. Spans are only traced\
+             in this process.
+
+    Args:
+        profiling (bool): Whether --profile or --trace-memory was given.
+        separate_parts (bool): Whether --timeout, --max-memory or --format was given.
+        server (Optional[str]): The --server option.
+        traced (bool): Whether --trace was given.
+
+    Raises:
+        UsageError: Raised when the options cannot be used together.
+    """
+    if profiling and separate_parts:
+        raise click.UsageError(
+            "--profile and --trace-memory cannot be used with --timeout, "
+            "--max-memory or --format"
+        )
+    if server is not None and (profiling or separate_parts or traced):
+        raise click.UsageError(
+            "--server cannot be used with --profile, --trace-memory, --trace, "
+            "--timeout, --max-memory or --format"
+        )
+
+
+def _input_source(
+    source: str, input_file: Optional[str]
+) -> "input_sources.InputSource":
+    """Returns the source for `--input-file` if it was given, or else `--source`."""
+    if input_file is None:
+        return input_sources.from_spec(source)
+    if input_file.strip() == "-":
+        return input_sources.StdinSource()
+    return input_sources.FileSource(input_file)
+
+
+def get_solution(
+    year: str,
+    day: str,
+    part: Optional[str] = None,
+    refresh: bool = False,
+    profile: bool = False,
+    trace_memory: bool = False,
+    profile_dir: Optional[str] = None,
+    cache: bool = True,
+    timeout: Optional[float] = None,
+    max_memory: Optional[int] = None,
+    output_format: str = TEXT,
+) -> None:
     """Runs the appropriate function for the challenge and prints the results.
 
     Args:
         year (str): The year of the challenge.
         day (str): The day of the challenge.
+        part (Optional[str]): Only solve this part, so the work for the other part\
+             is skipped. Defaults to both parts.
+        refresh (bool): Check with the website that the cached input is still\
+             current before running, downloading it again only if it changed.\
+                 Defaults to False.
+        profile (bool): Run each part under cProfile and write its statistics to\
+             `<profile_dir>/year_<year>_day_<day>_part_<part>.pstats`. Defaults to\
+                 False.
+        trace_memory (bool): Run each part under tracemalloc, print the top\
+             allocation sites and write them to\
+                 `<profile_dir>/year_<year>_day_<day>_part_<part>_memory.txt`.\
+                     Defaults to False.
+        profile_dir (Optional[str]): Folder to write profiles to. Defaults to\
+             .conf/profiles.
+        cache (bool): Print the saved answers instead of running the solution if\
+             neither the input nor the solution's code changed since they were\
+                 saved. Always False when profiling. Defaults to True.
+        timeout (Optional[float]): Run each part in its own process (see\
+             `sandbox.run_part`), stopping it after this many seconds. Defaults to\
+                 no limit.
+        max_memory (Optional[int]): Run each part in its own process, limited to\
+             this many MiB of memory. Exits with code 1 if a part runs out of\
+                 time or memory, or fails. Defaults to no limit.
+        output_format (str): "text", or "json" / "ndjson" to print a record for\
+             each part (see `_solve_parts`). Defaults to "text".
+    """
+    solution = registry.get(year, day)
+    if solution is None:
+        # Keep standard output parseable when printing records
+        click.secho(
+            "Sorry, there's no answer for that day yet :(",
+            fg="red",
+            err=output_format != TEXT,
+        )
+        return
+    parts = sorted(solution.parts, key=int) if part is None else [part]
+    # Look up the functions before any download, so a missing part fails early
+    functions = [solution.part(p) for p in parts]
+    if refresh and isinstance(input_sources.source, input_sources.HttpSource):
+        aoc_requests.fetch_input(year, day, revalidate=True)
+
+    if output_format != TEXT or timeout is not None or max_memory is not None:
+        _solve_separately(solution, parts, cache, output_format, timeout, max_memory)
+        return
+
+    if not profile and not trace_memory:
+        solutions = _solve_in_process(solution, parts, cache)
+    else:
+        solutions = tuple(
+            _profile_solution(
+                function,
+                name="year_{year}_day_{day}_part_{part}".format(
+                    year=year.strip(), day=day.strip(), part=p.strip()
+                ),
+                profile=profile,
+                trace_memory=trace_memory,
+                profile_dir=profile_dir,
+            )
+            for p, function in zip(parts, functions, strict=True)
+        )
+    _print_solutions(year, day, parts, solutions)
+
+
+def solve_on_server(
+    server: str,
+    year: str,
+    day: str,
+    part: Optional[str] = None,
+    input_file: Optional[str] = None,
+) -> None:
+    """Sends the puzzle to a running solver server and prints its answers.
+
+    Args:
+        server (str): The server's socket path or `<host>:<port>`.
+        year (str): The year of the challenge.
+        day (str): The day of the challenge.
+        part (Optional[str]): Only solve this part. Defaults to both parts.
+        input_file (Optional[str]): Path of a file to read the input from, or "-"\
+             for standard input. Defaults to the server's input source.
     """
+    # Imported here to keep the start-up of the other commands fast
+    from advent_of_code import server as solver_server
+
+    request = {"year": year.strip(), "day": day.strip(), "part": part}
+    if input_file is not None and input_file.strip() == "-":
+        request["input"] = input_sources.StdinSource().read(year, day)
+    elif input_file is not None:
+        # The server may be running in another directory
+        request["input_file"] = path.abspath(input_file)
+
     try:
-        module = import_module(
-            name=".year_{year}.day_{day}".format(year=year.strip(), day=day.strip()),
-            package="advent_of_code",
+        response = solver_server.send_request(
+            solver_server.parse_address(server), request
+        )
+    except OSError as exc:
+        click.secho(
+            "Could not reach the server at '{server}', please start it with "
+            "'aoc serve' first ({error})".format(server=server, error=exc),
+            fg="red",
+        )
+        return
+    if "error" in response:
+        click.secho(response["error"], fg="red")
+        return
+    answers = response["answers"]
+    _print_solutions(year, day, list(answers), answers.values())
+
+
+def _solve_separately(
+    solution: registry.Solution,
+    parts: list[str],
+    cache: bool,
+    output_format: str,
+    timeout: Optional[float],
+    max_memory: Optional[int],
+) -> None:
+    """Solves each part on its own and prints its record (see `_solve_parts`), or\
+         its answer and peak memory as text. Exits with code 1 if any part was not\
+             solved."""
+    if output_format == TEXT:
+        click.secho(
+            "Output for Year {year}, Day {day}".format(
+                year=solution.year, day=solution.day
+            ),
+            fg="green",
+        )
+    records = []
+    for record in _solve_parts(solution, parts, cache, timeout, max_memory):
+        records.append(record)
+        if output_format == NDJSON:
+            click.echo(json.dumps(record, default=str))
+        elif output_format == TEXT:
+            _print_record(record, timeout, max_memory)
+    if output_format == JSON:
+        click.echo(json.dumps(records, indent=2, default=str))
+    if any(record["status"] != "ok" for record in records):
+        raise SystemExit(1)
+
+
+def _solve_parts(
+    solution: registry.Solution,
+    parts: list[str],
+    cache: bool,
+    timeout: Optional[float],
+    max_memory: Optional[int],
+) -> Iterator[dict]:
+    """Solves each part on its own, in this process or, with limits, in a process of\
+         its own (see `sandbox.run_part`).
+
+    In this process, the input is parsed once for all the parts, while a part in a\
+         process of its own parses it again. `parse_seconds` is null for solutions\
+             that do not parse their input separately, as parsing is then counted in\
+                 `solve_seconds`. In this process, the peak memory is the highest the\
+                     process has reached so far.
+
+    Args:
+        solution (registry.Solution): The solution to run.
+        parts (list[str]): The parts to solve.
+        cache (bool): Use and save the answers in the answer cache.
+        timeout (Optional[float]): Seconds each part may run for.
+        max_memory (Optional[int]): MiB of memory each part may use.
+
+    Yields:
+        dict: The record for each part, holding `year`, `day` and `part`, its\
+             `status` ("ok", "timeout", "memory_limit" or "error"), the `answer` (or\
+                 `error`), whether the answer was `cached`, the seconds spent in each\
+                     phase (`fetch_seconds` to read the input, `parse_seconds` and\
+                         `solve_seconds`) and `peak_rss_bytes`.
+    """
+    start = time.perf_counter()
+    text = aoc_requests.get_input(solution.year, solution.day)
+    fetch_seconds = time.perf_counter() - start
+    digests = _answer_digests(solution.module, text)
+    if not cache:
+        digests = None
+
+    # Holds the parsed input once the first part is solved in this process
+    parsed_input: dict = {}
+    for p in parts:
+        record = {
+            "year": int(solution.year),
+            "day": int(solution.day),
+            "part": int(p),
+            "status": "ok",
+            "answer": None,
+            "error": None,
+            "cached": False,
+            "fetch_seconds": fetch_seconds,
+            "parse_seconds": None,
+            "solve_seconds": None,
+            "peak_rss_bytes": None,
+        }
+        saved = _saved_answers(solution.year, solution.day, [p], digests)
+        if saved is not None:
+            record.update(answer=saved[0], cached=True)
+        else:
+            record.update(
+                _solve_part_record(solution, p, text, timeout, max_memory, parsed_input)
+            )
+        if digests is not None and record["status"] == "ok":
+            answer_cache.cache.put(
+                solution.year, solution.day, p, answer=record["answer"], **digests
+            )
+        yield record
+
+
+def _solve_part_record(
+    solution: registry.Solution,
+    part: str,
+    text: str,
+    timeout: Optional[float],
+    max_memory: Optional[int],
+    parsed_input: dict,
+) -> dict:
+    """Solves the part and returns the fields of its record that come from solving\
+         it. In this process, the input is parsed the first time, and kept in\
+             `parsed_input` for the next parts."""
+    # Imported here to keep the start-up of the other commands fast
+    from advent_of_code import profiling, sandbox
+
+    if timeout is not None or max_memory is not None:
+        # Spans in the sandboxed process are not traced, so the whole part is
+        with tracing.instrument("part_" + part, sandboxed=True):
+            result = sandbox.run_part(
+                solution,
+                part,
+                text,
+                timeout=timeout,
+                max_memory=None if max_memory is None else max_memory * 1024 * 1024,
+            )
+        return {
+            "status": result.status,
+            "answer": result.answer,
+            "error": result.error,
+            "parse_seconds": result.parse_time,
+            "solve_seconds": result.wall_time,
+            "peak_rss_bytes": result.peak_rss,
+        }
+
+    if "input" not in parsed_input:
+        start = time.perf_counter()
+        parsed_input["input"] = solution.parse(text)
+        parsed_input["seconds"] = time.perf_counter() - start
+    start = time.perf_counter()
+    answer = solution.solve(part, parsed_input["input"])
+    solve_seconds = time.perf_counter() - start
+    return {
+        "answer": answer,
+        "parse_seconds": None if solution.parser is None else parsed_input["seconds"],
+        "solve_seconds": solve_seconds,
+        "peak_rss_bytes": profiling.peak_rss(),
+    }
+
+
+def _print_record(
+    record: dict, timeout: Optional[float], max_memory: Optional[int]
+) -> None:
+    """Prints the answer to a part with its peak memory, or why it was stopped."""
+    p = record["part"]
+    if record["status"] == "ok":
+        peak = (
+            ""
+            if record["peak_rss_bytes"] is None
+            else " (peak memory {:.1f} MiB)".format(
+                record["peak_rss_bytes"] / 1024 / 1024
+            )
+        )
+        click.echo(
+            "Part {p} solution: {s}{peak}".format(p=p, s=record["answer"], peak=peak)
+        )
+        return
+    if record["status"] == "timeout":
+        message = "Part {p} timed out after {t} seconds".format(p=p, t=timeout)
+    elif record["status"] == "memory_limit":
+        message = "Part {p} went over the memory limit of {m} MiB".format(
+            p=p, m=max_memory
+        )
+    else:
+        message = "Part {p} failed: {error}".format(p=p, error=record["error"])
+    click.secho(message, fg="red")
+
+
+def _solve_in_process(
+    solution: registry.Solution, parts: list[str], cache: bool
+) -> tuple:
+    """Returns the answer to each part, reading and parsing the input only once.
+
+    Args:
+        solution (registry.Solution): The solution to run.
+        parts (list[str]): The parts to solve.
+        cache (bool): Return the saved answers if neither the input nor the\
+             solution's code changed since they were saved, and save new answers.
+
+    Returns:
+        tuple: The answer to each part, in order.
+    """
+    if not cache:
+        parsed = solution.parse_input()
+        return tuple(solution.solve(p, parsed) for p in parts)
+
+    text = aoc_requests.get_input(solution.year, solution.day)
+    digests = _answer_digests(solution.module, text)
+    saved = _saved_answers(solution.year, solution.day, parts, digests)
+    if saved is not None:
+        return tuple(saved)
+    parsed = solution.parse(text)
+    answers = tuple(solution.solve(p, parsed) for p in parts)
+    if digests is not None:
+        for p, answer in zip(parts, answers, strict=True):
+            answer_cache.cache.put(
+                solution.year, solution.day, p, answer=answer, **digests
+            )
+    return answers
+
+
+def _saved_answers(
+    year: str, day: str, parts: list[str], digests: Optional[dict[str, str]]
+) -> Optional[list]:
+    """Returns the saved answer to every part, or None if any of them is missing."""
+    if digests is None:
+        return None
+    saved = [answer_cache.cache.get(year, day, p, **digests) for p in parts]
+    return None if None in saved else saved
+
+
+def _answer_digests(module: str, text: str) -> Optional[dict[str, str]]:
+    """Returns the digests of the challenge's input and of the solution's code, which\
+         saved answers are looked up by. Returns None if the code cannot be found."""
+    code_sha256 = answer_cache.digest_module(module)
+    if code_sha256 is None:
+        return None
+    return {"input_sha256": answer_cache.digest_text(text), "code_sha256": code_sha256}
+
+
+def _print_solutions(
+    year: str, day: str, parts: list[str], solutions: Iterable
+) -> None:
+    """Prints the answer to each part."""
+    click.secho(
+        "Output for Year {year}, Day {day}".format(year=year, day=day), fg="green"
+    )
+    for p, s in zip(parts, solutions, strict=True):
+        click.echo("Part {p} solution: {s}".format(p=p, s=s))
+
+
+def _profile_solution(
+    solution: Callable[[], object],
+    name: str,
+    profile: bool,
+    trace_memory: bool,
+    profile_dir: Optional[str],
+) -> object:
+    """Runs the solution to a part under cProfile and/or tracemalloc, writing the\
+         results to files named after `name` in `profile_dir`."""
+    # Imported here to keep the start-up of the other commands fast
+    from advent_of_code import profiling
+
+    profile_dir = profile_dir or profiling.default_profile_dir()
+    run = solution
+    if profile:
+        pstats_path = path.join(profile_dir, name + ".pstats")
+        run = partial(profiling.profile_call, solution, pstats_path)
+
+    if not trace_memory:
+        result = run()
+    else:
+        result, peak, sites = profiling.trace_memory_call(run)
+        report = "Peak traced memory: {peak} bytes\n".format(peak=peak) + "\n".join(
+            sites
+        )
+        makedirs(profile_dir, exist_ok=True)
+        with open(path.join(profile_dir, name + "_memory.txt"), "w") as f:
+            f.write(report + "\n")
+        click.secho("Top allocation sites for " + name, fg="green")
+        click.echo(report)
+
+    if profile:
+        click.secho("Profile written to " + pstats_path, fg="green")
+    return result
+
+
+@click.command("run-all")
+@click.option(
+    "--year",
+    "-y",
+    default="",
+    help="Only run the solutions for this year",
+)
+@click.option(
+    "--workers",
+    type=int,
+    default=None,
+    help="Number of processes to run solutions in. Defaults to the number of cores",
+)
+@click.option(
+    "--source",
+    default="http",
+    envvar="AOC_INPUT_SOURCE",
+    show_default=True,
+    help="Where to read the inputs from: 'http' or 'dir:<path>'. Can also be set "
+    "with the AOC_INPUT_SOURCE environment variable",
+)
+def run_all(
+    year: str = "", workers: Optional[int] = None, source: str = "http"
+) -> None:
+    """Runs every available solution in parallel and prints a table of the results.
+
+    Args:
+        year (str): Only run the solutions for this year. Defaults to all years.
+        workers (Optional[int]): Number of processes. Defaults to the number of cores.
+        source (str): Description of the input source (see\
+             `input_sources.from_spec`). Defaults to "http".
+
+    Raises:
+        BadParameter: Raised when reading the inputs from standard input, as every\
+             solution would need its own input.
+    """
+    # Imported here to keep the start-up of the other commands fast
+    from advent_of_code import runner
+
+    input_source = input_sources.from_spec(source)
+    if isinstance(input_source, input_sources.StdinSource):
+        raise click.BadParameter(
+            "Cannot read several inputs from stdin", param_hint=source
+        )
+
+    solutions = runner.discover_solutions(year=year if year != "" else None)
+    if len(solutions) == 0:
+        click.secho("Sorry, there are no answers for that year yet :(", fg="red")
+        return
+
+    if isinstance(input_source, input_sources.HttpSource):
+        if not path.exists(aoc_requests.cookie.getpath()):
+            click.secho(
+                "No cookie was found, please use the 'aoc set-cookie' option first",
+                fg="red",
+            )
+            return
+        # Download any missing inputs up front, several at a time, rather than one
+        #  by one as the inputs are read
+        for solution_year in sorted({y for y, _ in solutions}, key=int):
+            aoc_requests.prefetch(
+                year=solution_year,
+                days=[d for y, d in solutions if y == solution_year],
+            )
+
+    results = runner.run_all(solutions, source=input_source, max_workers=workers)
+
+    click.secho(
+        "{:>4}  {:>3}  {:>4}  {:>8}  {:>8}  {}".format(
+            "Year", "Day", "Part", "Wall (s)", "CPU (s)", "Answer"
+        ),
+        fg="green",
+    )
+    for result in results:
+        if result.error is not None:
+            click.secho(
+                "{:>4}  {:>3}  {:>4}  {:>8}  {:>8}  {}".format(
+                    result.year, result.day, "-", "-", "-", result.error
+                ),
+                fg="red",
+            )
+            continue
+        for i, answer in enumerate(result.answers):
+            click.echo(
+                "{:>4}  {:>3}  {:>4}  {:>8.3f}  {:>8.3f}  {}".format(
+                    result.year,
+                    result.day,
+                    i + 1,
+                    result.wall_times[i],
+                    result.cpu_times[i],
+                    answer,
+                )
+            )
+
+
+@click.command("bench")
+@click.option("--year", "-y", required=True, help="Year of Advent of Code")
+@click.option("--day", "-d", required=True, help="Day of Advent of Code")
+@click.option(
+    "--part",
+    "-p",
+    type=click.Choice(["1", "2"]),
+    default=None,
+    help="Only time this part. Defaults to timing each part",
+)
+@click.option(
+    "--warmup",
+    type=click.IntRange(min=0),
+    default=1,
+    show_default=True,
+    help="Number of untimed runs first",
+)
+@click.option(
+    "--repeats",
+    type=click.IntRange(min=1),
+    default=10,
+    show_default=True,
+    help="Number of timed runs",
+)
+@click.option(
+    "--output", "-o", default=None, help="Write the timings to this JSON file"
+)
+@click.option(
+    "--baseline",
+    default=None,
+    help="Compare the timings to a JSON file written by a previous run",
+)
+@click.option(
+    "--tolerance",
+    type=click.FloatRange(min=0),
+    default=0.1,
+    show_default=True,
+    help="How much slower than the baseline a median time may be (0.1 is 10%)",
+)
+@click.option(
+    "--source",
+    default="http",
+    envvar="AOC_INPUT_SOURCE",
+    show_default=True,
+    help="Where to read the input from: 'http', 'file:<path>', 'dir:<path>' or "
+    "'stdin'. Can also be set with the AOC_INPUT_SOURCE environment variable",
+)
+def bench(
+    year: str,
+    day: str,
+    part: Optional[str] = None,
+    warmup: int = 1,
+    repeats: int = 10,
+    output: Optional[str] = None,
+    baseline: Optional[str] = None,
+    tolerance: float = 0.1,
+    source: str = "http",
+) -> None:
+    """Times each part of the solution for a challenge and prints the min, median and\
+         p95 times.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+        part (Optional[str]): Only time this part. Defaults to every part.
+        warmup (int): Number of untimed runs before timing starts. Defaults to 1.
+        repeats (int): Number of timed runs. Defaults to 10.
+        output (Optional[str]): Path of a JSON file to write the timings to.\
+             Defaults to None.
+        baseline (Optional[str]): Path of a JSON file from a previous run to compare\
+             against. Defaults to None.
+        tolerance (float): Allowed slowdown of the median time compared to the\
+             baseline. Defaults to 0.1.
+        source (str): Description of the input source (see\
+             `input_sources.from_spec`). Defaults to "http".
+
+    Raises:
+        SystemExit: Exits with code 1 when a timing regressed against the baseline.
+    """
+    # Imported here to keep the start-up of the other commands fast
+    from advent_of_code import bench as benchmarks
+
+    input_sources.source = input_sources.from_spec(source)
+    if isinstance(input_sources.source, input_sources.HttpSource) and not path.exists(
+        aoc_requests.cookie.getpath()
+    ):
+        click.secho(
+            "No cookie was found, please use the 'aoc set-cookie' option first",
+            fg="red",
+        )
+        return
+
+    try:
+        report = benchmarks.benchmark_day(
+            year=year.strip(),
+            day=day.strip(),
+            warmup=warmup,
+            repeats=repeats,
+            parts=[part] if part is not None else None,
         )
-        solutions = module.main()
     except ModuleNotFoundError:
         click.secho("Sorry, there's no answer for that day yet :(", fg="red")
         return
+
     click.secho(
-        "Output for Year {year}, Day {day}".format(year=year, day=day), fg="green"
+        "Timings for Year {year}, Day {day} ({repeats} runs)".format(
+            year=year, day=day, repeats=repeats
+        ),
+        fg="green",
     )
-    for i, s in enumerate(solutions):
-        click.echo("Part {i} solution: {s}".format(i=i + 1, s=s))
+    for target, result in report["results"].items():
+        click.echo(
+            "{target}: min {min:.6f}s, median {median:.6f}s, p95 {p95:.6f}s".format(
+                target=target, **result
+            )
+        )
+
+    if output is not None:
+        benchmarks.save_report(report, output)
+
+    if baseline is not None:
+        regressions = benchmarks.compare_to_baseline(
+            report, benchmarks.load_report(baseline), tolerance=tolerance
+        )
+        for regression in regressions:
+            click.secho("Regression: " + regression, fg="red")
+        if len(regressions) > 0:
+            raise SystemExit(1)
+
+
+@click.command("gen")
+@click.option("--year", "-y", required=True, help="Year of Advent of Code")
+@click.option("--day", "-d", required=True, help="Day of Advent of Code")
+@click.option(
+    "--scale",
+    "-k",
+    type=click.IntRange(min=1),
+    required=True,
+    help="Size of the input (ex. the number of lines, or the width of a map)",
+)
+@click.option(
+    "--seed", default=0, show_default=True, help="Seed of the random number generator"
+)
+@click.option(
+    "--output",
+    "-o",
+    default="-",
+    show_default=True,
+    help="Write the input to this file ('-' for standard output)",
+)
+def gen(year: str, day: str, scale: int, seed: int = 0, output: str = "-") -> None:
+    """Generates a valid input of any size for a challenge.
+
+    The same seed and scale always give the same input, so timings on generated\
+         inputs can be compared between runs.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+        scale (int): Size of the input. What it counts depends on the day.
+        seed (int): Seed of the random number generator. Defaults to 0.
+        output (str): Path of the file to write the input to, or '-' for standard\
+             output. Defaults to '-'.
+
+    Raises:
+        SystemExit: Exits with code 1 when there is no generator for the day.
+    """
+    # Imported here to keep the start-up of the other commands fast
+    from advent_of_code import generators
+
+    try:
+        lines = generators.generate_lines(year.strip(), day.strip(), scale, seed=seed)
+    except ValueError as exc:
+        click.secho(str(exc), fg="red", err=True)
+        raise SystemExit(1) from exc
+
+    with click.open_file(output, "w") as f:
+        for line in lines:
+            f.write(line + "\n")
+
+
+@click.command("list")
+@click.option(
+    "--year",
+    "-y",
+    default="",
+    help="Only list the solutions for this year",
+)
+def list_solutions(year: str = "") -> None:
+    """Lists the days that have a solution, without running or importing any of them.
+
+    Args:
+        year (str): Only list the solutions for this year. Defaults to all years.
+    """
+    solutions = registry.solutions(year=year if year != "" else None)
+    if len(solutions) == 0:
+        click.secho("Sorry, there are no answers for that year yet :(", fg="red")
+        return
+
+    days: dict[str, list[str]] = {}
+    for solution in solutions:
+        days.setdefault(solution.year, []).append(solution.day)
+    for solution_year, solution_days in days.items():
+        click.echo(
+            "{year}: days {days}".format(
+                year=solution_year, days=", ".join(solution_days)
+            )
+        )
+
+
+@click.command("prefetch")
+@click.option(
+    "--year",
+    "-y",
+    default="",
+    help="Year of Advent of Code",
+)
+@click.option(
+    "--workers",
+    default=4,
+    show_default=True,
+    help="Maximum number of inputs downloaded at the same time",
+)
+@click.option(
+    "--min-interval",
+    default=0.5,
+    show_default=True,
+    help="Minimum number of seconds between the start of two downloads",
+)
+def prefetch(year: str = "", workers: int = 4, min_interval: float = 0.5) -> None:
+    """Downloads the inputs for every released day of a year into the input cache.
+
+    Args:
+        year (str): Year of challenge. Defaults to empty string.
+        workers (int): Maximum number of concurrent downloads. Defaults to 4.
+        min_interval (float): Minimum number of seconds between the start of two\
+             downloads. Defaults to 0.5.
+
+    Raises:
+        ValueError: Raises an error if non-numeric characters are entered.
+    """
+    if not path.exists(aoc_requests.cookie.getpath()):
+        click.secho(
+            "No cookie was found, please use the 'aoc set-cookie' option first",
+            fg="red",
+        )
+        return
+
+    if year == "":
+        year = click.prompt("Enter Year", type=str)
+
+    try:
+        int(year)
+    except ValueError as exc:
+        raise ValueError("Please enter a number for year, no characters") from exc
+
+    outcome = aoc_requests.prefetch(
+        year=year.strip(), max_workers=workers, min_interval=min_interval
+    )
+    if len(outcome) == 0:
+        click.secho("No puzzles have been released for that year yet", fg="red")
+    for day, result in outcome.items():
+        click.secho(
+            "Day {day}: {result}".format(day=day, result=result),
+            fg="green" if result in ("cached", "downloaded") else "red",
+        )
+
+
+@click.command("serve")
+@click.option(
+    "--address",
+    "-a",
+    default=None,
+    help="Unix socket path, or <host>:<port> to listen on TCP (only on a loopback "
+    "address, ex. 127.0.0.1). Defaults to .conf/aoc.sock",
+)
+def serve(address: Optional[str] = None) -> None:
+    """Keeps solutions and inputs loaded, and solves puzzles sent by\
+         'aoc get-solution --server'.
+
+    Args:
+        address (Optional[str]): Unix socket path or `<host>:<port>`. Defaults to\
+             .conf/aoc.sock in the working directory.
+
+    Raises:
+        BadParameter: Raised when the host is not a loopback address.
+    """
+    # Imported here to keep the start-up of the other commands fast
+    from advent_of_code import server as solver_server
+
+    try:
+        solver = solver_server.serve(address)
+    except ValueError as exc:
+        raise click.BadParameter(str(exc), param_hint="'--address'") from exc
+    with solver:
+        click.secho(
+            "Serving on {address}, press Ctrl+C to stop".format(
+                address=address or solver_server.default_address()
+            ),
+            fg="green",
+        )
+        try:
+            solver.serve_forever()
+        except KeyboardInterrupt:
+            pass
 
 
 @click.command("set-cookie")
 def set_cookie() -> None:
     """Saves the cookie in the working directory under '/.conf/cookie/cookie'."""
     try:
-        if not path.exists(path.dirname(cookie.getpath())):
-            makedirs(path.dirname(cookie.getpath()))
-        with open(cookie.getpath(), "w+") as f:
+        if not path.exists(path.dirname(aoc_requests.cookie.getpath())):
+            makedirs(path.dirname(aoc_requests.cookie.getpath()))
+        with open(aoc_requests.cookie.getpath(), "w+") as f:
             f.write(
                 click.prompt(
                     "Please paste cookie (when you paste, the input will be hidden)",
@@ -117,16 +1109,11 @@ def set_cookie() -> None:
         ) from exc
 
 
-def get_cookie() -> str:
-    """Returns the saved cookie."""
-    try:
-        with open(cookie.getpath(), "r") as f:
-            return f.read()
-    except FileNotFoundError as exc:
-        raise FileNotFoundError(
-            "Error reading file '{file_path}'".format(file_path=cookie.getpath())
-        ) from exc
-
-
+cli.add_command(bench)
+cli.add_command(gen)
 cli.add_command(get_solution_prereq)
+cli.add_command(list_solutions)
+cli.add_command(prefetch)
+cli.add_command(run_all)
+cli.add_command(serve)
 cli.add_command(set_cookie)
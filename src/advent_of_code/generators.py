@@ -0,0 +1,282 @@
+"""Generates valid puzzle inputs of any size, so the solutions can be timed on inputs\
+     much larger than the examples.
+
+Each generator takes a `scale` (what it counts depends on the day, see `GENERATORS`)\
+     and a random number generator, and yields the input one line at a time, so very\
+         large inputs can be written without holding them in memory. The same seed\
+             always gives the same input.
+"""
+import random
+import string
+from typing import Callable, Iterator
+
+# Seed used when none is given
+SEED = 0
+# Largest number of stacks that fit the drawing of day 5, as stacks are numbered
+#  with a single digit
+_MAX_STACKS = 9
+# Maps each byte to a digit, and to one of three letters (see `_day_6`)
+_DIGITS = bytes(b"0123456789"[i % 10] for i in range(256))
+_THREE_LETTERS = bytes(b"abc"[i % 3] for i in range(256))
+# Divisors used by the monkeys of day 11, which are primes in the real puzzle
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23)
+
+Generator = Callable[[int, random.Random], Iterator[str]]
+
+
+def _day_1(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields the calories carried by `scale` elves, with a blank line after each."""
+    for elf in range(scale):
+        if elf > 0:
+            yield ""
+        for _ in range(rng.randint(1, 10)):
+            yield str(rng.randint(1000, 60000))
+
+
+def _day_2(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields `scale` rounds of rock paper scissors."""
+    for _ in range(scale):
+        yield rng.choice("ABC") + " " + rng.choice("XYZ")
+
+
+def _rucksack(pool: list[str], badge: str, rng: random.Random) -> str:
+    """Returns a rucksack holding the badge, whose compartments share a single item.
+
+    Args:
+        pool (list[str]): 17 item types, none of them in the other rucksacks of the\
+             group. One is shared by both compartments, and the others are split\
+                 between them.
+        badge (str): The item type carried by every rucksack of the group.
+        rng (random.Random): Random number generator.
+
+    Returns:
+        str: The rucksack.
+    """
+    shared, first, second = pool[0], pool[1:9], pool[9:]
+    size = rng.randint(2, 16)
+    left = [shared, badge] + rng.choices(first, k=size - 2)
+    right = [shared] + rng.choices(second, k=size - 1)
+    rng.shuffle(left)
+    rng.shuffle(right)
+    return "".join(left + right)
+
+
+def _day_3(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields `scale` rucksacks (rounded up to a whole group of three)."""
+    letters = list(string.ascii_letters)
+    for _ in range(-(-scale // 3)):
+        # Each rucksack of the group draws from its own item types, so the badge is
+        #  the only item type they all carry
+        rng.shuffle(letters)
+        badge, others = letters[0], letters[1:]
+        for member in range(3):
+            yield _rucksack(others[member * 17 : (member + 1) * 17], badge, rng)
+
+
+def _day_4(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields `scale` pairs of section assignments."""
+    for _ in range(scale):
+        first_start, second_start = rng.randint(1, 99), rng.randint(1, 99)
+        yield "{}-{},{}-{}".format(
+            first_start,
+            rng.randint(first_start, 99),
+            second_start,
+            rng.randint(second_start, 99),
+        )
+
+
+def _day_5(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields a drawing of 9 stacks of crates, followed by `scale` moves."""
+    stacks = [
+        [rng.choice(string.ascii_uppercase) for _ in range(rng.randint(1, 8))]
+        for _ in range(_MAX_STACKS)
+    ]
+    height = max(len(stack) for stack in stacks)
+    for level in range(height - 1, -1, -1):
+        yield " ".join(
+            "[{}]".format(stack[level]) if level < len(stack) else "   "
+            for stack in stacks
+        )
+    yield " ".join(" {} ".format(number + 1) for number in range(_MAX_STACKS))
+    yield ""
+
+    # Only the number of crates on each stack is needed to keep the moves valid
+    heights = [len(stack) for stack in stacks]
+    for _ in range(scale):
+        source = rng.choice([i for i, count in enumerate(heights) if count > 0])
+        target = rng.choice([i for i in range(_MAX_STACKS) if i != source])
+        count = rng.randint(1, heights[source])
+        heights[source] -= count
+        heights[target] += count
+        yield "move {} from {} to {}".format(count, source + 1, target + 1)
+
+
+def _day_6(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields a datastream of `scale` characters (at least 14), whose markers end 10\
+         characters before the end and at the end."""
+    # With only three letters, no 4 characters in a row are different. The marker
+    #  starts with the same letters, so neither marker ends before it does.
+    marker = "abcdefghijklmn"
+    body = rng.randbytes(max(0, scale - len(marker))).translate(_THREE_LETTERS)
+    yield body.decode() + marker
+
+
+def _day_7(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields the terminal output of browsing a file system of `scale` directories.
+
+    The tree is grown by a random walk that goes back up a level less often than it\
+         creates a directory, so it is about `scale / 3` directories deep, with many\
+             directories holding several others.
+
+    Args:
+        scale (int): Number of directories, including the root.
+        rng (random.Random): Random number generator.
+
+    Yields:
+        str: Each line of terminal output.
+    """
+    parents = [0]
+    children: list[list[int]] = [[]]
+    current = 0
+    for directory in range(1, scale):
+        while current != 0 and rng.random() < 0.4:
+            current = parents[current]
+        parents.append(current)
+        children.append([])
+        children[current].append(directory)
+        current = directory
+
+    # Files are sized so the file system holds about 50000000 bytes, which is more
+    #  than part 2 allows, whatever the number of directories
+    largest = max(1, 66_000_000 // scale)
+    yield "$ cd /"
+    # Each directory is listed once, depth first, with None marking a return to the
+    #  parent. The stack is explicit, as the tree is deeper than the recursion limit.
+    stack: list = [0]
+    while len(stack) > 0:
+        directory = stack.pop()
+        if directory is None:
+            yield "$ cd .."
+            continue
+        if directory != 0:
+            yield "$ cd d{}".format(directory)
+        yield "$ ls"
+        for child in children[directory]:
+            yield "dir d{}".format(child)
+        for file in range(rng.randint(0, 3)):
+            yield "{} f{}.txt".format(rng.randint(1, largest), file)
+        for child in reversed(children[directory]):
+            stack.extend([None, child])
+
+
+def _day_8(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields a map of tree heights, `scale` trees wide and `scale` trees tall."""
+    for _ in range(scale):
+        yield rng.randbytes(scale).translate(_DIGITS).decode()
+
+
+def _day_9(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields `scale` moves of the head of the rope."""
+    for _ in range(scale):
+        yield "{} {}".format(rng.choice("UDLR"), rng.randint(1, 20))
+
+
+def _day_10(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields `scale` instructions for the CPU."""
+    register = 1
+    for _ in range(scale):
+        # Additions aim for a random column, so the sprite stays on the screen
+        add = rng.randint(0, 39) - register
+        if add == 0 or rng.random() < 0.25:
+            yield "noop"
+        else:
+            register += add
+            yield "addx {}".format(add)
+
+
+def _day_11(scale: int, rng: random.Random) -> Iterator[str]:
+    """Yields the notes on `scale` monkeys (at least 2)."""
+    monkeys = max(2, scale)
+    for monkey in range(monkeys):
+        operation = rng.choice(
+            [
+                "old * old",
+                "old * {}".format(rng.randint(2, 19)),
+                "old + {}".format(rng.randint(1, 8)),
+            ]
+        )
+        # A monkey never throws to itself, and throws to two different monkeys
+        #  whenever there are more than two
+        others = [other for other in range(monkeys) if other != monkey]
+        if_true = rng.choice(others)
+        if_false = rng.choice([other for other in others if other != if_true] or others)
+        items = [rng.randint(50, 99) for _ in range(rng.randint(1, 8))]
+        if monkey > 0:
+            yield ""
+        yield "Monkey {}:".format(monkey)
+        yield "  Starting items: " + ", ".join(map(str, items))
+        yield "  Operation: new = " + operation
+        yield "  Test: divisible by {}".format(rng.choice(_PRIMES))
+        yield "    If true: throw to monkey {}".format(if_true)
+        yield "    If false: throw to monkey {}".format(if_false)
+
+
+# Generator for each day, by year. What `scale` counts is given by each docstring.
+GENERATORS: dict[str, dict[str, Generator]] = {
+    "2022": {
+        "1": _day_1,
+        "2": _day_2,
+        "3": _day_3,
+        "4": _day_4,
+        "5": _day_5,
+        "6": _day_6,
+        "7": _day_7,
+        "8": _day_8,
+        "9": _day_9,
+        "10": _day_10,
+        "11": _day_11,
+    }
+}
+
+
+def generate_lines(year: str, day: str, scale: int, seed: int = SEED) -> Iterator[str]:
+    """Yields a generated input for a challenge one line at a time.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+        scale (int): Size of the input. What it counts depends on the day.
+        seed (int): Seed of the random number generator. Defaults to `SEED`.
+
+    Raises:
+        ValueError: Raised when there is no generator for the day, or the scale is\
+             not positive.
+
+    Returns:
+        Iterator[str]: Each line of the input.
+    """
+    generator = GENERATORS.get(year, {}).get(day)
+    if generator is None:
+        raise ValueError(
+            "There is no generator for year {year}, day {day}".format(
+                year=year, day=day
+            )
+        )
+    if scale < 1:
+        raise ValueError("The scale must be at least 1")
+    return generator(scale, random.Random(seed))  # noqa: S311
+
+
+def generate(year: str, day: str, scale: int, seed: int = SEED) -> str:
+    """Returns a generated input for a challenge (see `generate_lines`).
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+        scale (int): Size of the input. What it counts depends on the day.
+        seed (int): Seed of the random number generator. Defaults to `SEED`.
+
+    Returns:
+        str: The input.
+    """
+    return "\n".join(generate_lines(year, day, scale, seed=seed))
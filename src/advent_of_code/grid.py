@@ -0,0 +1,195 @@
+"""A compact grid of small numbers (such as digits), for puzzles set on a map."""
+from typing import Iterator, Optional, Union
+
+from advent_of_code import parsing
+
+# Row and column steps to each neighbour of a cell, clockwise from up
+ORTHOGONAL = ((-1, 0), (0, 1), (1, 0), (0, -1))
+DIAGONAL = ((-1, 1), (1, 1), (1, -1), (-1, -1))
+
+
+class Grid:
+    """A rectangular grid of numbers from 0 to 255, which need not be square.
+
+    The cells are stored row after row in a single `bytearray`, so a grid takes one\
+         byte per cell. Rows, columns and the cells from a cell to an edge are\
+             returned as memoryviews into that bytearray, without copying them.\
+                 Cells are read and written with `grid[row, col]`.
+    """
+
+    def __init__(
+        self, width: int, height: int, cells: Optional[Union[bytes, bytearray]] = None
+    ) -> None:
+        """Creates a grid of `width` columns and `height` rows.
+
+        Args:
+            width (int): Number of columns.
+            height (int): Number of rows.
+            cells (Optional[Union[bytes, bytearray]]): The value of each cell, row\
+                 after row. The cells are copied. Defaults to zeros.
+
+        Raises:
+            ValueError: Raised when the number of cells does not match the shape.
+        """
+        if width < 0 or height < 0:
+            raise ValueError("A grid cannot have a negative width or height")
+        self.cells = bytearray(width * height) if cells is None else bytearray(cells)
+        if len(self.cells) != width * height:
+            raise ValueError(
+                "{count} cells do not fill a {width}x{height} grid".format(
+                    count=len(self.cells), width=width, height=height
+                )
+            )
+        self.width = width
+        self.height = height
+        self._view = memoryview(self.cells)
+
+    def in_bounds(self, row: int, col: int) -> bool:
+        """Returns whether the cell is inside the grid."""
+        return 0 <= row < self.height and 0 <= col < self.width
+
+    def index(self, row: int, col: int) -> int:
+        """Returns the position of a cell in `cells`.
+
+        Args:
+            row (int): Row of the cell.
+            col (int): Column of the cell.
+
+        Raises:
+            IndexError: Raised when the cell is outside the grid. Negative indexes\
+                 are outside the grid, rather than counted from the end.
+
+        Returns:
+            int: The position of the cell.
+        """
+        if not self.in_bounds(row, col):
+            raise IndexError(
+                "({row}, {col}) is outside the {width}x{height} grid".format(
+                    row=row, col=col, width=self.width, height=self.height
+                )
+            )
+        return row * self.width + col
+
+    def __getitem__(self, cell: tuple[int, int]) -> int:
+        """Returns the value of the cell at (row, col)."""
+        return self.cells[self.index(*cell)]
+
+    def __setitem__(self, cell: tuple[int, int], value: int) -> None:
+        """Sets the value of the cell at (row, col)."""
+        self.cells[self.index(*cell)] = value
+
+    def get(self, row: int, col: int, default: Optional[int] = None) -> Optional[int]:
+        """Returns the value of the cell, or `default` if it is outside the grid."""
+        if not self.in_bounds(row, col):
+            return default
+        return self.cells[row * self.width + col]
+
+    def row(self, row: int) -> memoryview:
+        """Returns the cells of a row, from left to right, without copying them.
+
+        Args:
+            row (int): The row.
+
+        Raises:
+            IndexError: Raised when the row is outside the grid.
+
+        Returns:
+            memoryview: The cells of the row.
+        """
+        if not 0 <= row < self.height:
+            raise IndexError("Row {} is outside the grid".format(row))
+        return self._view[row * self.width : (row + 1) * self.width]
+
+    def col(self, col: int) -> memoryview:
+        """Returns the cells of a column, from top to bottom, without copying them.
+
+        Args:
+            col (int): The column.
+
+        Raises:
+            IndexError: Raised when the column is outside the grid.
+
+        Returns:
+            memoryview: The cells of the column.
+        """
+        if not 0 <= col < self.width:
+            raise IndexError("Column {} is outside the grid".format(col))
+        return self._view[col :: self.width]
+
+    def ray(self, row: int, col: int, d_row: int, d_col: int) -> memoryview:
+        """Returns the cells from a cell to the edge of the grid in a direction,\
+             without copying them.
+
+        Args:
+            row (int): Row of the cell.
+            col (int): Column of the cell.
+            d_row (int): Step between rows: -1 (up), 0 or 1 (down).
+            d_col (int): Step between columns: -1 (left), 0 or 1 (right). Diagonal\
+                 directions stop at the first edge reached.
+
+        Returns:
+            memoryview: The cells, from the cell next to (row, col) to the edge. The\
+                 cell itself is not included.
+        """
+        start = self.index(row, col)
+        steps = []
+        if d_row != 0:
+            steps.append(row if d_row < 0 else self.height - 1 - row)
+        if d_col != 0:
+            steps.append(col if d_col < 0 else self.width - 1 - col)
+        count = min(steps, default=0)
+        if count == 0:
+            return self._view[0:0]
+        step = d_row * self.width + d_col
+        stop = start + (count + 1) * step
+        # A negative stop would count from the end, so the slice runs to the start
+        return self._view[start + step : stop if stop >= 0 else None : step]
+
+    def rays(self, row: int, col: int) -> Iterator[memoryview]:
+        """Yields the cells from a cell to each edge, going up, right, down and left\
+             (see `ray`)."""
+        for d_row, d_col in ORTHOGONAL:
+            yield self.ray(row, col, d_row, d_col)
+
+    def neighbours(
+        self, row: int, col: int, diagonal: bool = False
+    ) -> Iterator[tuple[int, int]]:
+        """Yields the (row, col) of the neighbours of a cell that are inside the grid.
+
+        Args:
+            row (int): Row of the cell.
+            col (int): Column of the cell.
+            diagonal (bool): Include the neighbours on diagonals. Defaults to False.
+
+        Yields:
+            tuple[int, int]: The row and column of each neighbour, clockwise from\
+                 the one above, and then the diagonal ones clockwise from the top\
+                     right.
+        """
+        steps = ORTHOGONAL if not diagonal else ORTHOGONAL + DIAGONAL
+        for d_row, d_col in steps:
+            if self.in_bounds(row + d_row, col + d_col):
+                yield row + d_row, col + d_col
+
+    def rows(self) -> Iterator[memoryview]:
+        """Yields each row, from top to bottom (see `row`)."""
+        for row in range(self.height):
+            yield self.row(row)
+
+    def cols(self) -> Iterator[memoryview]:
+        """Yields each column, from left to right (see `col`)."""
+        for col in range(self.width):
+            yield self.col(col)
+
+
+def from_digits(text: str) -> Grid:
+    """Reads a grid of digits, one row per line (see `parsing.digit_grid`).
+
+    Args:
+        text (str): The grid.
+
+    Returns:
+        Grid: The grid, holding the value of each digit.
+    """
+    cells, width = parsing.digit_grid(text)
+    return Grid(width, len(cells) // width, cells)
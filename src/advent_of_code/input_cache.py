@@ -0,0 +1,281 @@
+"""Stores puzzle inputs on disk so that repeat runs do not need the network."""
+from contextlib import contextmanager
+import hashlib
+import json
+from os import getcwd, makedirs, path, remove, replace, utime
+import tempfile
+import time
+from typing import Iterator, Optional
+
+# Inputs are a few kilobytes each, so this comfortably holds every puzzle ever
+# released while still putting a ceiling on the size of the .conf folder.
+DEFAULT_MAX_BYTES = 50 * 1024 * 1024
+
+
+class InputCache:
+    """Content-addressed store for puzzle inputs, keyed by year and day.
+
+    Each input is saved under `objects/`, using the SHA-256 digest of its contents as
+    the file name. An `index.json` file maps each (year, day) to its object. When the
+    stored inputs take up more than `max_bytes`, the least recently used inputs are
+    removed first.
+
+    The cache may be used by several processes at once (ex. `run-all` and the\
+         server). Reading an input never writes the index: it only sets the\
+             modification time of the object, which records when it was last used.\
+                 Changes to the index are made while holding a lock on\
+                     `index.lock`.
+    """
+
+    def __init__(
+        self, root: Optional[str] = None, max_bytes: int = DEFAULT_MAX_BYTES
+    ) -> None:
+        """Store inputs in the current working directory under .conf/inputs.
+
+        Args:
+            root (Optional[str]): Folder holding the cache. Defaults to\
+                 .conf/inputs in the current working directory.
+            max_bytes (int): Total size of the cached inputs before the least\
+                 recently used ones are evicted. Defaults to 50 MiB.
+        """
+        self.path = root if root is not None else path.join(getcwd(), ".conf", "inputs")
+        self.max_bytes = max_bytes
+
+    def getpath(self) -> str:
+        """Return path to cache folder."""
+        return self.path
+
+    @staticmethod
+    def key(year: str, day: str) -> str:
+        """Returns the index key for a year and day (ex. `2022/1`)."""
+        return "{year}/{day}".format(year=int(year), day=int(day))
+
+    def get(self, year: str, day: str) -> Optional[str]:
+        """Returns the cached input for the year and day, or None if it is not cached.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+
+        Returns:
+            Optional[str]: The cached input text.
+        """
+        entry = self._load_index()["entries"].get(self.key(year, day))
+        if entry is None:
+            return None
+
+        try:
+            with open(self._object_path(entry["sha256"]), "r") as f:
+                text = f.read()
+        except FileNotFoundError:
+            # The object was removed by hand (or evicted by another process), and
+            #  its entry is dropped the next time the index is changed
+            return None
+
+        self._touch(entry["sha256"])
+        return text
+
+    def get_path(self, year: str, day: str) -> Optional[str]:
+        """Returns the path of the file holding the cached input for the year and day.
+
+        This lets large inputs be read in pieces rather than all at once.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+
+        Returns:
+            Optional[str]: Path to the cached input, or None if it is not cached.
+        """
+        entry = self._load_index()["entries"].get(self.key(year, day))
+        if entry is None or not self._touch(entry["sha256"]):
+            return None
+        return self._object_path(entry["sha256"])
+
+    def put(
+        self,
+        year: str,
+        day: str,
+        text: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        """Saves the input for the year and day, evicting old inputs if required.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+            text (str): The input text for the challenge.
+            etag (Optional[str]): ETag header sent with the input, used to\
+                 revalidate it later. Defaults to None.
+            last_modified (Optional[str]): Last-Modified header sent with the input,\
+                 used to revalidate it later. Defaults to None.
+        """
+        data = text.encode()
+        digest = hashlib.sha256(data).hexdigest()
+        with self._lock():
+            # Written while holding the lock, so another process cannot remove the
+            #  object before it is in the index
+            if not self._touch(digest):
+                makedirs(path.dirname(self._object_path(digest)), exist_ok=True)
+                atomic_write(self._object_path(digest), data)
+
+            index = self._load_index()
+            previous = index["entries"].get(self.key(year, day))
+            index["entries"][self.key(year, day)] = {
+                "sha256": digest,
+                "size": len(data),
+            }
+            if etag is not None:
+                index["entries"][self.key(year, day)]["etag"] = etag
+            if last_modified is not None:
+                index["entries"][self.key(year, day)]["last_modified"] = last_modified
+            if previous is not None:
+                self._remove_unreferenced(index, previous["sha256"])
+            self._evict(index, keep=self.key(year, day))
+            self._save_index(index)
+
+    def get_validators(self, year: str, day: str) -> dict[str, str]:
+        """Returns the headers needed to revalidate the cached input for the year and\
+             day with a conditional request.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+
+        Returns:
+            dict[str, str]: The `etag` and `last_modified` values saved with the\
+                 input, if any.
+        """
+        entry = self._load_index()["entries"].get(self.key(year, day), {})
+        return {k: entry[k] for k in ("etag", "last_modified") if k in entry}
+
+    def invalidate(self, year: str, day: str) -> None:
+        """Removes the cached input for the year and day, if there is one.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+        """
+        with self._lock():
+            index = self._load_index()
+            entry = index["entries"].pop(self.key(year, day), None)
+            if entry is None:
+                return
+            self._remove_unreferenced(index, entry["sha256"])
+            self._save_index(index)
+
+    def size(self) -> int:
+        """Returns the total size in bytes of all cached inputs."""
+        return self._total_size(self._load_index())
+
+    def _evict(self, index: dict, keep: str) -> None:
+        """Removes the entries whose object is missing, then the least recently used\
+             entries (other than `keep`) until the cache fits in `max_bytes`."""
+        last_used = {}
+        for k, entry in list(index["entries"].items()):
+            try:
+                last_used[k] = path.getmtime(self._object_path(entry["sha256"]))
+            except FileNotFoundError:
+                index["entries"].pop(k)
+        candidates = sorted(
+            (k for k in index["entries"] if k != keep), key=last_used.__getitem__
+        )
+        for k in candidates:
+            if self._total_size(index) <= self.max_bytes:
+                break
+            entry = index["entries"].pop(k)
+            self._remove_unreferenced(index, entry["sha256"])
+
+    @staticmethod
+    def _total_size(index: dict) -> int:
+        """Returns the size of all objects, counting shared objects only once."""
+        return sum({e["sha256"]: e["size"] for e in index["entries"].values()}.values())
+
+    def _remove_unreferenced(self, index: dict, digest: str) -> None:
+        """Deletes the object with the given digest if no entry uses it anymore."""
+        if any(e["sha256"] == digest for e in index["entries"].values()):
+            return
+        try:
+            remove(self._object_path(digest))
+        except FileNotFoundError:
+            pass
+
+    def _touch(self, digest: str) -> bool:
+        """Records that the object with the given digest was just used, returning\
+             False if there is no such object."""
+        now = time.time_ns()
+        try:
+            # Set to the nanosecond, as the current time the file system would use
+            #  by default may not tell apart uses a few milliseconds apart
+            utime(self._object_path(digest), ns=(now, now))
+        except FileNotFoundError:
+            return False
+        return True
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Holds the lock on the index while changing it."""
+        makedirs(self.path, exist_ok=True)
+        with locked(path.join(self.path, "index.lock")):
+            yield
+
+    def _index_path(self) -> str:
+        return path.join(self.path, "index.json")
+
+    def _object_path(self, digest: str) -> str:
+        return path.join(self.path, "objects", digest)
+
+    def _load_index(self) -> dict:
+        try:
+            with open(self._index_path(), "r") as f:
+                return json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return {"entries": {}}
+
+    def _save_index(self, index: dict) -> None:
+        makedirs(self.path, exist_ok=True)
+        atomic_write(self._index_path(), json.dumps(index).encode())
+
+
+def atomic_write(file_path: str, data: bytes) -> None:
+    """Writes to a temporary file first, so a crash never leaves a partial file."""
+    # Each write has its own temporary file, so processes writing the same file at
+    #  once do not clash. It is in the same folder, so it can be renamed over the file
+    fd, temp_path = tempfile.mkstemp(
+        dir=path.dirname(file_path),
+        prefix=path.basename(file_path) + ".",
+        suffix=".tmp",
+    )
+    try:
+        with open(fd, "wb") as f:
+            f.write(data)
+        replace(temp_path, file_path)
+    except BaseException:
+        remove(temp_path)
+        raise
+
+
+@contextmanager
+def locked(lock_path: str) -> Iterator[None]:
+    """Holds an exclusive lock on a file, which is created if needed, so that only\
+         one process at a time changes what the lock guards.
+
+    Args:
+        lock_path (str): The lock file.
+
+    Yields:
+        None: Nothing, the block runs while holding the lock.
+    """
+    # Only available on Unix
+    import fcntl
+
+    with open(lock_path, "a") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+cache = InputCache()
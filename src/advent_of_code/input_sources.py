@@ -0,0 +1,289 @@
+"""Defines where the puzzle input for a challenge is read from."""
+from abc import ABC, abstractmethod
+from os import path
+import sys
+from typing import Iterator, Optional
+
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import input_cache
+
+# Inputs are read from `<root>/<year>/day_<day>.txt` by default
+DEFAULT_PATTERN = path.join("{year}", "day_{day}.txt")
+
+
+class InputSource(ABC):
+    """Base class for all input sources. Subclasses implement `read()`."""
+
+    @abstractmethod
+    def read(self, year: str, day: str) -> str:
+        """Returns the input text for the challenge.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+        """
+
+    def read_lines(self, year: str, day: str) -> Iterator[str]:
+        """Yields the input text for the challenge one line at a time.
+
+        Sources backed by a file override this to avoid holding the whole input in\
+             memory. Like `read()`, trailing whitespace at the end of the input is\
+                 removed.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+
+        Returns:
+            Iterator[str]: The lines of the input, without line endings.
+        """
+        return iter(self.read(year, day).split("\n"))
+
+
+def iter_file_lines(file_path: str) -> Iterator[str]:
+    """Yields the lines of a file without their line endings, dropping the trailing\
+         whitespace at the end of the file (the same as `str.rstrip()` on the whole\
+             text).
+
+    The file is read through a buffer, so only the current line and any run of blank\
+         lines after it are held in memory.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Yields:
+        str: Each line of the file.
+    """
+    with open(file_path, "r") as f:
+        # The last non-blank line, and the blank lines after it. They are only
+        #  yielded once another non-blank line shows they are not the end of the file.
+        previous: Optional[str] = None
+        blank_lines: list[str] = []
+        for line in f:
+            line = line.rstrip("\n")
+            if line.strip() == "":
+                blank_lines.append(line)
+                continue
+            if previous is not None:
+                yield previous
+            yield from blank_lines
+            previous, blank_lines = line, []
+
+        if previous is not None:
+            yield previous.rstrip()
+        else:
+            # An empty file (or one holding only whitespace) is a single empty line
+            yield ""
+
+
+class HttpSource(InputSource):
+    """Reads inputs from the input cache, downloading them from the Advent of Code\
+         website when they are not cached yet."""
+
+    def read(self, year: str, day: str) -> str:
+        """Returns the cached input, downloading and caching it first if required.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+
+        Returns:
+            str: The input text for the challenge.
+        """
+        return aoc_requests.fetch_input(year, day)
+
+    def read_lines(self, year: str, day: str) -> Iterator[str]:
+        """Yields the cached input one line at a time, downloading it first if required.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+
+        Returns:
+            Iterator[str]: The lines of the input, without line endings.
+        """
+        cached_path = input_cache.cache.get_path(year, day)
+        if cached_path is None:
+            self.read(year, day)
+            cached_path = input_cache.cache.get_path(year, day)
+        if cached_path is None:
+            # Only happens if the cache is too small to keep anything
+            return super().read_lines(year, day)
+        return iter_file_lines(cached_path)
+
+
+class FileSource(InputSource):
+    """Reads the input from a single file, whichever challenge is requested."""
+
+    def __init__(self, file_path: str) -> None:
+        """Stores the path to the input file."""
+        self.path = file_path
+
+    def read(self, year: str, day: str) -> str:
+        """Returns the contents of the file without trailing whitespace.
+
+        Args:
+            year (str): Year of challenge (not used).
+            day (str): Day of challenge (not used).
+
+        Returns:
+            str: The input text for the challenge.
+        """
+        with open(self.path, "r") as f:
+            return f.read().rstrip()
+
+    def read_lines(self, year: str, day: str) -> Iterator[str]:
+        """Yields the contents of the file one line at a time.
+
+        Args:
+            year (str): Year of challenge (not used).
+            day (str): Day of challenge (not used).
+
+        Returns:
+            Iterator[str]: The lines of the input, without line endings.
+        """
+        return iter_file_lines(self.path)
+
+
+class DirectorySource(InputSource):
+    """Reads inputs from a directory, with one file per challenge.
+
+    By default, the input for year 2022, day 1 is read from `<root>/2022/day_1.txt`.
+    """
+
+    def __init__(self, root: str, pattern: str = DEFAULT_PATTERN) -> None:
+        """Stores the directory and the pattern used to name the input files.
+
+        Args:
+            root (str): Directory containing the input files.
+            pattern (str): Path of each input file relative to `root`, where `{year}`\
+                 and `{day}` are replaced by the challenge's year and day.
+        """
+        self.root = root
+        self.pattern = pattern
+
+    def read(self, year: str, day: str) -> str:
+        """Returns the contents of the challenge's file without trailing whitespace.
+
+        A FileNotFoundError naming the expected file is raised when there is no file\
+             for the challenge.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+
+        Returns:
+            str: The input text for the challenge.
+        """
+        file_path = self._file_path(year, day)
+        with open(file_path, "r") as f:
+            return f.read().rstrip()
+
+    def read_lines(self, year: str, day: str) -> Iterator[str]:
+        """Yields the contents of the challenge's file one line at a time.
+
+        Args:
+            year (str): Year of challenge.
+            day (str): Day of challenge.
+
+        Returns:
+            Iterator[str]: The lines of the input, without line endings.
+        """
+        return iter_file_lines(self._file_path(year, day))
+
+    def _file_path(self, year: str, day: str) -> str:
+        """Returns the path to the challenge's file, checking that it exists."""
+        file_path = path.join(
+            self.root,
+            self.pattern.format(year=int(year), day=int(day)),
+        )
+        if not path.exists(file_path):
+            raise FileNotFoundError(
+                "No input file found at '{file_path}'".format(file_path=file_path)
+            )
+        return file_path
+
+
+class StdinSource(InputSource):
+    """Reads the input from standard input.
+
+    Standard input can only be read once, so the text is kept after the first read.
+    """
+
+    def __init__(self) -> None:
+        """Initializes the source without reading anything yet."""
+        self._text: Optional[str] = None
+
+    def read(self, year: str, day: str) -> str:
+        """Returns all of standard input without trailing whitespace.
+
+        Args:
+            year (str): Year of challenge (not used).
+            day (str): Day of challenge (not used).
+
+        Returns:
+            str: The input text for the challenge.
+        """
+        if self._text is None:
+            self._text = sys.stdin.read().rstrip()
+        return self._text
+
+
+class TextSource(InputSource):
+    """Serves an input that is already in memory, whichever challenge is requested.
+
+    This takes reading the input out of the picture, for example when timing\
+         solutions.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Stores the input text."""
+        self.text = text
+
+    def read(self, year: str, day: str) -> str:
+        """Returns the stored input text.
+
+        Args:
+            year (str): Year of challenge (not used).
+            day (str): Day of challenge (not used).
+
+        Returns:
+            str: The input text for the challenge.
+        """
+        return self.text
+
+
+def from_spec(spec: str) -> InputSource:
+    """Creates an input source from its text description.
+
+    The following descriptions are accepted:
+    - `http`: download from the website, using the input cache.
+    - `file:<path>`: read every input from the file at `<path>`.
+    - `dir:<path>`: read inputs from the directory at `<path>`.
+    - `stdin` or `-`: read the input from standard input.
+
+    Args:
+        spec (str): The description of the source.
+
+    Raises:
+        ValueError: Raised when the description is not recognized.
+
+    Returns:
+        InputSource: The described input source.
+    """
+    kind, _, location = spec.strip().partition(":")
+    if kind == "http" and location == "":
+        return HttpSource()
+    elif kind in ("stdin", "-") and location == "":
+        return StdinSource()
+    elif kind == "file" and location != "":
+        return FileSource(location)
+    elif kind == "dir" and location != "":
+        return DirectorySource(location)
+    raise ValueError(
+        "Unknown input source '{spec}'. Please use 'http', 'file:<path>', "
+        "'dir:<path>' or 'stdin'".format(spec=spec)
+    )
+
+
+source: InputSource = HttpSource()
@@ -0,0 +1,190 @@
+"""Solves large input files made of independent records (ex. lines) across a pool of\
+     processes.
+
+The file is split into ranges of bytes between records, each range is read and\
+     solved on its own by a process (map), and the partial answers of the ranges are\
+         combined (reduce). Only the path of the file and the offsets of each range are\
+             sent to the processes, so no process holds more of the input than its own\
+                 range, and this process holds none of it.
+"""
+from concurrent.futures import ProcessPoolExecutor
+import mmap
+from os import cpu_count, path
+from typing import Callable, Optional, TypeVar, Union
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# The file mapped into memory, or its contents (as in the tests)
+Buffer = Union[bytes, mmap.mmap]
+
+# Inputs are only split into ranges of at least this many bytes, as starting the
+#  processes takes longer than solving less
+MIN_CHUNK_SIZE = 1 << 20
+
+# Bytes copied out of the file at a time when counting the separators in a range
+COUNT_SIZE = 1 << 20
+
+
+def _count(buffer: Buffer, separator: bytes, start: int, end: int) -> int:
+    """Returns the number of separators between `start` and `end`, copying at most\
+         `COUNT_SIZE` bytes of the buffer at a time.
+
+    Args:
+        buffer (Buffer): The input.
+        separator (bytes): The separator to count.
+        start (int): Where to start counting.
+        end (int): Where to stop counting.
+
+    Returns:
+        int: The number of separators.
+    """
+    count = 0
+    while True:
+        stop = min(start + COUNT_SIZE, end)
+        piece = buffer[start:stop]
+        if stop == end:
+            return count + piece.count(separator)
+        last = piece.rfind(separator)
+        if last == -1:
+            # A separator may still start in the last bytes of the piece
+            start = stop - len(separator) + 1
+            continue
+        # Carry on after the last separator, so none is cut in two
+        count += piece.count(separator, 0, last + len(separator))
+        start += last + len(separator)
+
+
+def _end_of_record(
+    buffer: Buffer, start: int, position: int, length: int, separator: bytes, group: int
+) -> int:
+    """Returns where the first record ending at or after `position` ends (the index\
+         of the separator after it), or -1 if it ends with the input.
+
+    Args:
+        buffer (Buffer): The input.
+        start (int): Where the range holding `position` starts, which is the start\
+             of a record.
+        position (int): Where to look for the end of a record from.
+        length (int): Length of the input, without the whitespace at its end.
+        separator (bytes): Separator between two pieces of a record.
+        group (int): Number of pieces in each record.
+
+    Returns:
+        int: Index of the separator ending the record, or -1.
+    """
+    end = buffer.find(separator, position, length)
+    if end == -1 or group == 1:
+        return end
+    # Separators before `end` since the start of the range, so that `end` is the
+    #  separator after piece number `pieces` (counting from 0) of the range
+    pieces = _count(buffer, separator, start, end)
+    for _ in range(group - 1 - pieces % group):
+        end = buffer.find(separator, end + len(separator), length)
+        if end == -1:
+            break
+    return end
+
+
+def _length(buffer: Buffer) -> int:
+    """Returns the length of the input without the whitespace at its end (as\
+         `str.rstrip()` would remove)."""
+    length = len(buffer)
+    while length > 0 and buffer[length - 1 : length].isspace():
+        length -= 1
+    return length
+
+
+def ranges(
+    buffer: Buffer, chunks: int, separator: bytes = b"\n", group: int = 1
+) -> list[tuple[int, int]]:
+    """Splits the input into at most `chunks` ranges of about the same size, only\
+         between records. A record is `group` pieces of the input separated by\
+             `separator` (ex. a line, three lines or a block between blank lines).
+
+    Args:
+        buffer (Buffer): The input.
+        chunks (int): Number of ranges to split the input into.
+        separator (bytes): Separator between two pieces of a record. Defaults to a\
+             newline.
+        group (int): Number of pieces in each record. Defaults to 1.
+
+    Returns:
+        list[tuple[int, int]]: The start and end of each range, in order and without\
+             the separators between them or the whitespace at the end of the input.
+    """
+    length = _length(buffer)
+    result = []
+    start = 0
+    for index in range(1, chunks):
+        position = max(start, length * index // chunks)
+        end = _end_of_record(buffer, start, position, length, separator, group)
+        if end == -1:
+            break
+        result.append((start, end))
+        start = end + len(separator)
+    result.append((start, length))
+    return result
+
+
+def total(partials: list[int]) -> int:
+    """Returns the sum of the partial answers, for answers that are totals."""
+    return sum(partials)
+
+
+def _map_range(mapper: Callable[[str], T], file_path: str, start: int, end: int) -> T:
+    """Reads a range of the file, and returns its partial answer."""
+    with open(file_path, "rb") as f:
+        f.seek(start)
+        return mapper(f.read(end - start).decode())
+
+
+def run(
+    file_path: str,
+    mapper: Callable[[str], T],
+    reducer: Callable[[list[T]], R],
+    separator: str = "\n",
+    group: int = 1,
+    workers: Optional[int] = None,
+    min_chunk_size: Optional[int] = None,
+) -> R:
+    """Splits the input file into a range per worker (see `ranges`), maps each range\
+         to a partial answer in a pool of processes, and reduces the partial answers.
+
+    Files shorter than two ranges of `min_chunk_size` are read and mapped in this\
+         process, as a single range.
+
+    Args:
+        file_path (str): Path to the input.
+        mapper (Callable[[str], T]): Returns the partial answer for the text of a\
+             range. It is sent to the processes, so it must be a module-level\
+                 function (or a `functools.partial` of one).
+        reducer (Callable[[list[T]], R]): Returns the answer from the partial\
+             answers of the ranges, in order.
+        separator (str): Separator between two pieces of a record. Defaults to a\
+             newline.
+        group (int): Number of pieces in each record. Defaults to 1.
+        workers (Optional[int]): Number of processes. Defaults to the number of\
+             CPU cores.
+        min_chunk_size (Optional[int]): Smallest range worth sending to a process,\
+             in bytes. Defaults to `MIN_CHUNK_SIZE`.
+
+    Returns:
+        R: The answer.
+    """
+    workers = workers or cpu_count() or 1
+    min_chunk_size = min_chunk_size or MIN_CHUNK_SIZE
+    chunks = min(workers, path.getsize(file_path) // min_chunk_size)
+    if chunks < 2:
+        with open(file_path, "r") as f:
+            return reducer([mapper(f.read().rstrip())])
+
+    with open(file_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            file_ranges = ranges(buffer, chunks, separator.encode(), group)
+    with ProcessPoolExecutor(max_workers=len(file_ranges)) as executor:
+        futures = [
+            executor.submit(_map_range, mapper, file_path, start, end)
+            for start, end in file_ranges
+        ]
+        return reducer([future.result() for future in futures])
@@ -0,0 +1,113 @@
+"""Profiles solutions with cProfile and tracemalloc, without changing their code."""
+import cProfile
+from os import getcwd, makedirs, path
+import sys
+from threading import Event, Thread
+import tracemalloc
+from typing import Callable, Optional, TypeVar
+
+# How often the memory sampler checks whether a new peak was reached, in seconds
+SAMPLE_INTERVAL = 0.01
+
+T = TypeVar("T")
+
+
+def default_profile_dir() -> str:
+    """Returns the folder profiles are written to (.conf/profiles)."""
+    return path.join(getcwd(), ".conf", "profiles")
+
+
+def peak_rss() -> int:
+    """Returns the peak resident memory of this process so far, in bytes."""
+    # Only available on Unix
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def profile_call(function: Callable[[], T], pstats_path: str) -> T:
+    """Calls the function under cProfile and writes the statistics to a file.
+
+    The file can be read with `python -m pstats <file>` or tools such as snakeviz.
+
+    Args:
+        function (Callable[[], T]): The function to profile.
+        pstats_path (str): Path of the .pstats file to write.
+
+    Returns:
+        T: The return value of the function.
+    """
+    profiler = cProfile.Profile()
+    result = profiler.runcall(function)
+    makedirs(path.dirname(pstats_path) or ".", exist_ok=True)
+    profiler.dump_stats(pstats_path)
+    return result
+
+
+class _PeakSampler(Thread):
+    """Background thread that keeps a tracemalloc snapshot taken close to the peak\
+         of traced memory."""
+
+    def __init__(self) -> None:
+        super().__init__(daemon=True)
+        self.stop_event = Event()
+        self.snapshot: Optional[tracemalloc.Snapshot] = None
+        self.snapshot_size = -1
+
+    def sample(self) -> None:
+        """Takes a snapshot if more memory is in use than at the last snapshot."""
+        current, _ = tracemalloc.get_traced_memory()
+        if current > self.snapshot_size:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = current
+
+    def run(self) -> None:
+        """Samples until asked to stop."""
+        while not self.stop_event.wait(SAMPLE_INTERVAL):
+            self.sample()
+
+
+def trace_memory_call(
+    function: Callable[[], T], top: int = 10
+) -> tuple[T, int, list[str]]:
+    """Calls the function under tracemalloc and returns its top allocation sites.
+
+    Most memory allocated by a solution is freed by the time it returns, so a\
+         snapshot is taken in the background whenever memory use reaches a new high.\
+             The allocation sites are read from the snapshot closest to the peak.
+
+    Args:
+        function (Callable[[], T]): The function to trace.
+        top (int): Number of allocation sites to return. Defaults to 10.
+
+    Returns:
+        tuple[T, int, list[str]]: The return value of the function, the peak\
+             traced memory in bytes, and a description of each top allocation site.
+    """
+    tracemalloc.start()
+    sampler = _PeakSampler()
+    sampler.start()
+    try:
+        result = function()
+    finally:
+        sampler.stop_event.set()
+        sampler.join()
+        sampler.sample()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    sites = []
+    if sampler.snapshot is not None:
+        snapshot = sampler.snapshot.filter_traces(
+            (
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                # The sampler's own thread
+                tracemalloc.Filter(False, "*threading.py"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+            )
+        )
+        sites = [str(stat) for stat in snapshot.statistics("lineno")[:top]]
+    return result, peak, sites
@@ -0,0 +1,330 @@
+"""Lists the solutions in the package, and what each one provides, without importing\
+     any of them.
+
+The list is kept in a manifest (`solutions.json`) next to this module, generated\
+     with `poetry run python -m misc.generate_registry` whenever a solution is added.
+"""
+from dataclasses import dataclass
+from importlib import import_module
+import json
+from os import listdir, path
+import re
+from types import ModuleType
+from typing import Callable, Optional
+
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import input_sources
+
+MANIFEST_PATH = path.join(path.dirname(__file__), "solutions.json")
+
+# Every solution has a main() function returning the answers to both parts. Solutions
+#  may also define parse(text), returning the parsed input, with part_1(parsed) and
+#  part_2(parsed) to solve each part from it. The input is then only parsed once,
+#  however many parts are solved. Solutions that can parse their input one line at a
+#  time also define parse_lines(lines), so it is streamed from the input source.
+MAIN_FUNCTION = "main"
+PARSE_FUNCTION = "parse"
+LINES_PARSE_FUNCTION = "parse_lines"
+PART_FUNCTIONS = {"1": "part_1", "2": "part_2"}
+
+_manifest: Optional[dict] = None
+
+
+@dataclass(frozen=True)
+class Solution:
+    """A solution in the manifest.
+
+    year (str): Year of challenge.
+    day (str): Day of challenge.
+    module (str): Name of the module holding the solution.
+    parts (dict[str, str]): The function to call for each part. Parts without\
+         their own function map to main().
+    parser (Optional[str]): The function parsing the input for the parts, or None\
+         when the solution does not parse its input separately.
+    lines_parser (Optional[str]): The function parsing the input one line at a\
+         time, or None when the solution can only parse the whole text.
+    """
+
+    year: str
+    day: str
+    module: str
+    parts: dict[str, str]
+    parser: Optional[str] = None
+    lines_parser: Optional[str] = None
+
+    def load(self) -> ModuleType:
+        """Imports and returns the solution's module."""
+        return import_module(self.module)
+
+    def main(self) -> Callable[[], tuple]:
+        """Returns the function that solves both parts."""
+        return getattr(self.load(), MAIN_FUNCTION)
+
+    def parse(self, text: str) -> object:
+        """Parses the input, to solve any of the parts with `solve`.
+
+        Args:
+            text (str): The challenge input.
+
+        Returns:
+            object: The parsed input, or the text itself when the solution does not\
+                 parse its input separately.
+        """
+        if self.parser is None:
+            return text
+        return getattr(self.load(), self.parser)(text)
+
+    def parse_input(self) -> object:
+        """Reads the input from the input source and parses it (see `parse`).
+
+        Solutions with a `lines_parser` parse the input as it is read, one line at\
+             a time, so the whole text is never held in memory.
+
+        Returns:
+            object: The parsed input.
+        """
+        if self.lines_parser is None:
+            return self.parse(aoc_requests.get_input(self.year, self.day))
+        return getattr(self.load(), self.lines_parser)(
+            aoc_requests.get_input_lines(self.year, self.day)
+        )
+
+    def solve(self, part: str, parsed: object) -> object:
+        """Solves one part of the challenge from the parsed input.
+
+        A KeyError is raised when the solution does not have that part.
+
+        Args:
+            part (str): The part to solve ("1" or "2").
+            parsed (object): The input, as returned by `parse`.
+
+        Returns:
+            object: The part's answer.
+        """
+        function_name = self.parts[str(part).strip()]
+        if self.parser is not None:
+            return getattr(self.load(), function_name)(parsed)
+
+        # Solutions without a parser read the input themselves, so it is served to
+        #  them from memory
+        previous_source = input_sources.source
+        input_sources.source = input_sources.TextSource(str(parsed))
+        try:
+            return self.part(part)()
+        finally:
+            input_sources.source = previous_source
+
+    def part(self, part: str) -> Callable[[], object]:
+        """Returns a function that solves one part of the challenge, reading and\
+             parsing the input itself.
+
+        A KeyError is raised when the solution does not have that part.
+
+        Args:
+            part (str): The part to solve ("1" or "2").
+
+        Returns:
+            Callable[[], object]: The function, which returns the part's answer.
+        """
+        function_name = self.parts[str(part).strip()]
+        if self.parser is not None:
+            return lambda: self.solve(part, self.parse_input())
+        function = getattr(self.load(), function_name)
+        if function_name != MAIN_FUNCTION:
+            return function
+        index = sorted(self.parts, key=int).index(str(part).strip())
+        return lambda: function()[index]
+
+
+def key(year: str, day: str) -> tuple[str, str]:
+    """Returns the year and day as they are written in the manifest (ex. "01" is\
+         written as "1")."""
+    return str(int(year)), str(int(day))
+
+
+def _defined_functions(file_path: str) -> set[str]:
+    """Returns the names of the top-level functions in a Python file, without\
+         importing it."""
+    # Only needed when the manifest is built, which is rare
+    import ast
+
+    with open(file_path, "r") as f:
+        tree = ast.parse(f.read(), filename=file_path)
+    return {node.name for node in tree.body if isinstance(node, ast.FunctionDef)}
+
+
+def build_manifest(package_dir: Optional[str] = None) -> dict:
+    """Scans the package for solutions and returns the manifest describing them.
+
+    Solutions live in `year_<year>/day_<day>.py`. Files are parsed, not imported, to\
+         find out which functions they define.
+
+    Args:
+        package_dir (Optional[str]): Folder of the package. Defaults to the folder\
+             of this module.
+
+    Returns:
+        dict: The manifest, which maps each year to its days, and each day to its\
+             module, the function to call for each part and, if it has them, the\
+                 functions parsing its input as a whole and one line at a time.
+    """
+    package_dir = package_dir or path.dirname(__file__)
+    manifest: dict[str, dict[str, dict]] = {}
+    for year_dir in sorted(listdir(package_dir)):
+        year_match = re.fullmatch(r"year_(\d+)", year_dir)
+        if year_match is None or not path.isdir(path.join(package_dir, year_dir)):
+            continue
+        for file_name in sorted(listdir(path.join(package_dir, year_dir))):
+            day_match = re.fullmatch(r"day_(\d+)\.py", file_name)
+            if day_match is None:
+                continue
+            functions = _defined_functions(path.join(package_dir, year_dir, file_name))
+            if MAIN_FUNCTION not in functions:
+                continue
+            year, day = key(year_match.group(1), day_match.group(1))
+            entry = {
+                "module": "advent_of_code.{year_dir}.{module}".format(
+                    year_dir=year_dir, module=file_name[: -len(".py")]
+                ),
+                "parts": {
+                    part: function if function in functions else MAIN_FUNCTION
+                    for part, function in PART_FUNCTIONS.items()
+                },
+            }
+            # The parsed input is only used when every part can be solved from it
+            if PARSE_FUNCTION in functions and set(PART_FUNCTIONS.values()) <= (
+                functions
+            ):
+                entry["parse"] = PARSE_FUNCTION
+                if LINES_PARSE_FUNCTION in functions:
+                    entry["parse_lines"] = LINES_PARSE_FUNCTION
+            manifest.setdefault(year, {})[day] = entry
+
+    # Sort numerically, so the manifest lists day 2 before day 10
+    return {
+        year: dict(sorted(manifest[year].items(), key=lambda d: int(d[0])))
+        for year in sorted(manifest, key=int)
+    }
+
+
+def write_manifest(file_path: str = MANIFEST_PATH) -> dict:
+    """Builds the manifest and writes it to a JSON file.
+
+    Args:
+        file_path (str): Path of the file to write. Defaults to `solutions.json`\
+             next to this module.
+
+    Returns:
+        dict: The manifest that was written.
+    """
+    manifest = build_manifest()
+    with open(file_path, "w") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    return manifest
+
+
+def load_manifest() -> dict:
+    """Returns the manifest, reading it the first time it is needed.
+
+    If the manifest file is missing, the package is scanned instead.
+
+    Returns:
+        dict: The manifest (see `build_manifest`).
+    """
+    global _manifest
+    if _manifest is None:
+        try:
+            with open(MANIFEST_PATH, "r") as f:
+                _manifest = json.load(f)
+        except FileNotFoundError:
+            _manifest = build_manifest()
+    return _manifest
+
+
+def get(year: str, day: str) -> Optional[Solution]:
+    """Returns the solution for a challenge, or None if there is no solution for it.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+
+    Returns:
+        Optional[Solution]: The solution, or None if the challenge is not solved.
+    """
+    try:
+        year, day = key(year, day)
+    except ValueError:
+        return None
+    entry = load_manifest().get(year, {}).get(day)
+    if entry is None:
+        return None
+    return Solution(
+        year=year,
+        day=day,
+        module=entry["module"],
+        parts=entry["parts"],
+        parser=entry.get("parse"),
+        lines_parser=entry.get("parse_lines"),
+    )
+
+
+def solutions(year: Optional[str] = None) -> list[Solution]:
+    """Returns every solution in the manifest, sorted by year and then day.
+
+    Args:
+        year (Optional[str]): Only return solutions for this year. Defaults to all\
+             years.
+
+    Returns:
+        list[Solution]: The solutions.
+    """
+    manifest = load_manifest()
+    years = list(manifest) if year is None else [str(int(year))]
+    found = []
+    for solution_year in years:
+        for day in manifest.get(solution_year, {}):
+            solution = get(solution_year, day)
+            if solution is not None:
+                found.append(solution)
+    return found
+
+
+def require(year: str, day: str) -> Solution:
+    """Returns the solution for a challenge, which must exist.
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+
+    Raises:
+        ModuleNotFoundError: Raised when the challenge has no solution, without\
+             trying to import anything.
+
+    Returns:
+        Solution: The solution.
+    """
+    solution = get(year, day)
+    if solution is None:
+        raise ModuleNotFoundError(
+            "No solution for year {year}, day {day}".format(
+                year=year.strip(), day=day.strip()
+            )
+        )
+    return solution
+
+
+def load_module(year: str, day: str) -> ModuleType:
+    """Imports the module holding the solution for a challenge.
+
+    A ModuleNotFoundError is raised when the challenge has no solution (see\
+         `require`).
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+
+    Returns:
+        ModuleType: The solution's module.
+    """
+    return require(year, day).load()
@@ -0,0 +1,127 @@
+"""Runs the solutions for many challenges at once, each in its own process."""
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from os import cpu_count
+import time
+from typing import Optional, Union
+
+from advent_of_code import input_sources, registry
+
+
+@dataclass
+class DayResult:
+    """The outcome of running the solution for one challenge.
+
+    year (str): Year of challenge.
+    day (str): Day of challenge.
+    answers (tuple): The answer to each part, in order.
+    wall_times (tuple): Seconds elapsed while solving each part. The input is parsed\
+         once, along with the first part.
+    cpu_times (tuple): Seconds of CPU time used while solving each part.
+    error (Optional[str]): The error raised by the solution, if it failed.
+    """
+
+    year: str
+    day: str
+    answers: tuple = field(default_factory=tuple)
+    wall_times: tuple = field(default_factory=tuple)
+    cpu_times: tuple = field(default_factory=tuple)
+    error: Optional[str] = None
+
+    @property
+    def wall_time(self) -> float:
+        """Seconds elapsed while solving every part."""
+        return sum(self.wall_times)
+
+    @property
+    def cpu_time(self) -> float:
+        """Seconds of CPU time used while solving every part."""
+        return sum(self.cpu_times)
+
+
+def discover_solutions(year: Optional[str] = None) -> list[tuple[str, str]]:
+    """Returns the year and day of every solution in the registry, without importing\
+         any of them.
+
+    Args:
+        year (Optional[str]): Only return solutions for this year. Defaults to all\
+             years.
+
+    Returns:
+        list[tuple[str, str]]: (year, day) pairs, sorted by year and then day.
+    """
+    return [(s.year, s.day) for s in registry.solutions(year=year)]
+
+
+def run_day(year: str, day: str, text: str) -> DayResult:
+    """Imports and runs the solution for one challenge, timing each part.
+
+    This runs in a worker process, so it is given the input rather than reading it:\
+         only the parent process uses the input source (and the input cache).
+
+    Args:
+        year (str): Year of challenge.
+        day (str): Day of challenge.
+        text (str): The input of the challenge.
+
+    Returns:
+        DayResult: The answers and timings, or the error if the solution failed.
+    """
+    try:
+        solution = registry.require(year, day)
+        answers, wall_times, cpu_times = [], [], []
+        parsed = None
+        for index, part in enumerate(sorted(solution.parts, key=int)):
+            wall_start, cpu_start = time.perf_counter(), time.process_time()
+            if index == 0:
+                parsed = solution.parse(text)
+            answers.append(solution.solve(part, parsed))
+            wall_times.append(time.perf_counter() - wall_start)
+            cpu_times.append(time.process_time() - cpu_start)
+        return DayResult(
+            year=year,
+            day=day,
+            answers=tuple(answers),
+            wall_times=tuple(wall_times),
+            cpu_times=tuple(cpu_times),
+        )
+    except Exception as exc:
+        return DayResult(year=year, day=day, error=repr(exc))
+
+
+def run_all(
+    solutions: list[tuple[str, str]],
+    source: input_sources.InputSource,
+    max_workers: Optional[int] = None,
+) -> list[DayResult]:
+    """Runs the solutions for many challenges across a pool of processes. The inputs\
+         are read in this process, and a challenge whose input cannot be read fails.
+
+    Args:
+        solutions (list[tuple[str, str]]): (year, day) pairs to run.
+        source (input_sources.InputSource): Where the solutions read their input from.
+        max_workers (Optional[int]): Number of processes. Defaults to the number of\
+             CPU cores.
+
+    Returns:
+        list[DayResult]: The result for each challenge, in the same order as\
+             `solutions`.
+    """
+    if len(solutions) == 0:
+        return []
+    max_workers = min(max_workers or cpu_count() or 1, len(solutions))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        # Each input is read here (while the workers solve the inputs read before
+        #  it), so only this process uses the input source and the input cache
+        results: list[Union[DayResult, Future[DayResult]]] = []
+        for year, day in solutions:
+            try:
+                text = source.read(year, day)
+            except Exception as exc:
+                results.append(DayResult(year=year, day=day, error=repr(exc)))
+                continue
+            results.append(executor.submit(run_day, year, day, text))
+        return [
+            result if isinstance(result, DayResult) else result.result()
+            for result in results
+        ]
@@ -0,0 +1,170 @@
+"""Runs one part of a solution in a separate process, with limits on how long it may\
+     run and how much memory it may use."""
+from dataclasses import dataclass
+import multiprocessing
+from multiprocessing.connection import Connection
+import time
+from typing import Optional
+
+from advent_of_code import input_sources, profiling, registry
+
+OK = "ok"
+TIMEOUT = "timeout"
+MEMORY_LIMIT = "memory_limit"
+ERROR = "error"
+
+
+@dataclass
+class SandboxResult:
+    """The outcome of running one part of a solution in a sandbox.
+
+    part (str): Part of challenge.
+    status (str): `OK`, `TIMEOUT`, `MEMORY_LIMIT` or `ERROR`.
+    answer (object): The answer, when the part was solved.
+    error (Optional[str]): The error raised by the solution, when it failed.
+    wall_time (float): Seconds elapsed while solving the part, or until the process\
+         was stopped.
+    parse_time (Optional[float]): Seconds spent parsing the input before solving\
+         the part, or None if the solution does not parse its input separately or\
+             the process was stopped first.
+    peak_rss (Optional[int]): Peak resident memory of the process in bytes, or None\
+         if the process was stopped before reporting it.
+    """
+
+    part: str
+    status: str
+    answer: object = None
+    error: Optional[str] = None
+    wall_time: float = 0.0
+    parse_time: Optional[float] = None
+    peak_rss: Optional[int] = None
+
+
+def _address_space() -> int:
+    """Returns the size of this process's address space in bytes, or 0 where it\
+         cannot be read (outside Linux)."""
+    try:
+        with open("/proc/self/statm", "r") as f:
+            pages = int(f.read().split()[0])
+    except (OSError, ValueError, IndexError):
+        return 0
+    import resource
+
+    return pages * resource.getpagesize()
+
+
+def _limit_memory(max_memory: int) -> None:
+    """Makes allocations fail with a MemoryError once the process has allocated\
+         `max_memory` more bytes of address space."""
+    import resource
+
+    limit = _address_space() + max_memory
+    _, hard = resource.getrlimit(resource.RLIMIT_AS)
+    if hard != resource.RLIM_INFINITY:
+        limit = min(limit, hard)
+    resource.setrlimit(resource.RLIMIT_AS, (limit, hard))
+
+
+def _run_part(
+    connection: Connection,
+    solution: registry.Solution,
+    part: str,
+    text: str,
+    max_memory: Optional[int],
+) -> None:
+    """Solves the part in the sandboxed process and sends back (status, answer or\
+         error, seconds spent parsing, seconds elapsed, peak RSS)."""
+    input_sources.source = input_sources.TextSource(text)
+    # The solution is imported before the memory limit is set
+    solution.load()
+    if max_memory is not None:
+        _limit_memory(max_memory)
+    parse_time = None
+    start = time.perf_counter()
+    try:
+        parsed = solution.parse(text)
+        if solution.parser is not None:
+            parse_time = time.perf_counter() - start
+            start = time.perf_counter()
+        answer = solution.solve(part, parsed)
+        message: tuple = (OK, answer)
+    except MemoryError:
+        message = (MEMORY_LIMIT, None)
+    except Exception as exc:
+        message = (ERROR, repr(exc))
+    connection.send(
+        message + (parse_time, time.perf_counter() - start, profiling.peak_rss())
+    )
+    connection.close()
+
+
+def run_part(
+    solution: registry.Solution,
+    part: str,
+    text: str,
+    timeout: Optional[float] = None,
+    max_memory: Optional[int] = None,
+) -> SandboxResult:
+    """Solves one part of a challenge in a new process.
+
+    The process is killed when it runs for longer than `timeout`. Once the solution\
+         is imported, the process may only grow its address space by `max_memory`\
+             bytes, which bounds its resident memory: an allocation over the limit\
+                 raises a MemoryError in the solution. Limits on memory are only\
+                     supported on Unix.
+
+    Args:
+        solution (registry.Solution): The solution to run.
+        part (str): Part of challenge.
+        text (str): The input text, read in this process so the sandbox does not\
+             need to access the input source.
+        timeout (Optional[float]): Seconds the part may run for. Defaults to no\
+             limit.
+        max_memory (Optional[int]): Bytes of memory the solution may allocate.\
+             Defaults to no limit.
+
+    Returns:
+        SandboxResult: The answer, or the reason the part was not solved.
+    """
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    process = multiprocessing.Process(
+        target=_run_part,
+        args=(sender, solution, part, text, max_memory),
+        daemon=True,
+    )
+    start = time.perf_counter()
+    process.start()
+    # The child now holds the sending end. Closing this process's copy lets a child
+    #  that dies without answering show up as the end of the pipe.
+    sender.close()
+
+    try:
+        if not receiver.poll(timeout):
+            process.kill()
+            process.join()
+            return SandboxResult(
+                part=part, status=TIMEOUT, wall_time=time.perf_counter() - start
+            )
+        try:
+            status, value, parse_time, wall_time, peak_rss = receiver.recv()
+        except EOFError:
+            # The process died without answering (ex. killed by the system)
+            process.join()
+            return SandboxResult(
+                part=part,
+                status=ERROR,
+                error="The process exited with code {}".format(process.exitcode),
+                wall_time=time.perf_counter() - start,
+            )
+    finally:
+        receiver.close()
+    process.join()
+    return SandboxResult(
+        part=part,
+        status=status,
+        answer=value if status == OK else None,
+        error=value if status == ERROR else None,
+        wall_time=wall_time,
+        parse_time=parse_time,
+        peak_rss=peak_rss,
+    )
@@ -0,0 +1,245 @@
+"""Keeps solutions and inputs loaded in a long-running process, and solves puzzles\
+     for clients over a local socket.
+
+Each request and response is a single line of JSON. A request to solve a puzzle\
+     looks like `{"year": "2022", "day": "1", "part": "2"}`, where `part` is\
+         optional, and may include `input` (the input text) or `input_file` (a path\
+             to it). Otherwise the input is read from the server's input source. The\
+                 server answers with `{"answers": {"2": 45000}, "elapsed": 0.001}`,\
+                     or `{"error": "..."}` if the request failed.
+
+The requests `{"command": "ping"}` and `{"command": "shutdown"}` check that the\
+     server is running, and stop it.
+"""
+import ipaddress
+import json
+from os import getcwd, makedirs, path, remove
+import socket
+import socketserver
+from threading import Lock, Thread
+import time
+from typing import Optional, Union
+
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import input_sources, registry
+
+DEFAULT_ADDRESS = path.join(".conf", "aoc.sock")
+
+# Solutions read their input through the module-level input source, so only one
+#  puzzle is solved at a time
+_solve_lock = Lock()
+
+
+def parse_address(address: str) -> Union[str, tuple[str, int]]:
+    """Returns the socket address for a text address.
+
+    Args:
+        address (str): Either `<host>:<port>` for a TCP socket (ex.\
+             `127.0.0.1:8765`), or the path of a Unix socket.
+
+    Returns:
+        Union[str, tuple[str, int]]: The (host, port) pair, or the socket path.
+    """
+    host, _, port = address.rpartition(":")
+    if host != "" and port.isdigit():
+        return host, int(port)
+    return address
+
+
+def is_loopback(host: str) -> bool:
+    """Returns whether the host only accepts connections from this machine (ex.\
+         `127.0.0.1`, `::1` or `localhost`)."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers each line of JSON sent over the connection."""
+
+    server: "UnixSolverServer | TcpSolverServer"
+
+    def handle(self) -> None:
+        """Reads requests until the client closes the connection."""
+        for line in self.rfile:
+            if line.strip() == b"":
+                continue
+            try:
+                response = self.server.respond(json.loads(line))
+            except Exception as exc:
+                response = {"error": repr(exc)}
+            self.wfile.write(json.dumps(response, default=str).encode() + b"\n")
+            self.wfile.flush()
+            if response.get("stopping", False):
+                Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _SolverMixin:
+    """Solves puzzles for clients, keeping imported solutions and parsed inputs in\
+         memory.
+
+    Only local clients should be able to reach the server, as it reads any input\
+         file it is asked to.
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+    # The parsed input of each challenge read from the input source
+    inputs: dict[tuple[str, str], object]
+
+    def respond(self, request: dict) -> dict:
+        """Returns the response to a request.
+
+        Args:
+            request (dict): The request sent by a client.
+
+        Returns:
+            dict: The response.
+        """
+        command = request.get("command", "solve")
+        if command == "ping":
+            return {"ok": True}
+        if command == "shutdown":
+            return {"ok": True, "stopping": True}
+        if command != "solve":
+            return {"error": "Unknown command '{}'".format(command)}
+
+        year, day = str(request["year"]).strip(), str(request["day"]).strip()
+        solution = registry.get(year, day)
+        if solution is None:
+            return {"error": "Sorry, there's no answer for that day yet :("}
+        parts = (
+            sorted(solution.parts, key=int)
+            if request.get("part") is None
+            else [str(request["part"]).strip()]
+        )
+
+        with _solve_lock:
+            start = time.perf_counter()
+            parsed = self._parse_input(request, solution)
+            answers = {part: solution.solve(part, parsed) for part in parts}
+            elapsed = time.perf_counter() - start
+        return {"answers": answers, "elapsed": elapsed}
+
+    def _parse_input(self, request: dict, solution: registry.Solution) -> object:
+        """Returns the parsed input sent with the request, or read from the file it\
+             names. Otherwise, the input is read from the input source and parsed\
+                 once, and kept for the next requests (the parts do not change it)."""
+        year, day = solution.year, solution.day
+        if request.get("input") is not None:
+            return solution.parse(str(request["input"]).rstrip())
+        if request.get("input_file") is not None:
+            return solution.parse(
+                input_sources.FileSource(request["input_file"]).read(year, day)
+            )
+        key = registry.key(year, day)
+        if key not in self.inputs:
+            self.inputs[key] = solution.parse(aoc_requests.get_input(year, day))
+        return self.inputs[key]
+
+
+class UnixSolverServer(_SolverMixin, socketserver.ThreadingUnixStreamServer):
+    """Solver server listening on a Unix socket."""
+
+    def __init__(self, address: str) -> None:
+        """Listens on the socket file at `address`, replacing any stale one.
+
+        Args:
+            address (str): Path of the socket file.
+        """
+        if path.exists(address):
+            # Left behind by a server that did not shut down cleanly
+            remove(address)
+        makedirs(path.dirname(address) or ".", exist_ok=True)
+        self.inputs = {}
+        self.socket_path = address
+        super().__init__(address, _RequestHandler)
+
+    def server_close(self) -> None:
+        """Closes the socket and removes the socket file."""
+        super().server_close()
+        if path.exists(self.socket_path):
+            remove(self.socket_path)
+
+
+class TcpSolverServer(_SolverMixin, socketserver.ThreadingTCPServer):
+    """Solver server listening on a TCP socket, for platforms without Unix\
+         sockets."""
+
+    def __init__(self, address: tuple[str, int]) -> None:
+        """Listens on the (host, port) pair.
+
+        Args:
+            address (tuple[str, int]): Host and port. Port 0 picks a free port.
+        """
+        self.inputs = {}
+        super().__init__(address, _RequestHandler)
+
+
+def send_request(
+    address: Union[str, tuple[str, int]], request: dict, timeout: float = 60.0
+) -> dict:
+    """Sends a request to a running server and returns its response.
+
+    Args:
+        address (Union[str, tuple[str, int]]): The server's socket path, or its\
+             (host, port) pair.
+        request (dict): The request (see the module's documentation).
+        timeout (float): Seconds to wait for the response. Defaults to 60.
+
+    Raises:
+        ConnectionError: Raised when the server closes the connection without\
+             answering.
+
+    Returns:
+        dict: The server's response.
+    """
+    family = socket.AF_INET if isinstance(address, tuple) else socket.AF_UNIX
+    with socket.socket(family, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(address)
+        client.sendall(json.dumps(request).encode() + b"\n")
+        with client.makefile("rb") as response:
+            line = response.readline()
+    if line == b"":
+        raise ConnectionError("The server closed the connection without answering")
+    return json.loads(line)
+
+
+def default_address() -> str:
+    """Returns the default socket path (.conf/aoc.sock in the working directory)."""
+    return path.join(getcwd(), DEFAULT_ADDRESS)
+
+
+def serve(
+    address: Optional[str] = None,
+) -> Union[UnixSolverServer, TcpSolverServer]:
+    """Creates a server listening on the address. Call `serve_forever()` to run it.
+
+    Args:
+        address (Optional[str]): Socket path or `<host>:<port>`, where the host\
+             must be a loopback address. Defaults to .conf/aoc.sock in the working\
+                 directory.
+
+    Raises:
+        ValueError: Raised when the host is not a loopback address, as clients on\
+             other machines could read any file the server can.
+
+    Returns:
+        Union[UnixSolverServer, TcpSolverServer]: The server.
+    """
+    socket_address = parse_address(address or default_address())
+    if isinstance(socket_address, tuple):
+        if not is_loopback(socket_address[0]):
+            raise ValueError(
+                "The server reads any input file it is asked to, so it only listens"
+                " on loopback addresses (ex. 127.0.0.1), not {host}".format(
+                    host=socket_address[0]
+                )
+            )
+        return TcpSolverServer(socket_address)
+    return UnixSolverServer(socket_address)
@@ -0,0 +1,106 @@
+"""Records how long each phase of a run takes (ex. downloading the input, parsing it\
+     and solving each part) as spans, which can be written as a Chrome trace.
+
+Spans are only recorded while `tracer` is set, so the phases can always be\
+     instrumented: otherwise, a span costs a single check.
+"""
+from contextlib import contextmanager
+from functools import wraps
+import json
+import os
+import threading
+import time
+from typing import Callable, cast, Iterator, Optional, TypeVar
+
+F = TypeVar("F", bound=Callable)
+
+
+class Tracer:
+    """Collects spans as Chrome trace events (see `write`)."""
+
+    def __init__(self) -> None:
+        """Starts the clock that the spans are timed against."""
+        self.events: list[dict] = []
+        self.origin = time.perf_counter_ns()
+
+    def add_span(self, name: str, start: int, end: int, args: dict) -> None:
+        """Records a span that ran from `start` to `end` (from `perf_counter_ns`).
+
+        Args:
+            name (str): Name of the phase.
+            start (int): When the span started, in nanoseconds.
+            end (int): When the span ended, in nanoseconds.
+            args (dict): Details shown with the span (ex. the year and day).
+        """
+        self.events.append(
+            {
+                "name": name,
+                "cat": "aoc",
+                # A complete event, holding both the start and the duration
+                "ph": "X",
+                "ts": (start - self.origin) / 1000,
+                "dur": (end - start) / 1000,
+                "pid": os.getpid(),
+                "tid": threading.get_ident(),
+                "args": args,
+            }
+        )
+
+    def write(self, file_path: str) -> None:
+        """Writes the spans in the Chrome trace event format, which can be opened in\
+             chrome://tracing or https://ui.perfetto.dev."""
+        with open(file_path, "w") as f:
+            json.dump({"traceEvents": self.events, "displayTimeUnit": "ms"}, f)
+
+
+# The tracer spans are recorded to, or None when not tracing
+tracer: Optional[Tracer] = None
+
+
+@contextmanager
+def instrument(name: str, **args: object) -> Iterator[None]:
+    """Records the time spent in the `with` block as a span, when tracing.
+
+    Args:
+        name (str): Name of the phase (ex. "parse").
+        **args (object): Details shown with the span (ex. the year and day).
+
+    Yields:
+        None: Nothing, the block is timed.
+    """
+    active = tracer
+    if active is None:
+        yield
+        return
+    start = time.perf_counter_ns()
+    try:
+        yield
+    finally:
+        active.add_span(name, start, time.perf_counter_ns(), args)
+
+
+def traced(name: str) -> Callable[[F], F]:
+    """Returns a decorator recording each call of a function as a span (see\
+         `instrument`). The module of the function is shown with the span.
+
+    Args:
+        name (str): Name of the phase (ex. "part_1").
+
+    Returns:
+        Callable[[F], F]: The decorator.
+    """
+
+    def decorate(function: F) -> F:
+        """Wraps the function in a span."""
+
+        @wraps(function)
+        def wrapper(*args: object, **kwargs: object) -> object:
+            """Calls the function, in a span when tracing."""
+            if tracer is None:
+                return function(*args, **kwargs)
+            with instrument(name, module=function.__module__):
+                return function(*args, **kwargs)
+
+        return cast(F, wrapper)
+
+    return decorate
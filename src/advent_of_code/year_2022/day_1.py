@@ -1,59 +1,156 @@
 """Answer for year 2022, day 1."""
-from advent_of_code import advent_of_code_requests as aoc_requests
+import heapq
+from itertools import chain
+from typing import Iterable, Iterator, Optional
 
+from advent_of_code import map_reduce
+from advent_of_code import tracing
 
-def get_input() -> list:
+
+def get_input() -> str:
     """Returns the input for the challenge."""
-    return aoc_requests.get_input("2022", "1").split("\n")
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input("2022", "1")
+
+
+def get_input_lines() -> Iterator[str]:
+    """Returns the input for the challenge, one line at a time."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input_lines("2022", "1")
+
+
+def parse(text: str) -> tuple[int, ...]:
+    """Returns the sum of each block of numbers in the input (see `parse_lines`).
+
+    Args:
+        text (str): The challenge input.
+
+    Returns:
+        tuple[int, ...]: The sum of each block.
+    """
+    return parse_lines(text.split("\n"))
+
+
+@tracing.traced("parse")
+def parse_lines(lines: Iterable[str]) -> tuple[int, ...]:
+    """Returns the sum of each block of numbers in the input, where blocks are\
+         separated by empty lines.
+
+    The lines are read in a single pass, so only the running sum and the sums of\
+         the blocks are kept in memory.
+
+    Args:
+        lines (Iterable[str]): The lines of the challenge input.
 
+    Returns:
+        tuple[int, ...]: The sum of each block.
+    """
+    # A single pass keeping a running sum is faster than splitting the input into
+    #  blocks and then summing each one
+    block_sums = []
+    loc_sum = 0
+    for line in lines:
+        if line:
+            loc_sum += int(line)
+        else:
+            block_sums.append(loc_sum)
+            loc_sum = 0
+    block_sums.append(loc_sum)
+    return tuple(block_sums)
 
-def part_1_solution() -> int:
+
+def part_1_solution(block_sums: tuple[int, ...]) -> int:
     """Calculates the max value separated by newlines.
 
+    Args:
+        block_sums (tuple[int, ...]): The sum of each block (see `parse`).
+
     Returns:
         int: max sum separated by newlines.
     """
-    input = get_input()
     curr_max_sum = 0
-    loc_max_sum = 0
-    count = 1
-    for i in input:
-        if i == "" or count == len(input):
-            if curr_max_sum < loc_max_sum:
-                curr_max_sum = loc_max_sum
-            loc_max_sum = 0
-        else:
-            loc_max_sum += int(i)
-        count += 1
+    for loc_max_sum in block_sums:
+        if curr_max_sum < loc_max_sum:
+            curr_max_sum = loc_max_sum
     return curr_max_sum
 
 
-def part_2_solution() -> int:
+def part_2_solution(block_sums: tuple[int, ...]) -> int:
     """Returns the sum of the three highest sums (separated by newlines).
 
+    Args:
+        block_sums (tuple[int, ...]): The sum of each block (see `parse`).
+
     Returns:
         int: Sum of the three highest sums.
     """
-    input = get_input()
     top_three_sums = [0, 0, 0]
-    loc_max_sum = 0
-    count = 1
-    for i in input:
-        if i == "" or count == len(input):
-            if min(top_three_sums) < loc_max_sum:
-                top_three_sums.remove(min(top_three_sums))
-                top_three_sums.append(loc_max_sum)
-            loc_max_sum = 0
-        else:
-            loc_max_sum += int(i)
-        count += 1
+    for loc_max_sum in block_sums:
+        if min(top_three_sums) < loc_max_sum:
+            top_three_sums.remove(min(top_three_sums))
+            top_three_sums.append(loc_max_sum)
     return sum(top_three_sums)
 
 
+@tracing.traced("part_1")
+def part_1(parsed: tuple[int, ...]) -> int:
+    """Returns the answer to part 1."""
+    return part_1_solution(parsed)
+
+
+@tracing.traced("part_2")
+def part_2(parsed: tuple[int, ...]) -> int:
+    """Returns the answer to part 2."""
+    return part_2_solution(parsed)
+
+
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
+def _largest_block_sums(text: str) -> tuple[int, ...]:
+    """Returns the three largest block sums of a chunk of the input, which are all\
+         that either part needs from it."""
+    return tuple(heapq.nlargest(3, parse(text)))
+
+
+def _merge_largest(partials: list[tuple[int, ...]]) -> tuple[int, ...]:
+    """Returns the three largest block sums of the whole input, from each chunk's."""
+    return tuple(heapq.nlargest(3, chain.from_iterable(partials)))
+
+
+def solve_chunked(file_path: str, part: int, workers: Optional[int] = None) -> int:
+    """Returns the same answer as `solve`, with a large input file split between\
+         blocks and parsed across a pool of processes (see `map_reduce.run`).
+
+    Args:
+        file_path (str): Path to the challenge input.
+        part (int): Part of the challenge (1 or 2).
+        workers (Optional[int]): Number of processes. Defaults to the number of\
+             CPU cores.
+
+    Returns:
+        int: The answer to the part.
+    """
+    largest = map_reduce.run(
+        file_path,
+        _largest_block_sums,
+        _merge_largest,
+        separator="\n\n",
+        workers=workers,
+    )
+    return {1: part_1, 2: part_2}[part](largest)
+
+
 def main() -> tuple:
     """Returns solutions to both parts of the challenge.
 
     Returns:
         tuple: A tuple consisting of the answer for part 1 and part 2 of the challenge.
     """
-    return part_1_solution(), part_2_solution()
+    parsed = parse_lines(get_input_lines())
+    return part_1(parsed), part_2(parsed)
@@ -1,11 +1,12 @@
 """My solution for year 200 day 10."""
 from dataclasses import dataclass
 from os import linesep
+from typing import Callable, Iterable, Iterator, Union
 
-from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import tracing
 
 
-@dataclass
+@dataclass(frozen=True)
 class Signal:
     """Represents a signal in the instruction set."""
 
@@ -29,34 +30,67 @@ class Crt:
     display: list
 
 
-def get_input() -> list[Signal]:
-    """Returns the challenge input as a list of Signal dataclass objects.
+def get_input() -> str:
+    """Returns the challenge input."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input(year="2022", day="10")
+
+
+def get_input_lines() -> Iterator[str]:
+    """Returns the challenge input, one line at a time."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input_lines(year="2022", day="10")
+
+
+def parse(text: str) -> tuple[Signal, ...]:
+    """Returns the challenge input as Signal dataclass objects (see `parse_lines`).
+
+    Args:
+        text (str): The challenge input.
+
+    Returns:
+        tuple[Signal, ...]: Each of the challenge instructions.
+    """
+    return parse_lines(text.split("\n"))
+
+
+@tracing.traced("parse")
+def parse_lines(lines: Iterable[str]) -> tuple[Signal, ...]:
+    """Returns the challenge input as Signal dataclass objects, reading the lines in a\
+         single pass.
+
+    Args:
+        lines (Iterable[str]): The lines of the challenge input.
 
     Returns:
-        list[Signal]: The challenge instructions.
+        tuple[Signal, ...]: Each of the challenge instructions.
     """
-    return [
-        Signal(ins=line.split(" ")[0], add=0)
-        if len(line.split(" ")) == 1
-        else Signal(ins=line.split(" ")[0], add=int(line.split(" ")[1]))
-        for line in aoc_requests.get_input(year="2022", day="10").split("\n")
-    ]
+    signals = []
+    for line in lines:
+        args = line.split()
+        if len(args) == 1:
+            signals.append(Signal(ins=args[0], add=0))
+        elif args:
+            signals.append(Signal(ins=args[0], add=int(args[1])))
+    return tuple(signals)
 
 
-def part_1_solution(signal_cycles: list) -> int:
+def part_1_solution(instructions: tuple[Signal, ...], signal_cycles: list) -> int:
     """Applies instructions to the CPU and returns the sum of signal strengths at\
          the cycles included in `signal_cycles`.
 
     Each signal strength is the resulting value of `cycle number * register value`.
 
     Args:
+        instructions (tuple[Signal, ...]): The challenge instructions (see `parse`).
         signal_cycles (list): The cycles at which the signal strength should be\
              considered.
 
     Returns:
         int: The sum of all signal strengths.
     """
-    instructions = get_input()
     cpu = Cpu(cycle=0, register=1)
     signal_strengths = []
     s_index = 0
@@ -79,14 +113,16 @@ def part_1_solution(signal_cycles: list) -> int:
     return sum(signal_strengths)
 
 
-def part_2_solution() -> str:
+def part_2_solution(instructions: tuple[Signal, ...]) -> str:
     """Prints out challenge instructions on the cathode ray tube (dataclass object)\
          and returns a string representing the screen.
 
+    Args:
+        instructions (tuple[Signal, ...]): The challenge instructions (see `parse`).
+
     Returns:
         str: The display on as seen on the cathode ray tube.
     """
-    instructions = get_input()
     cpu = Cpu(cycle=0, register=1)
     crt = Crt(cycle=0, display=[])
 
@@ -114,9 +150,31 @@ def part_2_solution() -> str:
     return linesep + linesep.join(["".join(line) for line in crt.display])
 
 
+@tracing.traced("part_1")
+def part_1(parsed: tuple[Signal, ...]) -> int:
+    """Returns the sum of the signal strengths during the 20th, 60th, 100th, 140th,\
+         180th, and 220th cycles."""
+    return part_1_solution(parsed, signal_cycles=[20, 60, 100, 140, 180, 220])
+
+
+@tracing.traced("part_2")
+def part_2(parsed: tuple[Signal, ...]) -> str:
+    """Returns the display of the cathode ray tube."""
+    return part_2_solution(parsed)
+
+
+def solve(text: str, part: int) -> Union[int, str]:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    # The parts return different types, so the type of the lookup is spelled out
+    parts: dict[int, Callable[[tuple[Signal, ...]], Union[int, str]]] = {
+        1: part_1,
+        2: part_2,
+    }
+    return parts[part](parse(text))
+
+
 def main() -> tuple:
     """Returns the answer for parts 1 and 2 as a tuple."""
-    return (
-        part_1_solution(signal_cycles=[20, 60, 100, 140, 180, 220]),
-        part_2_solution(),
-    )
+    parsed = parse_lines(get_input_lines())
+    return part_1(parsed), part_2(parsed)
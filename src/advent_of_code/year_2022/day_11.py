@@ -1,9 +1,10 @@
 """My solution for year 2022, Day 11."""
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from functools import reduce
 import operator as op
 
-from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import parsing
+from advent_of_code import tracing
 
 
 @dataclass
@@ -23,23 +24,13 @@ class Monkey:
     test_false (int): which monkey to throw the item to if test fails.
     """
 
-    id: int
-    items: list
-    modifier: tuple
-    test: int
-    test_true: int
-    test_false: int
-    inspect_count: int
-
-    def __init__(self) -> None:
-        """Initialize all items to default values at first."""
-        self.id = 0
-        self.items = []
-        self.modifier = ()
-        self.test = 0
-        self.test_true = 0
-        self.test_false = 0
-        self.inspect_count = 0
+    id: int = 0
+    items: list = field(default_factory=list)
+    modifier: tuple = ()
+    test: int = 0
+    test_true: int = 0
+    test_false: int = 0
+    inspect_count: int = 0
 
 
 def _simplify_operation(line: str) -> tuple:
@@ -88,38 +79,42 @@ def _simplify_operation(line: str) -> tuple:
     return operator, right
 
 
-def get_input() -> list:
-    """Reads the challenge input, generates a list of `Monkey` dataclass objects, and\
-         returns the list of monkeys.
+def get_input() -> str:
+    """Returns the challenge input."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input(year="2022", day="11")
+
+
+@tracing.traced("parse")
+def parse(text: str) -> tuple[Monkey, ...]:
+    """Reads the challenge input, generates `Monkey` dataclass objects, and returns\
+         them.
+
+    The monkeys hold their starting items. The simulation throws items between\
+         monkeys, so it works on copies of them (see\
+             `return_two_most_active_monkeys`).
+
+    Args:
+        text (str): The challenge input.
 
     Returns:
-        list: List of `Monkey` dataclass objects
+        tuple[Monkey, ...]: The `Monkey` dataclass objects, in order of their id.
     """
     monkeys: list[Monkey] = []
-    monkey = Monkey()
-    for line in aoc_requests.get_input(year="2022", day="11").split("\n"):
-        if line == "":
-            monkeys.append(monkey)
-            monkey = Monkey()
-            continue
-        line_args = line.strip().split(":")
-        if line_args[1] == "":
-            monkey.id = int(line_args[0].split(" ")[1])
-        elif line_args[0] == "Starting items":
-            monkey.items = [int(i.strip()) for i in line_args[1].split(",")]
-        elif line_args[0] == "Operation":
-            monkey.modifier = _simplify_operation(line_args[1])
-        elif line_args[0] == "Test":
-            monkey.test = int(line_args[1].split(" ")[-1])
-        elif line_args[0] == "If true":
-            monkey.test_true = int(line_args[1].split(" ")[-1])
-        elif line_args[0] == "If false":
-            monkey.test_false = int(line_args[1].split(" ")[-1])
-
-    if monkey.id > 0:
+    for block in parsing.blocks(text):
+        # Each monkey is described by the same six lines, in the same order. The id
+        #  is the first number, and the test and the monkeys to throw to are the last.
+        lines = block.split("\n")
+        numbers = parsing.ints(block)
+        monkey = Monkey()
+        monkey.id = numbers[0]
+        monkey.items = parsing.ints(lines[1])
+        monkey.modifier = _simplify_operation(lines[2].partition(":")[2])
+        monkey.test, monkey.test_true, monkey.test_false = numbers[-3:]
         monkeys.append(monkey)
 
-    return monkeys
+    return tuple(monkeys)
 
 
 def eval_expr_from_str(left: int, operator: str, right: int) -> int:
@@ -147,11 +142,15 @@ def eval_expr_from_str(left: int, operator: str, right: int) -> int:
     return operators[operator](left, right)
 
 
-def return_two_most_active_monkeys(reduce_stress_level: bool, cycles: int) -> tuple:
+def return_two_most_active_monkeys(
+    starting_monkeys: tuple[Monkey, ...], reduce_stress_level: bool, cycles: int
+) -> tuple:
     """Simulates the number of `cycles` monkey throws, and returns the activity levels\
          of the two most active monkeys.
 
     Args:
+        starting_monkeys (tuple[Monkey, ...]): The monkeys with their starting items\
+             (see `parse`). They are not changed.
         reduce_stress_level (bool): Indicate whether the stress level is reduced after\
              each throw. If this is True, the stress level for each item is floor\
                  divided by 3.
@@ -160,7 +159,9 @@ def return_two_most_active_monkeys(reduce_stress_level: bool, cycles: int) -> tu
     Returns:
         tuple: The two most active monkeys as a tuple.
     """
-    monkeys: list[Monkey] = get_input()
+    # Only the lists of items change (the notes on each monkey are shared), so each
+    #  monkey is copied with its own list of items
+    monkeys = [replace(m, items=list(m.items)) for m in starting_monkeys]
 
     # Calculate the LCM of all test values.
     lcm = reduce(op.mul, [m.test for m in monkeys], 1)
@@ -186,8 +187,29 @@ def return_two_most_active_monkeys(reduce_stress_level: bool, cycles: int) -> tu
     return (activity[0], activity[1])
 
 
+@tracing.traced("part_1")
+def part_1(parsed: tuple[Monkey, ...]) -> int:
+    """Returns the monkey business after 20 rounds, with the stress level reduced\
+         after each inspection."""
+    s1 = return_two_most_active_monkeys(parsed, reduce_stress_level=True, cycles=20)
+    return s1[0] * s1[1]
+
+
+@tracing.traced("part_2")
+def part_2(parsed: tuple[Monkey, ...]) -> int:
+    """Returns the monkey business after 10000 rounds, without reducing the stress\
+         level."""
+    s2 = return_two_most_active_monkeys(parsed, reduce_stress_level=False, cycles=10000)
+    return s2[0] * s2[1]
+
+
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
 def main() -> tuple:
     """Returns the solutions for parts 1 and 2 as a tuple."""
-    s1 = return_two_most_active_monkeys(reduce_stress_level=True, cycles=20)
-    s2 = return_two_most_active_monkeys(reduce_stress_level=False, cycles=10000)
-    return (s1[0] * s1[1], s2[0] * s2[1])
+    parsed = parse(get_input())
+    return part_1(parsed), part_2(parsed)
@@ -1,14 +1,53 @@
 """My solution for year 2022, day 2."""
-from advent_of_code import advent_of_code_requests as aoc_requests
+from functools import partial
+from typing import Iterable, Iterator, Optional
 
+from advent_of_code import map_reduce
+from advent_of_code import tracing
 
-def get_input() -> list:
-    """Returns the challenge input as a nested list."""
-    raw_text = aoc_requests.get_input("2022", "2")
-    return [line.split(" ") for line in raw_text.strip().split("\n")]
 
+def get_input() -> str:
+    """Returns the challenge input."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
 
-def part_1_solution() -> int:
+    return aoc_requests.get_input("2022", "2")
+
+
+def get_input_lines() -> Iterator[str]:
+    """Returns the challenge input, one line at a time."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input_lines("2022", "2")
+
+
+def parse(text: str) -> tuple[tuple[str, ...], ...]:
+    """Returns each game of the challenge input as a tuple of two letters (see\
+         `parse_lines`).
+
+    Args:
+        text (str): The challenge input.
+
+    Returns:
+        tuple[tuple[str, ...], ...]: The games.
+    """
+    return parse_lines(text.split("\n"))
+
+
+@tracing.traced("parse")
+def parse_lines(lines: Iterable[str]) -> tuple[tuple[str, ...], ...]:
+    """Returns each game of the challenge input as a tuple of two letters, reading\
+         the lines in a single pass.
+
+    Args:
+        lines (Iterable[str]): The lines of the challenge input.
+
+    Returns:
+        tuple[tuple[str, ...], ...]: The games.
+    """
+    return tuple([tuple(line.split()) for line in lines if line])
+
+
+def part_1_solution(games: tuple[tuple[str, ...], ...]) -> int:
     """Calculates the final score based on the first part's rules and returns it.
 
     Rules:
@@ -19,6 +58,9 @@ def part_1_solution() -> int:
             0, 3, 6 points for losing, drawing, and winning respectively.
             PLUS 1, 2, 3 points for playing Rock, Paper, and Scissors, respectively.
 
+    Args:
+        games (tuple[tuple[str, ...], ...]): The games (see `parse`).
+
     Returns:
         int: The final score achieved by the player.
     """
@@ -31,21 +73,23 @@ def part_1_solution() -> int:
         points_dict[game] = 0
     for i, game in enumerate(("X", "Y", "Z")):
         points_dict[game] = i + 1
-    games = get_input()
     score = 0
-    for game in games:
-        score += points_dict["".join([game[0], game[1]])]
-        score += points_dict[game[1]]
+    for moves in games:
+        score += points_dict["".join([moves[0], moves[1]])]
+        score += points_dict[moves[1]]
     return score
 
 
-def part_2_solution() -> int:
+def part_2_solution(games: tuple[tuple[str, ...], ...]) -> int:
     """Calculates the score based on the second part's rules and returns it.
 
         The rules have changed. Now, X, Y, Z indicate that we need to lose, draw,
         and win the game, respectively. The accumulated score based on result and
         our choice still applies.
 
+    Args:
+        games (tuple[tuple[str, ...], ...]): The games (see `parse`).
+
     Returns:
         int: The final score achieved by the player.
     """
@@ -58,18 +102,57 @@ def part_2_solution() -> int:
         points_dict[game] = 3
     for i, game in enumerate(("X", "Y", "Z")):
         points_dict[game] = i * 3
-    games = get_input()
     score = 0
-    for game in games:
-        score += points_dict["".join([game[0], game[1]])]
-        score += points_dict[game[1]]
+    for moves in games:
+        score += points_dict["".join([moves[0], moves[1]])]
+        score += points_dict[moves[1]]
     return score
 
 
+@tracing.traced("part_1")
+def part_1(parsed: tuple[tuple[str, ...], ...]) -> int:
+    """Returns the answer to part 1."""
+    return part_1_solution(parsed)
+
+
+@tracing.traced("part_2")
+def part_2(parsed: tuple[tuple[str, ...], ...]) -> int:
+    """Returns the answer to part 2."""
+    return part_2_solution(parsed)
+
+
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
+def solve_chunked(file_path: str, part: int, workers: Optional[int] = None) -> int:
+    """Returns the same answer as `solve`, with a large input file split between\
+         rounds (lines) and solved across a pool of processes (see\
+             `map_reduce.run`).
+
+    Args:
+        file_path (str): Path to the puzzle input.
+        part (int): Part of the puzzle (1 or 2).
+        workers (Optional[int]): Number of processes. Defaults to the number of\
+             CPU cores.
+
+    Returns:
+        int: The answer to the part.
+    """
+    # Each round is scored on its own, so the answer is the sum of the
+    #  answers for each range
+    return map_reduce.run(
+        file_path, partial(solve, part=part), map_reduce.total, workers=workers
+    )
+
+
 def main() -> tuple:
     """Returns part 1 and part 2 solutions as a tuple.
 
     Returns:
         tuple: tuple containing part 1 and part 2 solutions.
     """
-    return part_1_solution(), part_2_solution()
+    parsed = parse_lines(get_input_lines())
+    return part_1(parsed), part_2(parsed)
@@ -1,10 +1,49 @@
 """My solution for year 2022 day 3."""
-from advent_of_code import advent_of_code_requests as aoc_requests
+from functools import partial
+from typing import Iterable, Iterator, Optional
 
+from advent_of_code import map_reduce
+from advent_of_code import tracing
 
-def get_input() -> list:
-    """Returns the puzzle input as a list."""
-    return aoc_requests.get_input("2022", "3").split("\n")
+
+def get_input() -> str:
+    """Returns the puzzle input."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input("2022", "3")
+
+
+def get_input_lines() -> Iterator[str]:
+    """Returns the puzzle input, one line at a time."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input_lines("2022", "3")
+
+
+def parse(text: str) -> tuple[str, ...]:
+    """Returns the rucksacks in the puzzle input, one per line (see `parse_lines`).
+
+    Args:
+        text (str): The puzzle input.
+
+    Returns:
+        tuple[str, ...]: The items in each rucksack.
+    """
+    return parse_lines(text.split("\n"))
+
+
+@tracing.traced("parse")
+def parse_lines(lines: Iterable[str]) -> tuple[str, ...]:
+    """Returns the rucksacks in the puzzle input, one per line, reading the lines in a\
+         single pass.
+
+    Args:
+        lines (Iterable[str]): The lines of the puzzle input.
+
+    Returns:
+        tuple[str, ...]: The items in each rucksack.
+    """
+    return tuple([line for line in lines if line])
 
 
 def construct_priority_dict() -> dict:
@@ -29,7 +68,7 @@ def construct_priority_dict() -> dict:
     return priority
 
 
-def part_1_solution() -> int:
+def part_1_solution(rucksacks: tuple[str, ...]) -> int:
     """Calculate the total priority of the rucksack.
 
     A rucksack contains two components. Each component is represented by half of the
@@ -40,11 +79,13 @@ def part_1_solution() -> int:
     components and calculates its priority (1-26 for a-z, 27-52 for A-Z). The total
     of all the rucksacks is returned.
 
+    Args:
+        rucksacks (tuple[str, ...]): The rucksacks (see `parse`).
+
     Returns:
         int: total priority of all rucksacks.
     """
     priority = construct_priority_dict()
-    rucksacks = get_input()
     total_priority = 0
 
     for r in rucksacks:
@@ -55,7 +96,7 @@ def part_1_solution() -> int:
     return total_priority
 
 
-def part_2_solution() -> int:
+def part_2_solution(rucksacks: tuple[str, ...]) -> int:
     """Calculate the total priority of the rucksack.
 
     For Part 2, essentially the same process as part 1 is used. The difference is that
@@ -63,11 +104,13 @@ def part_2_solution() -> int:
     string, the only item occurring in three lines is used to calculate the priority
     instead.
 
+    Args:
+        rucksacks (tuple[str, ...]): The rucksacks (see `parse`).
+
     Returns:
         int: total priority of all rucksacks.
     """
     priority = construct_priority_dict()
-    rucksacks = get_input()
     total_priority = 0
     group = []
 
@@ -82,6 +125,46 @@ def part_2_solution() -> int:
     return total_priority
 
 
+@tracing.traced("part_1")
+def part_1(parsed: tuple[str, ...]) -> int:
+    """Returns the answer to part 1."""
+    return part_1_solution(parsed)
+
+
+@tracing.traced("part_2")
+def part_2(parsed: tuple[str, ...]) -> int:
+    """Returns the answer to part 2."""
+    return part_2_solution(parsed)
+
+
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
+def solve_chunked(file_path: str, part: int, workers: Optional[int] = None) -> int:
+    """Returns the same answer as `solve`, with a large input file split between\
+         groups of three rucksacks and solved across a pool of processes (see\
+             `map_reduce.run`).
+
+    Args:
+        file_path (str): Path to the puzzle input.
+        part (int): Part of the puzzle (1 or 2).
+        workers (Optional[int]): Number of processes. Defaults to the number of\
+             CPU cores.
+
+    Returns:
+        int: The answer to the part.
+    """
+    # Each group of three rucksacks (and each rucksack in it) is scored on its own,
+    #  so the answer is the sum of the answers for each range
+    return map_reduce.run(
+        file_path, partial(solve, part=part), map_reduce.total, group=3, workers=workers
+    )
+
+
 def main() -> tuple:
     """Returns the solutions for part 1 and part 2 as a tuple."""
-    return part_1_solution(), part_2_solution()
+    parsed = parse_lines(get_input_lines())
+    return part_1(parsed), part_2(parsed)
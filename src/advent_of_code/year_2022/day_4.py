@@ -1,35 +1,82 @@
 """My solution for year 2022, day 4."""
-from advent_of_code import advent_of_code_requests as aoc_requests
+from functools import partial
+from typing import Iterable, Iterator, Optional
 
+from advent_of_code import map_reduce
+from advent_of_code import tracing
 
-def get_input() -> list:
-    """Returns the input as a nested list.
+# A range, as its lower and upper bounds
+Range = tuple[int, int]
 
-    Each element in the list represents a row in the puzzle text.
 
-    For each row, there are two elements, each element representing a range.
+def get_input() -> str:
+    """Returns the challenge input."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
 
-    For each element representing a range, there is a list of two elements specifying
-    the upper and lower bounds.
+    return aoc_requests.get_input("2022", "4")
+
+
+def get_input_lines() -> Iterator[str]:
+    """Returns the challenge input, one line at a time."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input_lines("2022", "4")
+
+
+def parse(text: str) -> tuple[tuple[Range, Range], ...]:
+    """Returns the pair of ranges on each line of the input (see `parse_lines`).
+
+    Args:
+        text (str): The challenge input.
 
     Returns:
-        list: A three-level nested loop. Order of granularity goes from "input line" ->
-        "ranges" -> "upper and lower bound".
+        tuple[tuple[Range, Range], ...]: A two-level nested tuple for each input\
+             line. Order of granularity goes from "ranges" -> "upper and lower bound".
     """
-    input = aoc_requests.get_input("2022", "4")
-    return [
-        [[int(item) for item in items.split("-")] for items in line.split(",")]
-        for line in input.split("\n")
-    ]
+    return parse_lines(text.split("\n"))
+
 
+@tracing.traced("parse")
+def parse_lines(lines: Iterable[str]) -> tuple[tuple[Range, Range], ...]:
+    """Returns the pair of ranges on each line of the input, reading the lines in a\
+         single pass.
 
-def part_1_solution() -> int:
+    For each pair, there are two elements, each element representing a range.
+
+    For each element representing a range, there is a tuple of two elements\
+         specifying the lower and upper bounds.
+
+    Args:
+        lines (Iterable[str]): The lines of the challenge input.
+
+    Returns:
+        tuple[tuple[Range, Range], ...]: A two-level nested tuple for each input\
+             line. Order of granularity goes from "ranges" -> "upper and lower bound".
+    """
+    pairs = []
+    for line in lines:
+        if line:
+            first, second = line.split(",")
+            first_start, first_end = first.split("-")
+            second_start, second_end = second.split("-")
+            pairs.append(
+                (
+                    (int(first_start), int(first_end)),
+                    (int(second_start), int(second_end)),
+                )
+            )
+    return tuple(pairs)
+
+
+def part_1_solution(pairs: tuple[tuple[Range, Range], ...]) -> int:
     """Returns a count of range pairs where one range completely contains the other.
 
+    Args:
+        pairs (tuple[tuple[Range, Range], ...]): The pairs of ranges (see `parse`).
+
     Returns:
         int: Number of range pairs where one range completely contains the other.
     """
-    pairs = get_input()
     fully_contained = 0
 
     for pair in pairs:
@@ -41,13 +88,15 @@ def part_1_solution() -> int:
     return fully_contained
 
 
-def part_2_solution() -> int:
+def part_2_solution(pairs: tuple[tuple[Range, Range], ...]) -> int:
     """Returns a count of range pairs that overlap.
 
+    Args:
+        pairs (tuple[tuple[Range, Range], ...]): The pairs of ranges (see `parse`).
+
     Returns:
         int: Count of range pairs that overlap.
     """
-    pairs = get_input()
     fully_contained = 0
 
     # If any bound in one range set is contained by the bounds in the other range set,
@@ -65,6 +114,46 @@ def part_2_solution() -> int:
     return fully_contained
 
 
+@tracing.traced("part_1")
+def part_1(parsed: tuple[tuple[Range, Range], ...]) -> int:
+    """Returns the answer to part 1."""
+    return part_1_solution(parsed)
+
+
+@tracing.traced("part_2")
+def part_2(parsed: tuple[tuple[Range, Range], ...]) -> int:
+    """Returns the answer to part 2."""
+    return part_2_solution(parsed)
+
+
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
+def solve_chunked(file_path: str, part: int, workers: Optional[int] = None) -> int:
+    """Returns the same answer as `solve`, with a large input file split between\
+         pairs (lines) and solved across a pool of processes (see\
+             `map_reduce.run`).
+
+    Args:
+        file_path (str): Path to the puzzle input.
+        part (int): Part of the puzzle (1 or 2).
+        workers (Optional[int]): Number of processes. Defaults to the number of\
+             CPU cores.
+
+    Returns:
+        int: The answer to the part.
+    """
+    # Each pair is counted on its own, so the answer is the sum of the
+    #  answers for each range
+    return map_reduce.run(
+        file_path, partial(solve, part=part), map_reduce.total, workers=workers
+    )
+
+
 def main() -> tuple:
     """Returns solution to both parts as a tuple."""
-    return part_1_solution(), part_2_solution()
+    parsed = parse_lines(get_input_lines())
+    return part_1(parsed), part_2(parsed)
@@ -1,69 +1,66 @@
 """My solution for year 2022, day 5."""
 from collections import namedtuple
-import re
-from typing import List
 
-from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import parsing
+from advent_of_code import tracing
 
+# Namedtuple to make it easier to implement move instructions
+Move = namedtuple("Move", ["count", "source", "target"])
 
-def get_input() -> tuple:
-    """Processes the input and returns a list of stacks, and a list of move \
-        instructions (each move instruction is a namedtuple.
+# The crates of each stack, from the bottom to the top
+Stacks = tuple[str, ...]
 
-        Each stack is a list, where the top of the stack is at the end of the list.
+
+def get_input() -> str:
+    """Returns the challenge input."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input("2022", "5")
+
+
+@tracing.traced("parse")
+def parse(text: str) -> tuple[Stacks, tuple[Move, ...]]:
+    """Processes the input and returns the stacks, and the move instructions.
+
+        Each stack is a string of crates, where the top of the stack is at the end of\
+         the string. Strings cannot be changed, so each part copies them into lists\
+             before moving crates.
 
         Each move instruction is a namedtuple, where each namedtuple has a count of
          items to move, the source stack, and the target stack.
 
+    Args:
+        text (str): The challenge input.
 
     Returns:
-        tuple: A list containing two items - a list containing stacks, and a list
-        containing move instructions.
+        tuple[Stacks, tuple[Move, ...]]: A tuple containing two items - the stacks,\
+             and the move instructions.
     """
-    # Determines if we should be processing stack sepecification or move instructions
-    processing_stacks = True
-    # Namedtuple to make it easier to implement move instructions
-    move = namedtuple("move", ["count", "source", "target"])
-    # Will hold stacks as they are given by the input (top of stack is end of list)
-    stacks: List[List[int]] = [[]]
-    # Holds all move instruction as a list of namedtuples
-    move_list = []
-
-    for line in aoc_requests.get_input("2022", "5").split("\n"):
-        # Skip irrelevant lines, switching processing_stacks to false when
-        # move instructions start
-        if line == "":
-            processing_stacks = False
-            continue
-        elif line[1] == "1":
-            continue
-
-        if processing_stacks:
-            # For stack specifications, 4 spaces denote an empty space. A letter
-            # between square brackets denote a non-empty space.
-            stack_instruction = re.findall(r"    |\w", line)
-            if len(stacks) != len(stack_instruction):
-                stacks = [[] for _ in range(0, len(stack_instruction))]
-            for i, item in enumerate(stack_instruction):
-                if len(item) == 1:
-                    stacks[i].append(item)
-        else:
-            # For move instructions, numbers denote number of items to move,
-            # source stack, and target stack, respectively.
-            instruction = [int(i) for i in re.findall(r"\d+", line)]
-            instruction[-1] -= 1
-            instruction[-2] -= 1
-            move_list.append(move(instruction[0], instruction[1], instruction[2]))
-
-    # Reverse stacks so that we are always popping from end of list (O(1)) rather than
-    # the beginning of list(O(n))
-    for s in stacks:
-        s.reverse()
+    drawing, moves = parsing.blocks(text)
+
+    # In the drawing, each stack is a column 4 characters wide, holding a letter
+    # between square brackets for each item (or spaces above the top item). The last
+    # line numbers the stacks. Each column is read from top to bottom, so it is
+    # reversed to keep the top of the stack at the end of the string.
+    stacks = tuple(
+        column.strip()[::-1]
+        for column in parsing.columns(drawing.split("\n")[:-1], width=4, offset=1)
+    )
+
+    # For move instructions, numbers denote number of items to move, source stack,
+    # and target stack, respectively. Stacks are numbered from 1.
+    numbers = parsing.ints(moves)
+    move_list = tuple(
+        Move(count, source - 1, target - 1)
+        for count, source, target in zip(
+            numbers[0::3], numbers[1::3], numbers[2::3], strict=True
+        )
+    )
 
     return stacks, move_list
 
 
-def part_1_solution() -> str:
+def part_1_solution(parsed: tuple[Stacks, tuple[Move, ...]]) -> str:
     """Carries out the move instructions as per part 1's rules and returns the \
         solution string, which contains the top letter in each stack.
 
@@ -71,10 +68,16 @@ def part_1_solution() -> str:
          source stack to the target stack. The move instruction's count determines
          how many items to move.
 
+    Args:
+        parsed (tuple[Stacks, tuple[Move, ...]]): The stacks and the move\
+             instructions (see `parse`).
+
     Returns:
         str: The top of each stack concatenated into one string.
     """
-    stacks, transformations = get_input()
+    starting_stacks, transformations = parsed
+    # Crates are moved one at a time, so each stack is copied into a list
+    stacks = [list(stack) for stack in starting_stacks]
 
     for t in transformations:
         for _ in range(0, t.count):
@@ -83,17 +86,24 @@ def part_1_solution() -> str:
     return "".join([s[len(s) - 1] if len(s) > 0 else "" for s in stacks])
 
 
-def part_2_solution() -> str:
+def part_2_solution(parsed: tuple[Stacks, tuple[Move, ...]]) -> str:
     """Carries out the move instructions as per part 2's rules and returns the \
         solution string, which contains the top letter in each stack.
 
         For part 2, all items specified by the move instruction's count is moved
          from the source stack to the target stack.
 
+    Args:
+        parsed (tuple[Stacks, tuple[Move, ...]]): The stacks and the move\
+             instructions (see `parse`).
+
     Returns:
         str: The top of each stack concatenated into one string.
     """
-    stacks, transformations = get_input()
+    starting_stacks, transformations = parsed
+    # Strings are sliced and joined just like lists, so only the list of stacks is
+    #  copied, and each move builds new strings
+    stacks = list(starting_stacks)
 
     for t in transformations:
         stacks[t.target] = stacks[t.target] + stacks[t.source][-t.count :]
@@ -102,6 +112,25 @@ def part_2_solution() -> str:
     return "".join([s[len(s) - 1] if len(s) > 0 else "" for s in stacks])
 
 
+@tracing.traced("part_1")
+def part_1(parsed: tuple[Stacks, tuple[Move, ...]]) -> str:
+    """Returns the answer to part 1."""
+    return part_1_solution(parsed)
+
+
+@tracing.traced("part_2")
+def part_2(parsed: tuple[Stacks, tuple[Move, ...]]) -> str:
+    """Returns the answer to part 2."""
+    return part_2_solution(parsed)
+
+
+def solve(text: str, part: int) -> str:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
 def main() -> tuple:
     """Returns a tuple containing the part 1 and part 2 solutions."""
-    return part_1_solution(), part_2_solution()
+    parsed = parse(get_input())
+    return part_1(parsed), part_2(parsed)
@@ -1,28 +1,35 @@
 """My attempt at solving year 2022, day 6."""
 from collections import defaultdict
 
-from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import tracing
 
 
 def get_input() -> str:
     """Returns the challenge text for year 2022, day 6."""
-    return aoc_requests.get_input("2022", "6").strip()
+    from advent_of_code import advent_of_code_requests as aoc_requests
 
+    return aoc_requests.get_input("2022", "6")
 
-def detect_distinct_char_sequence(scope: int) -> int:
+
+@tracing.traced("parse")
+def parse(text: str) -> str:
+    """Returns the datastream, without the whitespace around it."""
+    return text.strip()
+
+
+def detect_distinct_char_sequence(input: str, scope: int) -> int:
     """This function will find the first sequence of characters in the input that are \
     distinct (scope determines how many characters must be in the sequence), and \
     return the end index of that sequence (which is indexed starting from 1).
 
     Args:
+        input (str): The datastream (see `parse`).
         scope (int): The number of characters in the distinct character sequence.
 
     Returns:
         int: The end index of the distinct character sequence. Is indexed \
             starting from 1
     """
-    input = get_input()
-
     # Use defaultdict so the values initialize with 0.
     # Keys are letters of the input.
     # Values are the frequency with which they occur.
@@ -56,8 +63,26 @@ def detect_distinct_char_sequence(scope: int) -> int:
     return end + 1
 
 
+@tracing.traced("part_1")
+def part_1(parsed: str) -> int:
+    """Returns the end of the first start-of-packet marker (4 distinct characters)."""
+    return detect_distinct_char_sequence(parsed, scope=4)
+
+
+@tracing.traced("part_2")
+def part_2(parsed: str) -> int:
+    """Returns the end of the first start-of-message marker (14 distinct\
+         characters)."""
+    return detect_distinct_char_sequence(parsed, scope=14)
+
+
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
 def main() -> tuple:
     """Function to return a tuple containing the solution to both problems."""
-    return detect_distinct_char_sequence(scope=4), detect_distinct_char_sequence(
-        scope=14
-    )
+    parsed = parse(get_input())
+    return part_1(parsed), part_2(parsed)
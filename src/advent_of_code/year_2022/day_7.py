@@ -3,7 +3,7 @@ from __future__ import annotations
 
 from typing import Optional
 
-from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import tracing
 
 
 class Node:
@@ -101,43 +101,95 @@ def construct_tree_from_commands(commands: list[str]) -> Node:
     return root_dir
 
 
-def compute_dir_sizes(node: Node, max_size: int = 0, return_list: list = []) -> list:
+def compute_dir_sizes(
+    node: Node, max_size: int = 0, return_list: Optional[list] = None
+) -> list:
     """Computes the sizes for all directories using depth-first-search. If `max_size`\
          is given, all directories smaller than `max_size` will be returned.
 
     Args:
         node (Node): The current/root node.
         max_size (int): The maximum size for a directory. Defaults to 0.
-        return_list (list): This holds a list of directories that are smaller than \
-            `max_int`. Defaults to [].
+        return_list (Optional[list]): The list that directories smaller than\
+             `max_size` are added to. Defaults to a new list.
 
     Returns:
         list:  A list containing all directories smaller than the max_size.
     """
-    for c in node.children.values():
-        compute_dir_sizes(c, max_size=max_size, return_list=return_list)
-
-    parent_node = node.parent
-    if parent_node is not None:
-        parent_node.node_size += node.node_size
-        if node.node_type == "dir" and node.node_size <= max_size:
-            return_list.append(node)
+    if return_list is None:
+        return_list = []
+
+    # The tree is walked with a stack rather than recursion, as it can be deeper than
+    #  the recursion limit. In reverse, the walk visits every node after its children,
+    #  so each size is complete before it is added to its parent's.
+    visit_order = []
+    to_visit = [node]
+    while len(to_visit) > 0:
+        curr_node = to_visit.pop()
+        visit_order.append(curr_node)
+        to_visit.extend(curr_node.children.values())
+
+    for curr_node in reversed(visit_order):
+        parent_node = curr_node.parent
+        if parent_node is not None:
+            parent_node.node_size += curr_node.node_size
+            if curr_node.node_type == "dir" and curr_node.node_size <= max_size:
+                return_list.append(curr_node)
 
     return return_list
 
 
-def get_input() -> list[str]:
+def get_input() -> str:
     """Gets the puzzle input from Advent of Code Website."""
-    return aoc_requests.get_input("2022", "7").split("\n")
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input("2022", "7")
+
+
+@tracing.traced("parse")
+def parse(text: str) -> Node:
+    """Builds the file structure from the puzzle input, and adds up the size of\
+         each directory.
+
+    The sizes are only added up once, so the parts must not change the tree.
+
+    Args:
+        text (str): The puzzle input.
+
+    Returns:
+        Node: The root directory of the file structure.
+    """
+    root_dir = construct_tree_from_commands(text.split("\n"))
+    # The list of small directories is not needed, as part 1 finds them in the tree
+    compute_dir_sizes(root_dir)
+    return root_dir
+
 
+def part_1_solution(root_dir: Node, max_size: int = 100000) -> int:
+    """Returns the total size of the directories that are at most `max_size`.
 
-def part_1_solution() -> tuple[int, Node]:
-    """Returns the answer for part 1 and the root directory of the constructed file\
-         structure as a tuple."""
-    commands = get_input()
-    root_dir = construct_tree_from_commands(commands)
-    nodes_below_max_size = compute_dir_sizes(root_dir, max_size=100000)
-    return sum([i.node_size for i in nodes_below_max_size]), root_dir
+    The root directory is not counted, just like in `compute_dir_sizes`.
+
+    Args:
+        root_dir (Node): The root directory of the file structure, with the sizes\
+             of the directories added up (see `parse`).
+        max_size (int): The maximum size for a directory. Defaults to 100000.
+
+    Returns:
+        int: The total size of the small directories.
+    """
+    total_size = 0
+    dir_to_explore = [v for v in root_dir.children.values() if v.node_type == "dir"]
+
+    while len(dir_to_explore) > 0:
+        curr_dir = dir_to_explore.pop()
+        if curr_dir.node_size <= max_size:
+            total_size += curr_dir.node_size
+        for v in curr_dir.children.values():
+            if v.node_type == "dir":
+                dir_to_explore.append(v)
+
+    return total_size
 
 
 def part_2_solution(root_dir: Node) -> int:
@@ -170,8 +222,25 @@ def part_2_solution(root_dir: Node) -> int:
     return min([node.node_size for node in dir_to_delete])
 
 
+@tracing.traced("part_1")
+def part_1(parsed: Node) -> int:
+    """Returns the answer for part 1."""
+    return part_1_solution(parsed)
+
+
+@tracing.traced("part_2")
+def part_2(parsed: Node) -> int:
+    """Returns the answer for part 2."""
+    return part_2_solution(parsed)
+
+
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
 def main() -> tuple:
     """Returns the answers for part 1 and part 2 as a tuple."""
-    part_1_answer, root_dir = part_1_solution()
-
-    return part_1_answer, part_2_solution(root_dir)
+    parsed = parse(get_input())
+    return part_1(parsed), part_2(parsed)
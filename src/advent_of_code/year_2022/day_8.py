@@ -1,59 +1,70 @@
 """My solution for year 2022, day 8."""
-from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import grid
+from advent_of_code import tracing
 
 
-def get_input() -> tuple:
-    """Gets the challenge input and returns two nested lists, one for rows and\
-         one for columns, respectively."""
-    input = aoc_requests.get_input("2022", "8").split("\n")
-    rows = [[int(i) for i in row] for row in input]
-    cols = [[int(row[i]) for row in input] for i in range(0, len(rows[0]))]
-    return rows, cols
+def get_input() -> str:
+    """Gets the challenge input."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
 
+    return aoc_requests.get_input("2022", "8")
 
-def part_1_solution() -> int:
+
+@tracing.traced("parse")
+def parse(text: str) -> grid.Grid:
+    """Returns the map of tree heights in the challenge input as a grid."""
+    return grid.from_digits(text)
+
+
+def viewing_distance(trees: memoryview, height: int) -> int:
+    """Returns the number of trees that can be seen from a tree of the given height.
+
+    Trees are counted until one that is just as tall or taller is found (which is\
+         counted too), or until the edge of the map.
+
+    Args:
+        trees (memoryview): The heights of the trees in one direction, closest first.
+        height (int): The height of the tree looking in that direction.
+
+    Returns:
+        int: The number of trees seen.
+    """
+    for distance, other in enumerate(trees, start=1):
+        if other >= height:
+            return distance
+    return len(trees)
+
+
+def part_1_solution(forest: grid.Grid) -> int:
     """This function returns the number of visible trees in the challenge input.
 
     The challenge input provides a map of trees, where each number is the tree height.
 
-    A tree is visible if it is not on the edge of the map, and if it is the tallest
-     tree when all the trees above, below, to the left, and to the right of the tree
-     are considered.
+    A tree is visible if it is on the edge of the map, or if it is taller than all\
+         the trees above, below, to the left, or to the right of it.
+
+    Args:
+        forest (grid.Grid): The map of tree heights (see `parse`).
 
     Returns:
         int: The number of visible trees.
     """
-    # Get rows and columns (cols) as two arrays
-    rows, cols = get_input()
     visible_trees = 0
 
-    for row_num, row in enumerate(rows):
-        for col_num, height in enumerate(row):
-            # Get column of current tree
-            col = cols[col_num]
-
-            # If the row is the first row or last row, or
-            #  if the column is the first or last column, all trees are visible
-            if row_num == 0 or row_num == len(row) - 1:
-                visible_trees += 1
-            elif col_num == 0 or col_num == len(col) - 1:
-                visible_trees += 1
-            # If the max height in all directions (up, down, left, right) is equal
-            #  to or higher than the current height, pass. Else, tree is visible
-            elif (
-                max(row[0:col_num]) >= height
-                and max(row[col_num + 1 :]) >= height
-                and max(col[0:row_num]) >= height
-                and max(col[row_num + 1 :]) >= height
+    for row in range(0, forest.height):
+        for col in range(0, forest.width):
+            height = forest[row, col]
+            # Trees on the edge have no trees in one direction, so are visible
+            if any(
+                len(trees) == 0 or max(trees) < height
+                for trees in forest.rays(row, col)
             ):
-                pass
-            else:
                 visible_trees += 1
 
     return visible_trees
 
 
-def part_2_solution() -> int:
+def part_2_solution(forest: grid.Grid) -> int:
     """Returns the value of the highest scenic score.
 
     A scenic score for a tree is calculated by taking the number of shorter trees\
@@ -63,56 +74,50 @@ def part_2_solution() -> int:
     In each direction, the number of shorter trees are counted only until a tree\
          of equivalent height or taller is found, or until an edge tree is found.
 
+    Args:
+        forest (grid.Grid): The map of tree heights (see `parse`).
+
     Returns:
         int: the highest scenic score of the map.
     """
-    # Only rows can be used for this part
-    rows = get_input()[0]
-    row_count = len(rows[0])
-    col_count = len(rows)
-
-    # The directions to search for shorter trees in
-    directions = [(0, -1), (-1, 0), (0, 1), (1, 0)]
-
-    # Global maximum sccenic score
+    # Global maximum scenic score
     max_scenic_score = 0
 
-    for row in range(1, row_count):
-        for col in range(1, col_count):
+    # Trees on the edge see no trees in one direction, so their score is 0
+    for row in range(1, forest.height - 1):
+        for col in range(1, forest.width - 1):
+            height = forest[row, col]
 
             # Since scenic scores are a multiplication product, initiate to 1, not 0
             local_scenic_score = 1
+            for trees in forest.rays(row, col):
+                local_scenic_score *= viewing_distance(trees, height)
+
+            if local_scenic_score > max_scenic_score:
+                max_scenic_score = local_scenic_score
 
-            for direction in directions:
-                shorter_trees = 0
-                m_row = row  # m_row is modified row
-                m_col = col  # m_col is modified column
+    return max_scenic_score
 
-                while True:
-                    # Counts are done inclusive of taller/equivalent trees.
-                    # So, increment by 1 before moving in the direction.
-                    shorter_trees += 1
-                    m_row += direction[0]
-                    m_col += direction[1]
 
-                    # Stop if we reach the edge
-                    if m_row <= 0 or m_row >= row_count - 1:
-                        break
-                    elif m_col <= 0 or m_col >= col_count - 1:
-                        break
+@tracing.traced("part_1")
+def part_1(parsed: grid.Grid) -> int:
+    """Returns the answer to part 1."""
+    return part_1_solution(parsed)
 
-                    # Stop if we find a tree that is just as tall or taller
-                    if rows[m_row][m_col] >= rows[row][col]:
-                        break
 
-                local_scenic_score *= shorter_trees
+@tracing.traced("part_2")
+def part_2(parsed: grid.Grid) -> int:
+    """Returns the answer to part 2."""
+    return part_2_solution(parsed)
 
-            if local_scenic_score > max_scenic_score:
-                max_scenic_score = local_scenic_score
 
-    return max_scenic_score
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
 
 
 def main() -> tuple:
     """Returns the solution for part 1 and 2 as a tuple."""
-    return part_1_solution(), part_2_solution()
+    parsed = parse(get_input())
+    return part_1(parsed), part_2(parsed)
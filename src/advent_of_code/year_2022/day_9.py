@@ -2,8 +2,9 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import Iterable, Iterator
 
-from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import tracing
 
 
 @dataclass(frozen=True)
@@ -14,7 +15,7 @@ class Coordinate:
     y: int
 
 
-@dataclass()
+@dataclass(frozen=True)
 class Instruction:
     """Represents an instruction from the challenge input."""
 
@@ -99,19 +100,52 @@ class Rope:
         return len(self._coordinates)
 
 
-def get_input() -> list[Instruction]:
-    """Returns the challenge input as a list of Instruction dataclass objects.
+def get_input() -> str:
+    """Returns the challenge input."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input(year="2022", day="9")
+
+
+def get_input_lines() -> Iterator[str]:
+    """Returns the challenge input, one line at a time."""
+    from advent_of_code import advent_of_code_requests as aoc_requests
+
+    return aoc_requests.get_input_lines(year="2022", day="9")
+
+
+def parse(text: str) -> tuple[Instruction, ...]:
+    """Returns the challenge input as Instruction dataclass objects (see `parse_lines`).
+
+    Args:
+        text (str): The challenge input.
+
+    Returns:
+        tuple[Instruction, ...]: Each instruction of the challenge input.
+    """
+    return parse_lines(text.split("\n"))
+
+
+@tracing.traced("parse")
+def parse_lines(lines: Iterable[str]) -> tuple[Instruction, ...]:
+    """Returns the challenge input as Instruction dataclass objects, reading the\
+         lines in a single pass.
 
     Each Instruction has two fields, `side` which represents the direction to move,\
          and `distance` which represents the amount of coordinates to move.
 
+    Args:
+        lines (Iterable[str]): The lines of the challenge input.
+
     Returns:
-        list[Instruction]: The challenge input.
+        tuple[Instruction, ...]: Each instruction of the challenge input.
     """
-    return [
-        Instruction(line.split(" ")[0], int(line.split(" ")[1]))
-        for line in aoc_requests.get_input(year="2022", day="9").split("\n")
-    ]
+    instructions = []
+    for line in lines:
+        if line:
+            side, distance = line.split()
+            instructions.append(Instruction(side, int(distance)))
+    return tuple(instructions)
 
 
 def make_move(rope: Rope, direction: tuple) -> None:
@@ -164,12 +198,15 @@ def make_move(rope: Rope, direction: tuple) -> None:
             rope.set_knot(index=index + 1, position=tuple(new_tail))
 
 
-def count_distinct_coordinates_for_last_knot(knot_count: int) -> int:
+def count_distinct_coordinates_for_last_knot(
+    instructions: tuple[Instruction, ...], knot_count: int
+) -> int:
     """This function generates a rope object initialized with `knot_count` knots,\
          moves the rope according to the challenge input, and returns the number of\
          distinct coordinates visited by the last knot.
 
     Args:
+        instructions (tuple[Instruction, ...]): The challenge input (see `parse`).
         knot_count (int): The number knots in the rope.
 
     Returns:
@@ -179,17 +216,33 @@ def count_distinct_coordinates_for_last_knot(knot_count: int) -> int:
 
     directions = {"R": (1, 0), "L": (-1, 0), "U": (0, 1), "D": (0, -1)}
 
-    for instruction in get_input():
+    for instruction in instructions:
         for _ in range(instruction.distance):
             make_move(rope=rope, direction=directions[instruction.side])
 
     return len(rope.visited_coordinates[-1])
 
 
+@tracing.traced("part_1")
+def part_1(parsed: tuple[Instruction, ...]) -> int:
+    """Returns the number of coordinates visited by the tail of a 2 knot rope."""
+    return count_distinct_coordinates_for_last_knot(parsed, knot_count=2)
+
+
+@tracing.traced("part_2")
+def part_2(parsed: tuple[Instruction, ...]) -> int:
+    """Returns the number of coordinates visited by the tail of a 10 knot rope."""
+    return count_distinct_coordinates_for_last_knot(parsed, knot_count=10)
+
+
+def solve(text: str, part: int) -> int:
+    """Returns the answer to one part (1 or 2) for the input given as text, without\
+         reading the input source. A KeyError is raised for any other part."""
+    return {1: part_1, 2: part_2}[part](parse(text))
+
+
 def main() -> tuple:
     """This function returns the answers to part 1 and part 2 of the challenge\
          as a tuple."""
-    return (
-        count_distinct_coordinates_for_last_knot(knot_count=2),
-        count_distinct_coordinates_for_last_knot(knot_count=10),
-    )
+    parsed = parse_lines(get_input_lines())
+    return part_1(parsed), part_2(parsed)
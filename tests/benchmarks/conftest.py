@@ -0,0 +1,23 @@
+"""Fixtures for the scaling benchmarks."""
+import json
+import os
+from os import getcwd, makedirs, path
+from typing import Iterator
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def scaling_report() -> Iterator[dict]:
+    """Fixture to collect the result of each benchmark, which are written to\
+         AOC_BENCHMARK_OUTPUT (.conf/benchmarks/scaling.json by default) at the end."""
+    report: dict = {}
+    yield report
+    if len(report) == 0:
+        return
+    output = os.environ.get("AOC_BENCHMARK_OUTPUT") or path.join(
+        getcwd(), ".conf", "benchmarks", "scaling.json"
+    )
+    makedirs(path.dirname(path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
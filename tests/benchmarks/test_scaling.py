@@ -0,0 +1,61 @@
+"""Scaling benchmarks for the 2022 solutions, on generated inputs of growing size.
+
+Each part is timed at several scales (see `generators.GENERATORS`), and fails when its\
+     time grows faster than expected, such as a linear solution turning quadratic.\
+         The benchmarks take a few minutes, so they only run when the\
+             AOC_BENCHMARKS environment variable is set:
+
+    AOC_BENCHMARKS=1 poetry run pytest tests/benchmarks
+"""
+import os
+
+import pytest
+
+from advent_of_code import bench
+
+pytestmark = pytest.mark.skipif(
+    os.environ.get("AOC_BENCHMARKS") is None,
+    reason="Set AOC_BENCHMARKS to run the scaling benchmarks",
+)
+
+# Growth exponents are fitted to a few noisy timings, so they may go over the
+#  expected exponent by this much
+SLACK = 0.4
+
+# Scales timed for each day, and the expected growth exponent of each part's time
+DAYS = {
+    "1": ([10_000, 20_000, 40_000, 80_000], {"1": 1, "2": 1}),
+    "2": ([20_000, 40_000, 80_000, 160_000], {"1": 1, "2": 1}),
+    "3": ([10_000, 20_000, 40_000, 80_000], {"1": 1, "2": 1}),
+    "4": ([10_000, 20_000, 40_000, 80_000], {"1": 1, "2": 1}),
+    "5": ([10_000, 20_000, 40_000, 80_000], {"1": 1, "2": 1}),
+    "6": ([100_000, 200_000, 400_000, 800_000], {"1": 1, "2": 1}),
+    # Directories are nested about scale / 3 deep
+    "7": ([5000, 10_000, 20_000, 40_000], {"1": 1, "2": 1}),
+    # The scale is the width of the map, so a linear solution has an exponent of 2.
+    #  Part 1 looks all the way to each edge from every tree.
+    "8": ([40, 80, 160, 320], {"1": 3, "2": 2}),
+    "9": ([1000, 2000, 4000, 8000], {"1": 1, "2": 1}),
+    "10": ([20_000, 40_000, 80_000, 160_000], {"1": 1, "2": 1}),
+    "11": ([4, 8, 16, 32], {"1": 1, "2": 1}),
+}
+
+
+@pytest.mark.parametrize(
+    "day, part",
+    [(day, part) for day, (_, parts) in DAYS.items() for part in parts],
+)
+def test_scaling(day: str, part: str, scaling_report: dict) -> None:
+    """It solves each part in no more than the expected time complexity."""
+    scales, exponents = DAYS[day]
+    result = bench.measure_scaling("2022", day, part, scales)
+    scaling_report["2022/{day}/{part}".format(day=day, part=part)] = result
+    assert result["time_exponent"] <= exponents[part] + SLACK, (
+        "Day {day} part {part} grows like scale ** {exponent:.2f}, expected at "
+        "most scale ** {expected}".format(
+            day=day,
+            part=part,
+            exponent=result["time_exponent"],
+            expected=exponents[part],
+        )
+    )
@@ -0,0 +1,57 @@
+"""Speed-up benchmarks for the 2022 solutions that split large inputs across a pool\
+     of processes (see `map_reduce.run`).
+
+Each part is timed on a generated input of a few dozen MB with one worker, then with\
+     one worker per CPU core (up to `MAX_WORKERS`), and fails when the speed-up is\
+         much less than linear. They only run when the AOC_BENCHMARKS environment\
+             variable is set, on a machine with more than one core:
+
+    AOC_BENCHMARKS=1 poetry run pytest tests/benchmarks
+"""
+import os
+
+import pytest
+
+from advent_of_code import bench
+
+pytestmark = [
+    pytest.mark.skipif(
+        os.environ.get("AOC_BENCHMARKS") is None,
+        reason="Set AOC_BENCHMARKS to run the speed-up benchmarks",
+    ),
+    pytest.mark.skipif(
+        (os.cpu_count() or 1) < 2, reason="The speed-up needs more than one core"
+    ),
+]
+
+# Most workers timed, as the input is only split into chunks of at least
+#  `map_reduce.MIN_CHUNK_SIZE` bytes
+MAX_WORKERS = 8
+
+# Share of a linear speed-up that the workers must reach, as starting the processes
+#  and finding where to split the file are not split across them
+EFFICIENCY = 0.6
+
+# Scale of the input timed for each day, which is a few dozen MB
+SCALES = {"1": 1_000_000, "2": 8_000_000, "3": 1_000_000, "4": 2_000_000}
+
+
+@pytest.mark.parametrize(
+    "day, part", [(day, part) for day in SCALES for part in ("1", "2")]
+)
+def test_speedup(day: str, part: str, scaling_report: dict) -> None:
+    """It solves each part nearly as many times faster as there are workers."""
+    workers = min(os.cpu_count() or 1, MAX_WORKERS)
+    result = bench.measure_speedup("2022", day, part, SCALES[day], [1, workers])
+    scaling_report["2022/{day}/{part}/speedup".format(day=day, part=part)] = result
+    speedup = result["points"][-1]["speedup"]
+    assert speedup >= EFFICIENCY * workers, (
+        "Day {day} part {part} is {speedup:.2f} times faster on {workers} workers, "
+        "expected at least {expected:.2f}".format(
+            day=day,
+            part=part,
+            speedup=speedup,
+            workers=workers,
+            expected=EFFICIENCY * workers,
+        )
+    )
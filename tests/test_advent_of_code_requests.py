@@ -1,18 +1,42 @@
 """Test cases for advent of code requests module."""
+from datetime import datetime, timezone
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from os import path
+import socket
+from threading import Thread
+import time
+import tracemalloc
+from typing import BinaryIO, Iterator
 from unittest.mock import Mock
 
-from mock import patch
 import pytest
 from pytest_mock import MockFixture
 from requests.exceptions import HTTPError, SSLError
 
 from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import input_cache, input_sources
+
+# Latency added by the mock server to every response, in seconds
+SERVER_LATENCY = 0.2
+
+
+@pytest.fixture(autouse=True)
+def temp_cache(mocker: MockFixture, tmp_path: str) -> input_cache.InputCache:
+    """Fixture to store cached inputs in a temporary folder."""
+    cache = input_cache.InputCache(root=str(tmp_path))
+    mocker.patch.object(input_cache, "cache", cache)
+    return cache
 
 
 @pytest.fixture
 def mock_requests_get(mocker: MockFixture) -> Mock:
     """Fixture for mocking get."""
-    mock = mocker.patch("requests.get")
+    mock = mocker.patch.object(aoc_requests, "get_session").return_value.get
+    response = mock.return_value.__enter__.return_value
+    response.status_code = 200
+    response.headers = {}
+    response.text = "test input\n"
     return mock
 
 
@@ -23,19 +47,325 @@ def test_get_input_uses_parameters(mock_requests_get: Mock) -> None:
     assert "https://adventofcode.com/0/day/0/input" in args
 
 
-@patch("requests.get")
-def test_get_input_raises_SSLError(get_mock: Mock) -> None:
+def test_get_input_caches_input(
+    mock_requests_get: Mock, temp_cache: input_cache.InputCache
+) -> None:
+    """It saves the input on the first call and skips the network afterwards."""
+    assert aoc_requests.get_input(year="0", day="0") == "test input"
+    assert aoc_requests.get_input(year="0", day="0") == "test input"
+    assert mock_requests_get.call_count == 1
+    assert temp_cache.get(year="0", day="0") == "test input"
+
+
+def test_get_input_raises_SSLError(mock_requests_get: Mock) -> None:
     """It raises 'SSLError' when certification fails. \
         Steps to resolve this is included in the README."""
-    get_mock.side_effect = SSLError
+    mock_requests_get.side_effect = SSLError
     with pytest.raises(SSLError):
         aoc_requests.get_input(year="0", day="0")
 
 
-@patch("requests.get")
-def test_random_page_handles_validation_errors(get_mock: Mock) -> None:
+def test_random_page_handles_validation_errors(mock_requests_get: Mock) -> None:
     """It raises 'HTTPError' when cookie validation fails. \
         The exception message asks the user to update their cookie."""
-    get_mock.side_effect = HTTPError
+    mock_requests_get.side_effect = HTTPError
     with pytest.raises(HTTPError):
         aoc_requests.get_input(year="0", day="0")
+
+
+def test_get_session_is_shared(mocker: MockFixture) -> None:
+    """It creates the session once and returns the same one afterwards."""
+    mocker.patch.object(aoc_requests, "_session", None)
+    session = aoc_requests.get_session()
+    assert aoc_requests.get_session() is session
+    assert session.get_adapter("https://adventofcode.com") is session.get_adapter(
+        "https://adventofcode.com/2022/day/1/input"
+    )
+
+
+class _SlowInputHandler(BaseHTTPRequestHandler):
+    """Mock Advent of Code website that answers every request after a delay."""
+
+    protocol_version = "HTTP/1.1"
+    requested_paths: list = []
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Responds with the requested path as the puzzle input."""
+        time.sleep(SERVER_LATENCY)
+        self.requested_paths.append(self.path)
+        if "/day/13/" in self.path:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        body = (self.path + "\n").encode()
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silences the per-request log lines."""
+
+
+@pytest.fixture
+def mock_server(mocker: MockFixture) -> Iterator[ThreadingHTTPServer]:
+    """Fixture to serve puzzle inputs from a local server with added latency."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _SlowInputHandler)
+    _SlowInputHandler.requested_paths = []
+    Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    ).start()
+    mocker.patch.object(
+        aoc_requests,
+        "BASE_URL",
+        "http://127.0.0.1:{port}".format(port=server.server_address[1]),
+    )
+    mocker.patch.object(aoc_requests, "get_cookie", return_value="test")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_prefetch_downloads_concurrently(
+    mock_server: ThreadingHTTPServer, temp_cache: input_cache.InputCache
+) -> None:
+    """It downloads all missing inputs in less time than fetching them one by one."""
+    days = [str(day) for day in range(1, 7)]
+    start = time.perf_counter()
+    outcome = aoc_requests.prefetch(
+        year="2022", days=days, max_workers=6, min_interval=0.01
+    )
+    elapsed = time.perf_counter() - start
+
+    assert outcome == {day: "downloaded" for day in days}
+    assert elapsed < SERVER_LATENCY * len(days) / 2
+    for day in days:
+        assert temp_cache.get("2022", day) == "/2022/day/{day}/input".format(day=day)
+
+
+def test_prefetch_skips_cached_inputs(
+    mock_server: ThreadingHTTPServer, temp_cache: input_cache.InputCache
+) -> None:
+    """It only downloads the inputs that are not cached yet."""
+    temp_cache.put(year="2022", day="1", text="cached")
+    outcome = aoc_requests.prefetch(year="2022", days=["1", "2"], min_interval=0)
+    assert outcome == {"1": "cached", "2": "downloaded"}
+    assert _SlowInputHandler.requested_paths == ["/2022/day/2/input"]
+
+
+def test_prefetch_reports_failed_downloads(
+    mock_server: ThreadingHTTPServer, temp_cache: input_cache.InputCache
+) -> None:
+    """It keeps going when a download fails and reports the error for that day."""
+    outcome = aoc_requests.prefetch(year="2022", days=["12", "13"], min_interval=0)
+    assert outcome["12"] == "downloaded"
+    assert "aoc set-cookie" in outcome["13"]
+    assert temp_cache.get("2022", "13") is None
+
+
+def test_prefetch_reports_timeouts(
+    mock_server: ThreadingHTTPServer, mocker: MockFixture
+) -> None:
+    """It gives up on downloads from a website that never answers."""
+    # Connections are queued by the listening socket, but never answered
+    with socket.create_server(("127.0.0.1", 0)) as stalled:
+        mocker.patch.object(
+            aoc_requests,
+            "BASE_URL",
+            "http://127.0.0.1:{port}".format(port=stalled.getsockname()[1]),
+        )
+        mocker.patch.object(aoc_requests, "REQUEST_TIMEOUT", (1.0, SERVER_LATENCY))
+        outcome = aoc_requests.prefetch(year="2022", days=["1", "2"], min_interval=0)
+    assert all("timed out" in result for result in outcome.values())
+
+
+def test_prefetch_reports_connection_errors(
+    mock_server: ThreadingHTTPServer, mocker: MockFixture
+) -> None:
+    """It reports a day whose connection fails, and keeps going."""
+    mocker.patch.object(aoc_requests, "BASE_URL", "http://127.0.0.1:1")
+    outcome = aoc_requests.prefetch(year="2022", days=["1", "2"], min_interval=0)
+    assert set(outcome) == {"1", "2"}
+    assert all(result != "downloaded" for result in outcome.values())
+
+
+def test_download_input_has_a_timeout(mock_requests_get: Mock) -> None:
+    """It never waits forever for the website."""
+    aoc_requests.download_input(year="2022", day="1")
+    assert mock_requests_get.call_args.kwargs["timeout"] == aoc_requests.REQUEST_TIMEOUT
+
+
+def test_prefetch_respects_min_interval(
+    mock_server: ThreadingHTTPServer, temp_cache: input_cache.InputCache
+) -> None:
+    """It never starts two requests closer together than the minimum interval."""
+    start = time.perf_counter()
+    aoc_requests.prefetch(
+        year="2022", days=["1", "2", "3"], max_workers=3, min_interval=0.1
+    )
+    assert time.perf_counter() - start >= 0.2 + SERVER_LATENCY
+
+
+def test_available_days() -> None:
+    """It only returns days that have been released."""
+    during_event = datetime(2022, 12, 10, 4, 59, tzinfo=timezone.utc)
+    assert aoc_requests.available_days("2022", now=during_event) == [
+        str(day) for day in range(1, 10)
+    ]
+    assert len(aoc_requests.available_days("2021", now=during_event)) == 25
+    assert aoc_requests.available_days("2023", now=during_event) == []
+    before_event = datetime(2022, 11, 30, tzinfo=timezone.utc)
+    assert aoc_requests.available_days("2022", now=before_event) == []
+
+
+def test_get_input_lines_streams_large_input(
+    mocker: MockFixture, tmp_path: str
+) -> None:
+    """It keeps memory use flat when reading a large input one line at a time."""
+    file_path = path.join(tmp_path, "input.txt")
+    with open(file_path, "w") as f:
+        for _ in range(50000):
+            f.write("1000\n2000\n3000\n\n")
+    mocker.patch.object(input_sources, "source", input_sources.FileSource(file_path))
+
+    tracemalloc.start()
+    line_count = sum(1 for _ in aoc_requests.get_input_lines(year="2022", day="1"))
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    assert line_count == 4 * 50000 - 1
+    assert peak < path.getsize(file_path) / 10
+
+
+class _CountingWriter:
+    """Wraps a socket file, counting the bytes written to it."""
+
+    def __init__(self, wfile: BinaryIO, counter: list) -> None:
+        """Stores the wrapped file and the single-item list holding the count."""
+        self._wfile = wfile
+        self._counter = counter
+
+    def write(self, data: bytes) -> int:
+        """Writes the data and adds its length to the count."""
+        self._counter[0] += len(data)
+        return self._wfile.write(data)
+
+    def __getattr__(self, name: str) -> object:
+        """Forwards everything else (flush, close, ...) to the wrapped file."""
+        return getattr(self._wfile, name)
+
+
+class _ConditionalInputHandler(BaseHTTPRequestHandler):
+    """Mock Advent of Code website supporting ETags, Last-Modified and gzip."""
+
+    protocol_version = "HTTP/1.1"
+    body = b"1000\n2000\n3000\n\n4000\n" * 500
+    etag = '"v1"'
+    last_modified = "Thu, 01 Dec 2022 05:00:00 GMT"
+    bytes_sent = [0]
+    request_headers: list = []
+
+    def setup(self) -> None:
+        """Counts every byte sent back to the client."""
+        super().setup()
+        self.wfile = _CountingWriter(self.wfile, self.bytes_sent)  # type: ignore
+
+    def do_GET(self) -> None:  # noqa: N802
+        """Responds with 304 when the client's copy is current, else the input."""
+        self.request_headers.append(dict(self.headers))
+        if (
+            self.headers.get("If-None-Match") == self.etag
+            or self.headers.get("If-Modified-Since") == self.last_modified
+        ):
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        body = self.body
+        self.send_response(200)
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", self.etag)
+        self.send_header("Last-Modified", self.last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        """Silences the per-request log lines."""
+
+
+@pytest.fixture
+def conditional_server(mocker: MockFixture) -> Iterator[ThreadingHTTPServer]:
+    """Fixture to serve puzzle inputs from a local server that counts bytes sent."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ConditionalInputHandler)
+    _ConditionalInputHandler.bytes_sent[0] = 0
+    _ConditionalInputHandler.request_headers = []
+    Thread(
+        target=server.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+    ).start()
+    mocker.patch.object(
+        aoc_requests,
+        "BASE_URL",
+        "http://127.0.0.1:{port}".format(port=server.server_address[1]),
+    )
+    mocker.patch.object(aoc_requests, "get_cookie", return_value="test")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_fetch_input_downloads_compressed(
+    conditional_server: ThreadingHTTPServer, temp_cache: input_cache.InputCache
+) -> None:
+    """It accepts gzip, so fewer bytes than the input are transferred."""
+    text = aoc_requests.fetch_input(year="2022", day="1")
+    assert text == _ConditionalInputHandler.body.decode().rstrip()
+    assert _ConditionalInputHandler.bytes_sent[0] < len(_ConditionalInputHandler.body)
+    assert temp_cache.get_validators(year="2022", day="1") == {
+        "etag": _ConditionalInputHandler.etag,
+        "last_modified": _ConditionalInputHandler.last_modified,
+    }
+
+
+def test_fetch_input_revalidates_with_conditional_get(
+    conditional_server: ThreadingHTTPServer, temp_cache: input_cache.InputCache
+) -> None:
+    """It serves the cached input when the website answers 304 Not Modified."""
+    aoc_requests.fetch_input(year="2022", day="1")
+    bytes_for_download = _ConditionalInputHandler.bytes_sent[0]
+
+    text = aoc_requests.fetch_input(year="2022", day="1", revalidate=True)
+    bytes_for_revalidation = _ConditionalInputHandler.bytes_sent[0] - bytes_for_download
+
+    assert text == _ConditionalInputHandler.body.decode().rstrip()
+    assert bytes_for_revalidation < 200 < bytes_for_download
+    headers = _ConditionalInputHandler.request_headers[-1]
+    assert headers["If-None-Match"] == _ConditionalInputHandler.etag
+    assert headers["If-Modified-Since"] == _ConditionalInputHandler.last_modified
+
+
+def test_fetch_input_revalidates_with_last_modified_only(
+    conditional_server: ThreadingHTTPServer, temp_cache: input_cache.InputCache
+) -> None:
+    """It sends If-Modified-Since alone when no ETag was saved."""
+    temp_cache.put(
+        year="2022",
+        day="1",
+        text="cached",
+        last_modified=_ConditionalInputHandler.last_modified,
+    )
+    assert aoc_requests.fetch_input(year="2022", day="1", revalidate=True) == "cached"
+    assert "If-None-Match" not in _ConditionalInputHandler.request_headers[-1]
+
+
+def test_fetch_input_downloads_changed_input(
+    conditional_server: ThreadingHTTPServer, temp_cache: input_cache.InputCache
+) -> None:
+    """It replaces the cached input when the website has a newer one."""
+    temp_cache.put(year="2022", day="1", text="old", etag='"v0"')
+    text = aoc_requests.fetch_input(year="2022", day="1", revalidate=True)
+    assert text == _ConditionalInputHandler.body.decode().rstrip()
+    assert temp_cache.get(year="2022", day="1") == text
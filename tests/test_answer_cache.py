@@ -0,0 +1,152 @@
+"""Test cases for the answer cache module."""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+import glob
+from os import makedirs, path
+
+import pytest
+from pytest_mock import MockFixture
+
+from advent_of_code import answer_cache
+from advent_of_code.answer_cache import AnswerCache
+
+
+@pytest.fixture
+def cache(tmp_path: str) -> AnswerCache:
+    """Fixture to return a cache stored in a temporary folder."""
+    return AnswerCache(root=str(tmp_path))
+
+
+def test_digest_text() -> None:
+    """It returns the SHA-256 digest of the text."""
+    assert answer_cache.digest_text("") == (
+        "e3b0c44298fc1c149afbf4c8996fb92427ae41e4649b934ca495991b7852b855"
+    )
+
+
+def test_digest_module_reads_source() -> None:
+    """It returns a digest of the module's source file."""
+    digest = answer_cache.digest_module("advent_of_code.year_2022.day_1")
+    assert digest is not None and len(digest) == 64
+    assert digest != answer_cache.digest_module("advent_of_code.year_2022.day_2")
+
+
+def test_digest_module_reads_imported_modules(
+    mocker: MockFixture, tmp_path: str
+) -> None:
+    """It changes when a module of the package the module imports changes, even\
+         through another module, but not for modules of other packages."""
+    mocker.patch.object(answer_cache, "PACKAGE_DIR", str(tmp_path))
+    makedirs(path.join(tmp_path, "year_0"))
+    day = path.join(tmp_path, "year_0", "day_0.py")
+    with open(day, "w") as f:
+        f.write("import os\n\n\ndef main():\n    from advent_of_code import helper\n")
+    with open(path.join(tmp_path, "helper.py"), "w") as f:
+        f.write("from advent_of_code.grid import neighbours\n")
+    grid = path.join(tmp_path, "grid.py")
+    with open(grid, "w") as f:
+        f.write("neighbours = 4\n")
+    spec = mocker.Mock(origin=day)
+    mocker.patch.object(answer_cache, "find_spec", return_value=spec)
+
+    digest = answer_cache.digest_module("advent_of_code.year_0.day_0")
+    assert digest == answer_cache.digest_module("advent_of_code.year_0.day_0")
+    with open(grid, "w") as f:
+        f.write("neighbours = 8\n")
+    assert digest != answer_cache.digest_module("advent_of_code.year_0.day_0")
+
+
+def test_digest_module_without_source() -> None:
+    """It returns None for modules that cannot be found."""
+    assert answer_cache.digest_module("advent_of_code.year_0.day_0") is None
+    assert answer_cache.digest_module("sys") is None
+
+
+def test_put_and_get_answer(cache: AnswerCache) -> None:
+    """It returns the saved answer for the same input and code."""
+    cache.put("2022", "1", "1", input_sha256="a", code_sha256="b", answer=24000)
+    cache.put("2022", "10", "2", input_sha256="a", code_sha256="b", answer="\n#.")
+    assert cache.get("2022", "01", "1", input_sha256="a", code_sha256="b") == 24000
+    assert cache.get("2022", "10", "2", input_sha256="a", code_sha256="b") == "\n#."
+    assert cache.get("2022", "1", "2", input_sha256="a", code_sha256="b") is None
+
+
+def test_changed_input_or_code_is_not_cached(cache: AnswerCache) -> None:
+    """It returns None if the input or the code changed since the answer was saved."""
+    cache.put("2022", "1", "1", input_sha256="a", code_sha256="b", answer=1)
+    assert cache.get("2022", "1", "1", input_sha256="x", code_sha256="b") is None
+    assert cache.get("2022", "1", "1", input_sha256="a", code_sha256="x") is None
+
+
+def test_answers_that_do_not_survive_json_are_not_saved(cache: AnswerCache) -> None:
+    """It does not save answers that would read back differently."""
+    cache.put("2022", "1", "1", input_sha256="a", code_sha256="b", answer=(1, 2))
+    cache.put("2022", "1", "2", input_sha256="a", code_sha256="b", answer=object())
+    cache.put("2022", "2", "1", input_sha256="a", code_sha256="b", answer=None)
+    assert glob.glob(path.join(cache.getpath(), "**", "*.json"), recursive=True) == []
+
+
+def test_least_recently_used_answer_is_evicted(tmp_path: str) -> None:
+    """It evicts the least recently used answer when the cache is full."""
+    cache = AnswerCache(root=str(tmp_path), max_entries=2)
+    cache.put("2022", "1", "1", input_sha256="a", code_sha256="b", answer=1)
+    cache.put("2022", "1", "2", input_sha256="a", code_sha256="b", answer=2)
+    cache.get("2022", "1", "1", input_sha256="a", code_sha256="b")
+    cache.put("2022", "2", "1", input_sha256="a", code_sha256="b", answer=3)
+    assert cache.get("2022", "1", "1", input_sha256="a", code_sha256="b") == 1
+    assert cache.get("2022", "1", "2", input_sha256="a", code_sha256="b") is None
+    assert cache.get("2022", "2", "1", input_sha256="a", code_sha256="b") == 3
+
+
+def test_get_does_not_write_files(cache: AnswerCache) -> None:
+    """It records that an answer was used without changing its file."""
+    cache.put("2022", "1", "1", input_sha256="a", code_sha256="b", answer=1)
+    file_path = path.join(cache.getpath(), "2022", "1", "1.json")
+    with open(file_path, "rb") as f:
+        entry = f.read()
+    assert cache.get("2022", "1", "1", input_sha256="a", code_sha256="b") == 1
+    with open(file_path, "rb") as f:
+        assert f.read() == entry
+
+
+def test_invalidate_removes_every_part(cache: AnswerCache) -> None:
+    """It forgets the answers to both parts of the day, and no other day's."""
+    cache.put("2022", "1", "1", input_sha256="a", code_sha256="b", answer=1)
+    cache.put("2022", "1", "2", input_sha256="a", code_sha256="b", answer=2)
+    cache.put("2022", "11", "1", input_sha256="a", code_sha256="b", answer=3)
+    cache.invalidate("2022", "1")
+    cache.invalidate("2022", "5")
+    assert cache.get("2022", "1", "1", input_sha256="a", code_sha256="b") is None
+    assert cache.get("2022", "1", "2", input_sha256="a", code_sha256="b") is None
+    assert cache.get("2022", "11", "1", input_sha256="a", code_sha256="b") == 3
+
+
+def test_clear_removes_everything(cache: AnswerCache) -> None:
+    """It forgets every answer, even if nothing was saved yet."""
+    cache.clear()
+    cache.put("2022", "1", "1", input_sha256="a", code_sha256="b", answer=1)
+    cache.clear()
+    assert cache.get("2022", "1", "1", input_sha256="a", code_sha256="b") is None
+
+
+def _use_cache(root: str, worker: int) -> list[str]:
+    """Saves and reads answers from one of many processes sharing a cache, and\
+         returns the answers that were not read back."""
+    cache = AnswerCache(root=root, max_entries=100)
+    missing = []
+    for day in range(1, 26):
+        year = str(2000 + worker)
+        cache.put(year, str(day), "1", input_sha256="a", code_sha256="b", answer=day)
+        for _ in range(3):
+            if cache.get(year, str(day), "1", input_sha256="a", code_sha256="b") != day:
+                missing.append("{worker}/{day}".format(worker=worker, day=day))
+    return missing
+
+
+def test_processes_share_the_cache(tmp_path: str) -> None:
+    """It saves and reads answers from many processes at once, keeping at most\
+         `max_entries` of them."""
+    with ProcessPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(partial(_use_cache, str(tmp_path)), range(8)))
+    assert results == [[]] * 8
+    assert len(glob.glob(path.join(tmp_path, "*", "*", "*.json"))) == 100
@@ -0,0 +1,157 @@
+"""Test cases for the bench module."""
+from os import getcwd, path
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockFixture
+
+from advent_of_code import bench, generators, input_sources, map_reduce
+from advent_of_code.year_2022 import day_4
+
+
+@pytest.fixture
+def day_1_input(mocker: MockFixture) -> input_sources.FileSource:
+    """Fixture to read the test input of 2022, day 1."""
+    source = input_sources.FileSource(
+        path.join(getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt")
+    )
+    mocker.patch.object(input_sources, "source", source)
+    return source
+
+
+def test_summarize() -> None:
+    """It returns the min, median, nearest-rank p95 and mean."""
+    summary = bench.summarize([float(t) for t in range(20, 0, -1)])
+    assert summary["min"] == 1
+    assert summary["median"] == 10.5
+    assert summary["p95"] == 19
+    assert summary["mean"] == 10.5
+    assert summary["times"][0] == 20
+
+
+def test_summarize_single_time() -> None:
+    """It handles a single measurement."""
+    assert bench.summarize([2.0])["p95"] == 2.0
+
+
+def test_summarize_without_times() -> None:
+    """It raises a ValueError when there is nothing to summarize."""
+    with pytest.raises(ValueError):
+        bench.summarize([])
+
+
+def test_time_function_warms_up() -> None:
+    """It calls the function for the warmup and the timed repeats."""
+    function = Mock()
+    summary = bench.time_function(function, warmup=2, repeats=3)
+    assert function.call_count == 5
+    assert len(summary["times"]) == 3
+
+
+def test_benchmark_day_serves_input_from_memory(
+    day_1_input: input_sources.FileSource,
+) -> None:
+    """It reads the input once, times parsing it and each part, and keeps the\
+         source."""
+    report = bench.benchmark_day(year="2022", day="1", warmup=1, repeats=3)
+    assert report["year"] == "2022" and report["day"] == "1"
+    assert len(report["results"]["parse"]["times"]) == 3
+    assert len(report["results"]["part_1"]["times"]) == 3
+    assert len(report["results"]["part_2"]["times"]) == 3
+    assert input_sources.source is day_1_input
+
+
+def test_benchmark_day_times_selected_parts(
+    day_1_input: input_sources.FileSource,
+) -> None:
+    """It only times the parts that are asked for, and parsing the input."""
+    report = bench.benchmark_day(year="2022", day="1", repeats=1, parts=["2"])
+    assert list(report["results"]) == ["parse", "part_2"]
+
+
+def test_growth_exponent() -> None:
+    """It fits the exponent of power-law growth."""
+    sizes = [10.0, 20.0, 40.0, 80.0]
+    assert bench.growth_exponent(sizes, [3 * size for size in sizes]) == (
+        pytest.approx(1)
+    )
+    assert bench.growth_exponent(sizes, [size**3 for size in sizes]) == (
+        pytest.approx(3)
+    )
+    assert bench.growth_exponent(sizes, [5.0] * 4) == pytest.approx(0)
+
+
+@pytest.mark.parametrize(
+    "sizes, values",
+    [([1.0, 2.0], [1.0, 0.0]), ([0.0, 2.0], [1.0, 2.0]), ([2.0] * 2, [1.0, 2.0])],
+)
+def test_growth_exponent_rejects_unfit_data(
+    sizes: list[float], values: list[float]
+) -> None:
+    """It raises a ValueError for sizes or values it cannot fit."""
+    with pytest.raises(ValueError):
+        bench.growth_exponent(sizes, values)
+
+
+def test_measure_scaling(day_1_input: input_sources.FileSource) -> None:
+    """It times a part on generated inputs of each scale, and restores the source."""
+    result = bench.measure_scaling("2022", "2", "1", [100, 200, 400], repeats=2)
+    assert [point["scale"] for point in result["points"]] == [100, 200, 400]
+    assert all(point["peak_bytes"] > 0 for point in result["points"])
+    assert result["points"][0]["bytes"] < result["points"][2]["bytes"]
+    assert isinstance(result["time_exponent"], float)
+    assert result["memory_exponent"] < 2
+    assert input_sources.source is day_1_input
+
+
+def test_measure_speedup(mocker: MockFixture) -> None:
+    """It times the chunked solution on a file of the generated input with each\
+         number of workers, relative to one."""
+    mocker.patch.object(map_reduce, "MIN_CHUNK_SIZE", 1)
+    solve_chunked = mocker.spy(day_4, "solve_chunked")
+    result = bench.measure_speedup("2022", "4", "2", 200, [1, 2], repeats=2)
+
+    text = generators.generate("2022", "4", 200)
+    assert result["bytes"] == len(text) + 1
+    assert solve_chunked.call_count == 4
+    assert [call.args[1:] for call in solve_chunked.call_args_list] == [
+        (2, 1),
+        (2, 1),
+        (2, 2),
+        (2, 2),
+    ]
+    assert solve_chunked.spy_return == day_4.solve(text, 2)
+
+    points = result["points"]
+    assert [point["workers"] for point in points] == [1, 2]
+    assert all(point["seconds"] > 0 for point in points)
+    assert points[0]["speedup"] == 1
+    assert points[1]["speedup"] == points[0]["seconds"] / points[1]["seconds"]
+
+
+def test_compare_to_baseline_flags_regressions() -> None:
+    """It only reports targets whose median is slower than the tolerance allows."""
+    baseline = {"results": {"main": {"median": 1.0}, "gone": {"median": 1.0}}}
+    faster = {"results": {"main": {"median": 1.05}, "new": {"median": 9.0}}}
+    slower = {"results": {"main": {"median": 1.2}}}
+    assert bench.compare_to_baseline(faster, baseline, tolerance=0.1) == []
+    regressions = bench.compare_to_baseline(slower, baseline, tolerance=0.1)
+    assert len(regressions) == 1 and regressions[0].startswith("main:")
+
+
+def test_compare_to_baseline_of_zero() -> None:
+    """It reports any time above a baseline of zero, without dividing by it."""
+    baseline = {"results": {"main": {"median": 0.0}}}
+    assert bench.compare_to_baseline(baseline, baseline, tolerance=0.1) == []
+    regressions = bench.compare_to_baseline(
+        {"results": {"main": {"median": 1.0}}}, baseline, tolerance=0.1
+    )
+    assert len(regressions) == 1 and "inf% slower" in regressions[0]
+
+
+def test_save_and_load_report(tmp_path: str) -> None:
+    """It writes the report to JSON and reads it back."""
+    file_path = path.join(tmp_path, "report.json")
+    report = {"year": "2022", "results": {"main": {"median": 1.0}}}
+    bench.save_report(report, file_path)
+    assert bench.load_report(file_path) == report
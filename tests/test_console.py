@@ -1,12 +1,34 @@
 """Test cases for the console module."""
-from os import path
+import json
+from os import getcwd, path
+import subprocess  # noqa: S404
 import sys
+from threading import Thread
+from typing import Iterator
 
 from click.testing import CliRunner
-from mock import Mock, patch
+from mock import ANY, Mock, patch
 import pytest
 
-from advent_of_code import console
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import answer_cache, console, registry, sandbox, server
+from advent_of_code import runner as console_runner
+
+
+@pytest.fixture(autouse=True)
+def temp_answer_cache(tmp_path: str) -> Iterator[answer_cache.AnswerCache]:
+    """Fixture to save answers in a temporary folder instead of the working\
+         directory."""
+    cache = answer_cache.AnswerCache(root=path.join(tmp_path, "answers"))
+    with patch.object(answer_cache, "cache", cache):
+        yield cache
+
+
+@pytest.fixture(autouse=True)
+def restore_cookie() -> Iterator[None]:
+    """Fixture to restore the cookie location that tests replace with a mock."""
+    with patch.object(aoc_requests, "cookie", aoc_requests.cookie):
+        yield
 
 
 @pytest.fixture
@@ -15,6 +37,23 @@ def runner() -> CliRunner:
     return CliRunner()
 
 
+@pytest.fixture
+def day_0() -> Iterator[None]:
+    """Fixture to list the mocked module for year 0, day 0 in the registry."""
+    with patch.dict(
+        registry.load_manifest(),
+        {
+            "0": {
+                "0": {
+                    "module": "advent_of_code.year_0.day_0",
+                    "parts": {"1": "main", "2": "main"},
+                }
+            }
+        },
+    ):
+        yield
+
+
 @pytest.fixture
 def invalidFile() -> str:
     """Test fixture to return an invalid path (an empty string)."""
@@ -41,7 +80,7 @@ def test_get_solution_handles_days_with_no_solution(runner: CliRunner) -> None:
 
 
 def test_get_solution_prereq_does_not_fail_with_day(
-    runner: CliRunner,
+    runner: CliRunner, day_0: None
 ) -> None:
     """It tests that the console runs the solution when the day and year are \
         entered interactively."""
@@ -49,12 +88,13 @@ def test_get_solution_prereq_does_not_fail_with_day(
         # Mock a module
         sys.modules["advent_of_code.year_0.day_0"] = Mock()
         sys.modules["advent_of_code.year_0.day_0"].main.return_value = (0, 0)
-        runner.invoke(console.get_solution_prereq, input="0 \n 0")
+        with patch.object(aoc_requests, "get_input", return_value=""):
+            runner.invoke(console.get_solution_prereq, input="0 \n 0")
         sys.modules["advent_of_code.year_0.day_0"].main.assert_called()
 
 
 def test_get_solution_prereq_does_not_fail_with_year_and_date(
-    runner: CliRunner,
+    runner: CliRunner, day_0: None
 ) -> None:
     """It tests that the console runs the solution when the day and year are entered \
         as options."""
@@ -62,7 +102,8 @@ def test_get_solution_prereq_does_not_fail_with_year_and_date(
         # Mock a module
         sys.modules["advent_of_code.year_0.day_0"] = Mock()
         sys.modules["advent_of_code.year_0.day_0"].main.return_value = (0, 0)
-        runner.invoke(console.get_solution_prereq, ["--year=0", "--day=0"])
+        with patch.object(aoc_requests, "get_input", return_value=""):
+            runner.invoke(console.get_solution_prereq, ["--year=0", "--day=0"])
         sys.modules["advent_of_code.year_0.day_0"].main.assert_called()
 
 
@@ -84,8 +125,8 @@ def test_get_solution_prereq_prompts_cookie_setting(
 ) -> None:
     """It tests that the console module will prompt the user to enter the cookie \
         if no cookie file is found."""
-    console.cookie = Mock()
-    console.cookie.getpath.return_value = invalidFile
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
     result = runner.invoke(console.get_solution_prereq, ["--day=1", "--year=2022"])
     assert (
         result.exit_code == 0
@@ -98,16 +139,16 @@ def test_set_cookie_raises_FileNotFoundError(
     runner: CliRunner, invalidFile: str
 ) -> None:
     """It tests that the function to store cookie will raise FileNotFoundError."""
-    console.cookie = Mock()
-    console.cookie.getpath.return_value = invalidFile
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
     result = runner.invoke(console.set_cookie)
     assert type(result.exception) is FileNotFoundError
 
 
 def test_set_cookie_writes_file_successfully(runner: CliRunner, tempFile: str) -> None:
     """It tests that the function to store cookie will correctly write to a file."""
-    console.cookie = Mock()
-    console.cookie.getpath.return_value = tempFile
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = tempFile
     result = runner.invoke(console.set_cookie, input="teststring")
     with open(tempFile, "r") as f:
         fcontents = f.read()
@@ -117,10 +158,10 @@ def test_set_cookie_writes_file_successfully(runner: CliRunner, tempFile: str) -
 def test_get_cookie_raises_FileNotFoundError(invalidFile: str) -> None:
     """It tests that the function to get cookie will return FileNotFoundError \
         if there is an invalid path."""
-    console.cookie = Mock()
-    console.cookie.getpath.return_value = invalidFile
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
     with pytest.raises(FileNotFoundError):
-        console.get_cookie()
+        aoc_requests.get_cookie()
 
 
 def test_get_cookie_reads_file_successfully(tempFile: str) -> None:
@@ -128,6 +169,581 @@ def test_get_cookie_reads_file_successfully(tempFile: str) -> None:
         can read it."""
     with open(tempFile, "w+") as f:
         f.write("teststring")
-    console.cookie = Mock()
-    console.cookie.getpath.return_value = tempFile
-    assert console.get_cookie() == "teststring"
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = tempFile
+    assert aoc_requests.get_cookie() == "teststring"
+
+
+def test_get_solution_refresh_revalidates_cached_input(
+    runner: CliRunner, day_0: None
+) -> None:
+    """It checks that the cached input is current before running the solution when \
+        refresh is set."""
+    with patch.dict(sys.modules), patch(
+        "advent_of_code.advent_of_code_requests.fetch_input"
+    ) as fetch_mock, patch.object(
+        console.input_sources, "source", console.input_sources.HttpSource()
+    ), patch.object(
+        aoc_requests, "get_input", return_value=""
+    ):
+        sys.modules["advent_of_code.year_0.day_0"] = Mock()
+        sys.modules["advent_of_code.year_0.day_0"].main.return_value = (0, 0)
+        console.get_solution(year="0", day="0", refresh=True)
+        fetch_mock.assert_called_once_with("0", "0", revalidate=True)
+
+
+def test_prefetch_prints_outcome(runner: CliRunner, tempFile: str) -> None:
+    """It prints the outcome of the download for each day."""
+    with open(tempFile, "w+") as f:
+        f.write("teststring")
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = tempFile
+    with patch(
+        "advent_of_code.advent_of_code_requests.prefetch",
+        return_value={"1": "cached", "2": "downloaded"},
+    ) as prefetch_mock:
+        result = runner.invoke(console.prefetch, ["--year=2022", "--workers=2"])
+    prefetch_mock.assert_called_once_with(year="2022", max_workers=2, min_interval=0.5)
+    assert result.stdout == "Day 1: cached\nDay 2: downloaded\n"
+
+
+def test_prefetch_prompts_cookie_setting(runner: CliRunner, invalidFile: str) -> None:
+    """It asks the user to set their cookie before downloading anything."""
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
+    result = runner.invoke(console.prefetch, ["--year=2022"])
+    assert (
+        result.stdout.strip()
+        == "No cookie was found, please use the 'aoc set-cookie' option first"
+    )
+
+
+def test_get_solution_prereq_reads_input_file_without_cookie(
+    runner: CliRunner, invalidFile: str, tempFile: str, day_0: None
+) -> None:
+    """It runs the solution on a local input file even if no cookie is set."""
+    with open(tempFile, "w+") as f:
+        f.write("local input")
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
+    with patch.dict(sys.modules), patch.object(console.input_sources, "source"):
+        sys.modules["advent_of_code.year_0.day_0"] = Mock()
+        sys.modules["advent_of_code.year_0.day_0"].main.side_effect = lambda: (
+            console.input_sources.source.read("0", "0"),
+            0,
+        )
+        result = runner.invoke(
+            console.get_solution_prereq,
+            ["--year=0", "--day=0", "--source=file:{path}".format(path=tempFile)],
+        )
+    assert "Part 1 solution: local input" in result.stdout
+
+
+def test_run_all_prints_table(runner: CliRunner) -> None:
+    """It prints a row for each part, and the error for failed solutions."""
+    results = [
+        console_runner.DayResult(
+            year="2022",
+            day="1",
+            answers=(1, 2),
+            wall_times=(0.5, 0.125),
+            cpu_times=(0.25, 0.0),
+        ),
+        console_runner.DayResult(year="2022", day="2", error="ValueError()"),
+    ]
+    with patch.object(console_runner, "run_all", return_value=results) as run_mock:
+        result = runner.invoke(console.run_all, ["--year=2022", "--source=dir:."])
+    assert run_mock.call_args.args[0][0] == ("2022", "1")
+    assert result.stdout.splitlines() == [
+        "Year  Day  Part  Wall (s)   CPU (s)  Answer",
+        "2022    1     1     0.500     0.250  1",
+        "2022    1     2     0.125     0.000  2",
+        "2022    2     -         -         -  ValueError()",
+    ]
+
+
+def test_run_all_prefetches_inputs(runner: CliRunner, tempFile: str) -> None:
+    """It downloads missing inputs before starting the worker processes."""
+    with open(tempFile, "w+") as f:
+        f.write("teststring")
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = tempFile
+    with patch(
+        "advent_of_code.advent_of_code_requests.prefetch"
+    ) as prefetch_mock, patch.object(console_runner, "run_all", return_value=[]):
+        runner.invoke(console.run_all, ["--year=2022"])
+    prefetch_mock.assert_called_once_with(
+        year="2022", days=[str(day) for day in range(1, 12)]
+    )
+
+
+def test_run_all_rejects_stdin(runner: CliRunner) -> None:
+    """It refuses to read several inputs from standard input."""
+    result = runner.invoke(console.run_all, ["--source=stdin"])
+    assert result.exit_code == 2
+
+
+def test_run_all_handles_years_with_no_solution(runner: CliRunner) -> None:
+    """It returns an error message if there are no solutions for the year."""
+    result = runner.invoke(console.run_all, ["--year=1900"])
+    assert result.stdout.strip() == "Sorry, there are no answers for that year yet :("
+
+
+def test_bench_flags_regressions(runner: CliRunner, tmp_path: str) -> None:
+    """It writes the timings, and exits with an error when they regressed."""
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    baseline_file = path.join(tmp_path, "baseline.json")
+    options = [
+        "-y",
+        "2022",
+        "-d",
+        "1",
+        "--repeats",
+        "2",
+        "--source",
+        "file:" + input_file,
+    ]
+
+    result = runner.invoke(console.bench, options + ["-o", baseline_file])
+    assert result.exit_code == 0 and "part_1: min" in result.stdout
+    assert "part_2: min" in result.stdout
+
+    with open(baseline_file, "r") as f:
+        baseline = json.load(f)
+    for timings in baseline["results"].values():
+        timings["median"] = 0
+    with open(baseline_file, "w") as f:
+        json.dump(baseline, f)
+    result = runner.invoke(
+        console.bench, options + ["--baseline", baseline_file, "--tolerance", "0"]
+    )
+    assert result.exit_code == 1 and "Regression: part_1" in result.stdout
+
+
+def test_bench_handles_days_with_no_solution(runner: CliRunner) -> None:
+    """It returns an error message if no solution is found."""
+    result = runner.invoke(
+        console.bench, ["-y", "1900", "-d", "35", "--source", "file:missing.txt"]
+    )
+    assert result.stdout.strip() == "Sorry, there's no answer for that day yet :("
+
+
+@pytest.mark.parametrize(
+    "option", [["--repeats", "0"], ["--warmup", "-1"], ["--tolerance", "-0.5"]]
+)
+def test_bench_rejects_invalid_options(runner: CliRunner, option: list[str]) -> None:
+    """It needs at least one timed run, and no negative number of warmup runs or\
+         tolerance."""
+    result = runner.invoke(
+        console.bench, ["-y", "2022", "-d", "1", "--source", "file:x.txt"] + option
+    )
+    assert result.exit_code == 2 and option[0] in result.output
+
+
+def test_get_solution_profiles_solution(runner: CliRunner, tmp_path: str) -> None:
+    """It writes a .pstats file and the top allocation sites for each part when\
+         asked to."""
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    result = runner.invoke(
+        console.get_solution_prereq,
+        [
+            "-y",
+            "2022",
+            "-d",
+            "1",
+            "--source",
+            "file:" + input_file,
+            "--profile",
+            "--trace-memory",
+            "--profile-dir",
+            str(tmp_path),
+        ],
+    )
+    assert "Part 1 solution: 24000" in result.stdout
+    assert "Peak traced memory" in result.stdout
+    assert "Part 2 solution: 45000" in result.stdout
+    for part in ["1", "2"]:
+        name = path.join(tmp_path, "year_2022_day_1_part_" + part)
+        assert path.exists(name + ".pstats")
+        assert path.exists(name + "_memory.txt")
+        assert "Top allocation sites for year_2022_day_1_part_" + part in result.stdout
+
+
+def test_cli_does_not_import_requests_at_start_up() -> None:
+    """It only imports the requests package once a request is sent, so commands\
+         that never access the website start quickly."""
+    completed = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import sys; import advent_of_code.console; "
+            "print('requests' in sys.modules)",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == "False"
+
+
+def test_gen_writes_input(runner: CliRunner, tmp_path: str) -> None:
+    """It writes the same generated input to standard output and to a file."""
+    result = runner.invoke(console.gen, ["-y", "2022", "-d", "2", "-k", "3"])
+    assert result.exit_code == 0
+    assert len(result.stdout.splitlines()) == 3
+
+    output = path.join(tmp_path, "day_2.txt")
+    runner.invoke(console.gen, ["-y", "2022", "-d", "2", "-k", "3", "-o", output])
+    with open(output, "r") as f:
+        assert f.read() == result.stdout
+
+
+def test_gen_handles_days_with_no_generator() -> None:
+    """It exits with an error code when a day has no generator."""
+    result = CliRunner(mix_stderr=False).invoke(
+        console.gen, ["-y", "2022", "-d", "25", "-k", "3"]
+    )
+    assert result.exit_code == 1
+    assert "no generator" in result.stderr
+
+
+def test_list_solutions(runner: CliRunner) -> None:
+    """It lists the solved days of each year."""
+    result = runner.invoke(console.list_solutions, ["-y", "2022"])
+    assert result.stdout == "2022: days 1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11\n"
+
+
+def test_list_solutions_for_unsolved_year(runner: CliRunner) -> None:
+    """It tells the user when a year has no solutions."""
+    result = runner.invoke(console.list_solutions, ["-y", "1900"])
+    assert "no answers for that year" in result.stdout
+
+
+def test_get_solution_prereq_reads_input_file_option(
+    runner: CliRunner, invalidFile: str
+) -> None:
+    """It runs the solution on the given input file without needing a cookie."""
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    with patch.object(console.input_sources, "source"):
+        result = runner.invoke(
+            console.get_solution_prereq,
+            ["-y", "2022", "-d", "1", "--input-file", input_file, "--source", "http"],
+        )
+    assert "Part 1 solution: 24000" in result.stdout
+    assert "Part 2 solution: 45000" in result.stdout
+
+
+def test_get_solution_prereq_reads_input_from_stdin(
+    runner: CliRunner, invalidFile: str
+) -> None:
+    """It reads the input from standard input when the input file is '-'."""
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
+    with open(
+        path.join(getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt")
+    ) as f:
+        text = f.read()
+    with patch.object(console.input_sources, "source"):
+        result = runner.invoke(
+            console.get_solution_prereq,
+            ["-y", "2022", "-d", "1", "-i", "-"],
+            input=text,
+        )
+    assert "Part 1 solution: 24000" in result.stdout
+
+
+def test_get_solution_prereq_solves_one_part(runner: CliRunner) -> None:
+    """It only solves the part that is asked for."""
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_11_input.txt"
+    )
+    with patch(
+        "advent_of_code.year_2022.day_11.return_two_most_active_monkeys",
+        return_value=(2, 3),
+    ) as simulation_mock, patch.object(console.input_sources, "source"):
+        result = runner.invoke(
+            console.get_solution_prereq,
+            ["-y", "2022", "-d", "11", "--part", "2", "-i", input_file],
+        )
+    simulation_mock.assert_called_once_with(
+        ANY, reduce_stress_level=False, cycles=10000
+    )
+    assert result.stdout.splitlines()[1:] == ["Part 2 solution: 6"]
+
+
+def test_get_solution_reuses_saved_answers(
+    runner: CliRunner, temp_answer_cache: answer_cache.AnswerCache
+) -> None:
+    """It prints the saved answers without running the solution again, unless the\
+         cache is turned off."""
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    options = ["-y", "2022", "-d", "1", "-i", input_file]
+    with patch.object(console.input_sources, "source"):
+        first = runner.invoke(console.get_solution_prereq, options)
+        with patch(
+            "advent_of_code.year_2022.day_1.part_1_solution", return_value=-1
+        ) as part_1_mock:
+            second = runner.invoke(console.get_solution_prereq, options + ["-p", "1"])
+            part_1_mock.assert_not_called()
+            third = runner.invoke(console.get_solution_prereq, options + ["--no-cache"])
+            part_1_mock.assert_called_once()
+    assert first.stdout.splitlines()[1:] == [
+        "Part 1 solution: 24000",
+        "Part 2 solution: 45000",
+    ]
+    assert second.stdout.splitlines()[1:] == ["Part 1 solution: 24000"]
+    assert "Part 1 solution: -1" in third.stdout
+
+
+def test_get_solution_recomputes_for_changed_input(
+    runner: CliRunner, tempFile: str
+) -> None:
+    """It runs the solution again when the input is different."""
+    with patch.object(console.input_sources, "source"):
+        for text, expected in (("1\n\n2", "2"), ("1\n\n3", "3")):
+            with open(tempFile, "w") as f:
+                f.write(text)
+            result = runner.invoke(
+                console.get_solution_prereq, ["-y", "2022", "-d", "1", "-i", tempFile]
+            )
+            assert "Part 1 solution: {}".format(expected) in result.stdout
+
+
+def test_get_solution_prereq_solves_on_server(
+    runner: CliRunner, invalidFile: str, tmp_path: str
+) -> None:
+    """It prints the answers computed by a running server, without needing a\
+         cookie."""
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    address = path.join(tmp_path, "aoc.sock")
+    with server.serve(address) as solver:
+        thread = Thread(target=solver.serve_forever, kwargs={"poll_interval": 0.05})
+        thread.start()
+        with patch.object(console.input_sources, "source"):
+            from_file = runner.invoke(
+                console.get_solution_prereq,
+                ["-y", "2022", "-d", "1", "-i", input_file, "--server", address],
+            )
+            from_stdin = runner.invoke(
+                console.get_solution_prereq,
+                ["-y", "2022", "-d", "1", "-p", "2", "-i", "-", "--server", address],
+                input="1\n\n2\n\n3\n",
+            )
+            unsolved = runner.invoke(
+                console.get_solution_prereq,
+                ["-y", "2022", "-d", "26", "--server", address],
+            )
+        solver.shutdown()
+        thread.join()
+    assert from_file.stdout.splitlines()[1:] == [
+        "Part 1 solution: 24000",
+        "Part 2 solution: 45000",
+    ]
+    assert from_stdin.stdout.splitlines()[1:] == ["Part 2 solution: 6"]
+    assert "there's no answer for that day" in unsolved.stdout
+
+
+def test_serve_rejects_public_address(runner: CliRunner) -> None:
+    """It does not start a server that other machines could reach."""
+    result = runner.invoke(console.serve, ["-a", "0.0.0.0:8765"])
+    assert result.exit_code == 2
+    assert "loopback" in result.output
+
+
+def test_get_solution_prereq_handles_unreachable_server(
+    runner: CliRunner, tmp_path: str
+) -> None:
+    """It tells the user to start the server when nothing is listening."""
+    result = runner.invoke(
+        console.get_solution_prereq,
+        ["-y", "2022", "-d", "1", "--server", path.join(tmp_path, "aoc.sock")],
+    )
+    assert "Could not reach the server" in result.stdout
+
+
+def test_serve_stops_on_keyboard_interrupt(runner: CliRunner, tmp_path: str) -> None:
+    """It serves until interrupted, and removes the socket file."""
+    address = path.join(tmp_path, "aoc.sock")
+    with patch(
+        "advent_of_code.server.UnixSolverServer.serve_forever",
+        side_effect=KeyboardInterrupt,
+    ):
+        result = runner.invoke(console.serve, ["-a", address])
+    assert result.exit_code == 0
+    assert "Serving on {}".format(address) in result.stdout
+    assert not path.exists(address)
+
+
+def test_get_solution_prereq_runs_parts_with_limits(runner: CliRunner) -> None:
+    """It solves each part in its own process, and prints the peak memory used."""
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    with patch.object(console.input_sources, "source"):
+        result = runner.invoke(
+            console.get_solution_prereq,
+            ["-y", "2022", "-d", "1", "-i", input_file, "--timeout", "30"],
+        )
+    assert result.exit_code == 0
+    lines = result.stdout.splitlines()
+    assert lines[1].startswith("Part 1 solution: 24000 (peak memory ")
+    assert lines[2].startswith("Part 2 solution: 45000 (peak memory ")
+
+
+def test_get_solution_prereq_reports_limits(runner: CliRunner) -> None:
+    """It tells apart parts that ran out of time, ran out of memory or failed, and\
+         exits with an error code."""
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    options = ["-y", "2022", "-d", "1", "-i", input_file, "--no-cache"]
+    outcomes = [
+        (["--timeout", "0.5"], sandbox.TIMEOUT, "Part 1 timed out after 0.5 seconds"),
+        (
+            ["--max-memory", "64"],
+            sandbox.MEMORY_LIMIT,
+            "Part 1 went over the memory limit of 64 MiB",
+        ),
+    ]
+    with patch.object(console.input_sources, "source"):
+        for limit, status, message in outcomes:
+            with patch(
+                "advent_of_code.sandbox.run_part",
+                return_value=sandbox.SandboxResult(part="1", status=status),
+            ):
+                result = runner.invoke(
+                    console.get_solution_prereq, options + ["-p", "1"] + limit
+                )
+            assert result.exit_code == 1
+            assert message in result.stdout
+
+        with patch(
+            "advent_of_code.sandbox.run_part",
+            return_value=sandbox.SandboxResult(
+                part="1", status=sandbox.ERROR, error="ValueError()"
+            ),
+        ):
+            result = runner.invoke(
+                console.get_solution_prereq, options + ["-p", "1", "--max-memory", "1"]
+            )
+    assert result.exit_code == 1
+    assert "Part 1 failed: ValueError()" in result.stdout
+
+
+def test_get_solution_prereq_rejects_conflicting_options(runner: CliRunner) -> None:
+    """It does not profile parts that run on their own, or send them to a server."""
+    profiled = runner.invoke(
+        console.get_solution_prereq,
+        ["-y", "2022", "-d", "1", "--timeout", "1", "--profile"],
+    )
+    served = runner.invoke(
+        console.get_solution_prereq,
+        ["-y", "2022", "-d", "1", "--format", "json", "--server", "aoc.sock"],
+    )
+    assert profiled.exit_code == served.exit_code == 2
+    assert "--profile and --trace-memory cannot be used with" in profiled.output
+    assert "--server cannot be used with" in served.output
+
+
+def test_get_solution_prereq_writes_trace(tmp_path: str) -> None:
+    """It writes a Chrome trace with a span for reading the input, parsing it once,\
+         and each part, whether or not the answers are saved."""
+    trace = path.join(tmp_path, "trace.json")
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_8_input.txt"
+    )
+    options = ["-y", "2022", "-d", "8", "-i", input_file, "--trace", trace]
+    for cache_option in ["--no-cache", "--cache"]:
+        with patch.object(console.input_sources, "source"):
+            result = CliRunner(mix_stderr=False).invoke(
+                console.get_solution_prereq, options + [cache_option]
+            )
+        assert "Part 1 solution: 21" in result.stdout
+        assert "Trace written to" in result.stderr
+        with open(trace, "r") as f:
+            names = [event["name"] for event in json.load(f)["traceEvents"]]
+        assert names.count("get_input") == names.count("parse") == 1
+        assert "part_1" in names and "part_2" in names
+        assert names[-1] == "get-solution"
+
+    served = CliRunner().invoke(
+        console.get_solution_prereq, options + ["--server", "aoc.sock"]
+    )
+    assert served.exit_code == 2
+
+
+def test_get_solution_prereq_prints_ndjson_records(
+    runner: CliRunner, invalidFile: str
+) -> None:
+    """It prints one JSON record per part, with the time spent in each phase."""
+    aoc_requests.cookie = Mock()
+    aoc_requests.cookie.getpath.return_value = invalidFile
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    options = ["-y", "2022", "-d", "1", "-i", input_file, "--format", "ndjson"]
+    with patch.object(console.input_sources, "source"):
+        first = runner.invoke(console.get_solution_prereq, options)
+        second = runner.invoke(console.get_solution_prereq, options + ["-p", "2"])
+    records = [json.loads(line) for line in first.stdout.splitlines()]
+    assert [(r["year"], r["day"], r["part"], r["answer"]) for r in records] == [
+        (2022, 1, 1, 24000),
+        (2022, 1, 2, 45000),
+    ]
+    for record in records:
+        assert record["status"] == "ok" and record["cached"] is False
+        assert record["fetch_seconds"] >= 0 and record["solve_seconds"] >= 0
+        assert record["parse_seconds"] >= 0 and record["peak_rss_bytes"] > 0
+    # The input is parsed once for both parts
+    assert records[0]["parse_seconds"] == records[1]["parse_seconds"]
+
+    cached = json.loads(second.stdout)
+    assert cached["part"] == 2 and cached["answer"] == 45000
+    assert cached["cached"] is True and cached["solve_seconds"] is None
+
+
+def test_get_solution_prereq_prints_json_records(runner: CliRunner) -> None:
+    """It prints a JSON list of records, including parts stopped by a limit."""
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    with patch.object(console.input_sources, "source"), patch(
+        "advent_of_code.sandbox.run_part",
+        return_value=sandbox.SandboxResult(
+            part="1", status=sandbox.TIMEOUT, wall_time=1.0
+        ),
+    ):
+        result = runner.invoke(
+            console.get_solution_prereq,
+            ["-y", "2022", "-d", "1", "-i", input_file, "--timeout", "1"]
+            + ["--format", "json", "--no-cache"],
+        )
+    assert result.exit_code == 1
+    records = json.loads(result.stdout)
+    assert [r["part"] for r in records] == [1, 2]
+    assert all(r["status"] == "timeout" and r["answer"] is None for r in records)
+    assert records[0]["solve_seconds"] == 1.0
+
+
+def test_get_solution_prereq_keeps_records_parseable() -> None:
+    """It prints errors to standard error when printing records."""
+    result = CliRunner(mix_stderr=False).invoke(
+        console.get_solution_prereq,
+        ["-y", "2022", "-d", "26", "--source", "file:input.txt", "--format", "json"],
+    )
+    assert result.stdout == ""
+    assert "there's no answer for that day" in result.stderr
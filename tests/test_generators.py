@@ -0,0 +1,84 @@
+"""Test cases for the generators module."""
+from importlib import import_module
+
+import pytest
+
+from advent_of_code import generators
+
+
+@pytest.mark.parametrize("day", list(generators.GENERATORS["2022"]))
+def test_generated_inputs_are_solved(day: str) -> None:
+    """It generates inputs that the solution of each day can solve."""
+    text = generators.generate("2022", day, 40)
+    solution = import_module("advent_of_code.year_2022.day_" + day)
+    parsed = solution.parse(text)
+    assert solution.part_1(parsed) is not None
+    assert solution.part_2(parsed) is not None
+
+
+def test_generate_is_deterministic() -> None:
+    """It generates the same input for the same seed, and another for another seed."""
+    assert generators.generate("2022", "9", 50) == generators.generate("2022", "9", 50)
+    assert generators.generate("2022", "9", 50) != generators.generate(
+        "2022", "9", 50, seed=1
+    )
+
+
+@pytest.mark.parametrize(
+    "year, day, scale", [("2022", "25", 1), ("1900", "1", 1), ("2022", "1", 0)]
+)
+def test_generate_rejects_unknown_days(year: str, day: str, scale: int) -> None:
+    """It raises a ValueError when there is no generator, or the scale is too small."""
+    with pytest.raises(ValueError):
+        generators.generate_lines(year, day, scale)
+
+
+def test_generate_lines_scale_with_the_input() -> None:
+    """It generates as many lines (or characters, or trees) as the scale asks for."""
+    assert len(list(generators.generate_lines("2022", "2", 123))) == 123
+    assert len(generators.generate("2022", "6", 5000)) == 5000
+    trees = list(generators.generate_lines("2022", "8", 30))
+    assert len(trees) == 30 and all(len(row) == 30 for row in trees)
+
+
+def test_rucksacks_share_a_single_item() -> None:
+    """It only puts one item type in both compartments, and one badge in a group."""
+    rucksacks = list(generators.generate_lines("2022", "3", 100))
+    assert len(rucksacks) == 102
+    for rucksack in rucksacks:
+        half = len(rucksack) // 2
+        assert len(set(rucksack[:half]) & set(rucksack[half:])) == 1
+    for group in range(0, len(rucksacks), 3):
+        first, second, third = rucksacks[group : group + 3]
+        assert len(set(first) & set(second) & set(third)) == 1
+
+
+def test_datastream_markers_are_at_the_end() -> None:
+    """It puts both markers at the end of the datastream."""
+    text = generators.generate("2022", "6", 1000)
+    day_6 = import_module("advent_of_code.year_2022.day_6")
+    assert day_6.part_1(day_6.parse(text)) == 1000 - 10
+    assert day_6.part_2(day_6.parse(text)) == 1000
+
+
+def test_file_system_is_deep() -> None:
+    """It lists every directory once, in a tree much deeper than it is wide."""
+    lines = list(generators.generate_lines("2022", "7", 300))
+    assert lines.count("$ ls") == 300
+    depth = deepest = 0
+    for line in lines:
+        if line == "$ cd ..":
+            depth -= 1
+        elif line.startswith("$ cd d"):
+            depth += 1
+            deepest = max(deepest, depth)
+    assert deepest > 30
+
+
+def test_monkeys_never_throw_to_themselves() -> None:
+    """It makes each monkey throw its items to two other monkeys."""
+    blocks = generators.generate("2022", "11", 50).split("\n\n")
+    assert len(blocks) == 50
+    for monkey, block in enumerate(blocks):
+        targets = [int(line.split()[-1]) for line in block.split("\n")[-2:]]
+        assert monkey not in targets and targets[0] != targets[1]
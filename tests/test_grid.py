@@ -0,0 +1,85 @@
+"""Test cases for the grid module."""
+import pytest
+
+from advent_of_code import grid
+
+
+@pytest.fixture
+def wide() -> grid.Grid:
+    """Fixture to return a grid with 4 columns and 3 rows, holding 0 to 11."""
+    return grid.Grid(4, 3, bytes(range(12)))
+
+
+def test_grid_defaults_to_zeros() -> None:
+    """It creates a grid of zeros when no cells are given."""
+    zeros = grid.Grid(2, 3)
+    assert (zeros.width, zeros.height) == (2, 3)
+    assert zeros.cells == bytearray(6)
+
+
+@pytest.mark.parametrize(
+    "width, height, cells", [(2, 2, bytes(3)), (-1, 2, None), (2, -1, bytes(0))]
+)
+def test_grid_rejects_wrong_shapes(width: int, height: int, cells: bytes) -> None:
+    """It raises a ValueError when the cells do not fill the grid."""
+    with pytest.raises(ValueError):
+        grid.Grid(width, height, cells)
+
+
+def test_grid_reads_and_writes_cells(wide: grid.Grid) -> None:
+    """It reads and writes cells by row and column, checking bounds."""
+    assert wide[1, 2] == 6
+    wide[1, 2] = 42
+    assert wide.cells[6] == 42 and wide.row(1)[2] == 42
+    assert wide.get(2, 3) == 11
+    assert wide.get(3, 0) is None and wide.get(-1, 0, default=0) == 0
+    with pytest.raises(IndexError):
+        wide[0, 4]
+    with pytest.raises(IndexError):
+        wide[-1, 0] = 1
+
+
+def test_rows_and_columns_are_views(wide: grid.Grid) -> None:
+    """It returns rows and columns that share the grid's memory."""
+    assert [list(row) for row in wide.rows()] == [
+        [0, 1, 2, 3],
+        [4, 5, 6, 7],
+        [8, 9, 10, 11],
+    ]
+    assert [list(col) for col in wide.cols()] == [
+        [0, 4, 8],
+        [1, 5, 9],
+        [2, 6, 10],
+        [3, 7, 11],
+    ]
+    column = wide.col(1)
+    wide[2, 1] = 99
+    assert column[2] == 99 and column.obj is wide.cells
+    with pytest.raises(IndexError):
+        wide.row(3)
+    with pytest.raises(IndexError):
+        wide.col(-1)
+
+
+def test_rays_run_to_the_edge(wide: grid.Grid) -> None:
+    """It returns the cells from a cell to each edge, closest first."""
+    assert [list(ray) for ray in wide.rays(1, 1)] == [[1], [6, 7], [9], [4]]
+    assert [list(ray) for ray in wide.rays(0, 0)] == [[], [1, 2, 3], [4, 8], []]
+    assert [list(ray) for ray in wide.rays(2, 3)] == [[7, 3], [], [], [10, 9, 8]]
+    assert list(wide.ray(2, 0, -1, 1)) == [5, 2]
+    assert list(wide.ray(0, 3, 1, -1)) == [6, 9]
+    assert list(wide.ray(1, 1, 0, 0)) == []
+
+
+def test_neighbours_stay_in_bounds(wide: grid.Grid) -> None:
+    """It only yields neighbours inside the grid."""
+    assert list(wide.neighbours(0, 0)) == [(0, 1), (1, 0)]
+    assert list(wide.neighbours(1, 1)) == [(0, 1), (1, 2), (2, 1), (1, 0)]
+    assert list(wide.neighbours(2, 3, diagonal=True)) == [(1, 3), (2, 2), (1, 2)]
+
+
+def test_from_digits_reads_non_square_grids() -> None:
+    """It reads a grid of digits of any shape."""
+    digits = grid.from_digits("30373\n25512\n")
+    assert (digits.width, digits.height) == (5, 2)
+    assert list(digits.col(4)) == [3, 2]
@@ -0,0 +1,145 @@
+"""Test cases for the input cache module."""
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from os import listdir, path, remove
+
+import pytest
+
+from advent_of_code.input_cache import atomic_write, InputCache
+
+
+@pytest.fixture
+def cache(tmp_path: str) -> InputCache:
+    """Fixture to return a cache stored in a temporary folder."""
+    return InputCache(root=str(tmp_path))
+
+
+def test_get_returns_none_when_not_cached(cache: InputCache) -> None:
+    """It returns None for inputs that were never saved."""
+    assert cache.get(year="2022", day="1") is None
+
+
+def test_put_and_get_input(cache: InputCache) -> None:
+    """It returns the saved input for the same year and day."""
+    cache.put(year="2022", day="1", text="1000\n2000")
+    assert cache.get(year="2022", day="1") == "1000\n2000"
+    assert cache.get(year=" 2022", day="01 ") == "1000\n2000"
+
+
+def test_identical_inputs_share_an_object(cache: InputCache) -> None:
+    """It stores inputs with the same contents only once."""
+    cache.put(year="2022", day="1", text="same")
+    cache.put(year="2022", day="2", text="same")
+    assert len(listdir(path.join(cache.getpath(), "objects"))) == 1
+    assert cache.size() == len("same")
+
+
+def test_put_replaces_previous_input(cache: InputCache) -> None:
+    """It removes the old object when an input is saved again."""
+    cache.put(year="2022", day="1", text="old")
+    cache.put(year="2022", day="1", text="new")
+    assert cache.get(year="2022", day="1") == "new"
+    assert len(listdir(path.join(cache.getpath(), "objects"))) == 1
+
+
+def test_least_recently_used_input_is_evicted(tmp_path: str) -> None:
+    """It evicts the least recently used input when the cache is full."""
+    cache = InputCache(root=str(tmp_path), max_bytes=10)
+    cache.put(year="2022", day="1", text="aaaa")
+    cache.put(year="2022", day="2", text="bbbb")
+    cache.get(year="2022", day="1")
+    cache.put(year="2022", day="3", text="cccc")
+    assert cache.get(year="2022", day="1") == "aaaa"
+    assert cache.get(year="2022", day="2") is None
+    assert cache.get(year="2022", day="3") == "cccc"
+
+
+def test_input_larger_than_cache_is_kept(tmp_path: str) -> None:
+    """It keeps the newest input even if it is larger than the cache."""
+    cache = InputCache(root=str(tmp_path), max_bytes=1)
+    cache.put(year="2022", day="1", text="aaaa")
+    assert cache.get(year="2022", day="1") == "aaaa"
+
+
+def test_invalidate_removes_input(cache: InputCache) -> None:
+    """It forgets the input and deletes its object."""
+    cache.put(year="2022", day="1", text="aaaa")
+    cache.invalidate(year="2022", day="1")
+    cache.invalidate(year="2022", day="2")
+    assert cache.get(year="2022", day="1") is None
+    assert listdir(path.join(cache.getpath(), "objects")) == []
+
+
+def test_missing_object_is_treated_as_not_cached(cache: InputCache) -> None:
+    """It returns None if the object file was deleted by hand."""
+    cache.put(year="2022", day="1", text="aaaa")
+    objects = path.join(cache.getpath(), "objects")
+    remove(path.join(objects, listdir(objects)[0]))
+    assert cache.get(year="2022", day="1") is None
+
+
+def test_get_path_returns_object_file(cache: InputCache) -> None:
+    """It returns the path of the file holding the cached input."""
+    assert cache.get_path(year="2022", day="1") is None
+    cache.put(year="2022", day="1", text="aaaa")
+    object_path = cache.get_path(year="2022", day="1")
+    assert object_path is not None
+    with open(object_path, "r") as f:
+        assert f.read() == "aaaa"
+
+
+def test_get_does_not_write_the_index(cache: InputCache) -> None:
+    """It records that an input was used without changing the index."""
+    cache.put(year="2022", day="1", text="aaaa")
+    with open(path.join(cache.getpath(), "index.json"), "rb") as f:
+        index = f.read()
+    assert cache.get(year="2022", day="1") == "aaaa"
+    assert cache.get_path(year="2022", day="1") is not None
+    with open(path.join(cache.getpath(), "index.json"), "rb") as f:
+        assert f.read() == index
+
+
+def test_missing_object_is_dropped_from_the_index(cache: InputCache) -> None:
+    """It forgets inputs whose object was deleted the next time an input is saved."""
+    cache.put(year="2022", day="1", text="aaaa")
+    objects = path.join(cache.getpath(), "objects")
+    remove(path.join(objects, listdir(objects)[0]))
+    cache.put(year="2022", day="2", text="bb")
+    assert cache.size() == 2
+
+
+def test_atomic_write_leaves_no_temporary_files(tmp_path: str) -> None:
+    """It replaces the file, and removes its temporary file when writing fails."""
+    file_path = path.join(tmp_path, "file")
+    atomic_write(file_path, b"first")
+    atomic_write(file_path, b"second")
+    with pytest.raises(TypeError):
+        atomic_write(file_path, "not bytes")  # type: ignore[arg-type]
+    assert listdir(tmp_path) == ["file"]
+    with open(file_path, "rb") as f:
+        assert f.read() == b"second"
+
+
+def _use_cache(root: str, worker: int) -> list[str]:
+    """Saves and reads inputs from one of many processes sharing a cache, and\
+         returns the inputs that were not read back."""
+    cache = InputCache(root=root)
+    missing = []
+    for day in range(1, 26):
+        text = "{day}\n".format(day=day) * (worker + 1)
+        cache.put(year=str(2000 + worker), day=str(day), text=text)
+        for _ in range(3):
+            if cache.get(year=str(2000 + worker), day=str(day)) != text:
+                missing.append("{worker}/{day}".format(worker=worker, day=day))
+    return missing
+
+
+def test_processes_share_the_cache(tmp_path: str) -> None:
+    """It saves and reads inputs from many processes at once without losing any."""
+    with ProcessPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(partial(_use_cache, str(tmp_path)), range(8)))
+    assert results == [[]] * 8
+    cache = InputCache(root=str(tmp_path))
+    assert all(
+        cache.get(year=str(2000 + worker), day="25") is not None for worker in range(8)
+    )
@@ -0,0 +1,159 @@
+"""Test cases for the input sources module."""
+from io import StringIO
+from os import makedirs, path
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockFixture
+
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import input_cache, input_sources
+
+
+@pytest.fixture
+def temp_cache(mocker: MockFixture, tmp_path: str) -> input_cache.InputCache:
+    """Fixture to store cached inputs in a temporary folder."""
+    cache = input_cache.InputCache(root=path.join(tmp_path, "cache"))
+    mocker.patch.object(input_cache, "cache", cache)
+    return cache
+
+
+@pytest.fixture
+def mock_download(mocker: MockFixture) -> Mock:
+    """Fixture for mocking the download of inputs from the website."""
+    return mocker.patch(
+        "advent_of_code.advent_of_code_requests.download_input",
+        return_value=aoc_requests.Download(text="downloaded"),
+    )
+
+
+def test_http_source_downloads_and_caches(
+    temp_cache: input_cache.InputCache, mock_download: Mock
+) -> None:
+    """It downloads the input once, then reads it from the cache."""
+    source = input_sources.HttpSource()
+    assert source.read(year="2022", day="1") == "downloaded"
+    assert source.read(year="2022", day="1") == "downloaded"
+    mock_download.assert_called_once_with("2022", "1")
+    assert temp_cache.get(year="2022", day="1") == "downloaded"
+
+
+def test_file_source_reads_file(tmp_path: str) -> None:
+    """It returns the contents of the file for any challenge."""
+    file_path = path.join(tmp_path, "input.txt")
+    with open(file_path, "w") as f:
+        f.write("1\n2\n\n")
+    source = input_sources.FileSource(file_path)
+    assert source.read(year="2022", day="1") == "1\n2"
+    assert source.read(year="2022", day="5") == "1\n2"
+
+
+def test_directory_source_reads_file_per_day(tmp_path: str) -> None:
+    """It reads the file named after the requested year and day."""
+    makedirs(path.join(tmp_path, "2022"))
+    for day in (1, 2):
+        with open(path.join(tmp_path, "2022", f"day_{day}.txt"), "w") as f:
+            f.write(f"day {day}\n")
+    source = input_sources.DirectorySource(str(tmp_path))
+    assert source.read(year="2022", day="1") == "day 1"
+    assert source.read(year="2022", day="02") == "day 2"
+
+
+def test_directory_source_raises_FileNotFoundError(tmp_path: str) -> None:
+    """It names the missing file when there is no input for the challenge."""
+    source = input_sources.DirectorySource(str(tmp_path))
+    with pytest.raises(FileNotFoundError, match="day_3.txt"):
+        source.read(year="2022", day="3")
+
+
+def test_stdin_source_reads_once(mocker: MockFixture) -> None:
+    """It reads standard input once and returns the same text afterwards."""
+    mocker.patch("sys.stdin", StringIO("a\nb\n"))
+    source = input_sources.StdinSource()
+    assert source.read(year="2022", day="1") == "a\nb"
+    assert source.read(year="2022", day="1") == "a\nb"
+
+
+@pytest.mark.parametrize(
+    "spec, source_type",
+    [
+        ("http", input_sources.HttpSource),
+        ("stdin", input_sources.StdinSource),
+        ("-", input_sources.StdinSource),
+        ("file:input.txt", input_sources.FileSource),
+        ("dir:inputs", input_sources.DirectorySource),
+    ],
+)
+def test_from_spec(spec: str, source_type: type) -> None:
+    """It creates the source matching the description."""
+    assert isinstance(input_sources.from_spec(spec), source_type)
+
+
+@pytest.mark.parametrize("spec", ["ftp", "file", "file:", "http:x"])
+def test_from_spec_raises_ValueError(spec: str) -> None:
+    """It rejects descriptions that it does not recognize."""
+    with pytest.raises(ValueError):
+        input_sources.from_spec(spec)
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["1\n2\n\n3\n", "1\n2\n\n3", "a \n\n  \nb  \n\n \n", "\n\nx", "", "\n \n", "x"],
+)
+def test_iter_file_lines_matches_rstrip_and_split(tmp_path: str, text: str) -> None:
+    """It yields the same lines as reading the whole file, stripping and splitting."""
+    file_path = path.join(tmp_path, "input.txt")
+    with open(file_path, "w") as f:
+        f.write(text)
+    assert list(input_sources.iter_file_lines(file_path)) == text.rstrip().split("\n")
+
+
+def test_file_sources_read_lines(tmp_path: str) -> None:
+    """It streams the lines of local files."""
+    makedirs(path.join(tmp_path, "2022"))
+    file_path = path.join(tmp_path, "2022", "day_1.txt")
+    with open(file_path, "w") as f:
+        f.write("1\n2\n\n")
+    assert list(input_sources.FileSource(file_path).read_lines("2022", "1")) == [
+        "1",
+        "2",
+    ]
+    directory_source = input_sources.DirectorySource(str(tmp_path))
+    assert list(directory_source.read_lines("2022", "1")) == ["1", "2"]
+    with pytest.raises(FileNotFoundError):
+        directory_source.read_lines("2022", "2")
+
+
+def test_http_source_read_lines_streams_cached_input(
+    temp_cache: input_cache.InputCache, mock_download: Mock
+) -> None:
+    """It downloads the input if required, then streams it from the cache."""
+    mock_download.return_value = aoc_requests.Download(text="a\nb")
+    source = input_sources.HttpSource()
+    assert list(source.read_lines(year="2022", day="1")) == ["a", "b"]
+    assert list(source.read_lines(year="2022", day="1")) == ["a", "b"]
+    mock_download.assert_called_once_with("2022", "1")
+
+
+def test_http_source_read_lines_without_room_in_cache(
+    mocker: MockFixture, mock_download: Mock
+) -> None:
+    """It still returns the input when the cache cannot keep it."""
+    cache = mocker.patch.object(input_cache, "cache")
+    cache.get.return_value = None
+    cache.get_path.return_value = None
+    mock_download.return_value = aoc_requests.Download(text="a\nb")
+    assert list(input_sources.HttpSource().read_lines("2022", "1")) == ["a", "b"]
+
+
+def test_stdin_source_read_lines(mocker: MockFixture) -> None:
+    """It splits standard input into lines."""
+    mocker.patch("sys.stdin", StringIO("a\nb\n"))
+    assert list(input_sources.StdinSource().read_lines("2022", "1")) == ["a", "b"]
+
+
+def test_text_source_serves_text() -> None:
+    """It returns the stored text for any challenge."""
+    source = input_sources.TextSource("a\nb")
+    assert source.read(year="2022", day="1") == "a\nb"
+    assert list(source.read_lines(year="2022", day="9")) == ["a", "b"]
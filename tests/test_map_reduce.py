@@ -0,0 +1,141 @@
+"""Test cases for the map_reduce module."""
+from os import path
+import tracemalloc
+
+import pytest
+from pytest_mock import MockFixture
+
+from advent_of_code import map_reduce
+
+
+def _slices(buffer: bytes, ranges: list[tuple[int, int]]) -> list[bytes]:
+    """Returns the part of the buffer in each range."""
+    return [buffer[start:end] for start, end in ranges]
+
+
+@pytest.mark.parametrize("chunks", [1, 2, 3, 5, 20])
+def test_ranges_between_lines(chunks: int) -> None:
+    """It splits into at most `chunks` ranges of whole lines, which join back into\
+         the input."""
+    buffer = b"\n".join(b"%d" % number * (number % 4 + 1) for number in range(10))
+    result = _slices(buffer, map_reduce.ranges(buffer, chunks))
+    assert 1 <= len(result) <= chunks
+    assert b"\n".join(result) == buffer
+    assert all(chunk and not chunk.startswith(b"\n") for chunk in result)
+
+
+@pytest.mark.parametrize("count_size", [1 << 20, 4])
+@pytest.mark.parametrize("chunks", [2, 3, 4, 7])
+def test_ranges_between_groups_of_lines(
+    mocker: MockFixture, chunks: int, count_size: int
+) -> None:
+    """It only splits after a whole group of lines, however few bytes are counted at\
+         a time."""
+    mocker.patch.object(map_reduce, "COUNT_SIZE", count_size)
+    buffer = b"\n".join(b"line%d" % number for number in range(12))
+    result = _slices(buffer, map_reduce.ranges(buffer, chunks, group=3))
+    assert len(result) > 1
+    assert b"\n".join(result) == buffer
+    assert all(chunk.count(b"\n") % 3 == 2 for chunk in result)
+
+
+@pytest.mark.parametrize("count_size", [1 << 20, 2])
+def test_ranges_between_blocks(mocker: MockFixture, count_size: int) -> None:
+    """It only splits at blank lines when the separator is a blank line."""
+    mocker.patch.object(map_reduce, "COUNT_SIZE", count_size)
+    buffer = b"1\n2\n\n3\n\n\n4\n5\n6\n\n7"
+    result = _slices(buffer, map_reduce.ranges(buffer, 3, separator=b"\n\n"))
+    assert b"\n\n".join(result) == buffer
+    assert [chunk.split() for chunk in result] == [
+        [b"1", b"2", b"3"],
+        [b"4", b"5", b"6"],
+        [b"7"],
+    ]
+    pairs = b"1\n\n2\n\n3\n\n4\n\n5\n\n6"
+    result = _slices(pairs, map_reduce.ranges(pairs, 2, separator=b"\n\n", group=2))
+    assert result == [b"1\n\n2\n\n3\n\n4", b"5\n\n6"]
+
+
+@pytest.mark.parametrize("buffer", [b"", b"no separator", b"a\nb"])
+def test_ranges_of_short_input(buffer: bytes) -> None:
+    """It returns the whole input as a single range when it cannot be split further."""
+    assert map_reduce.ranges(buffer, 4, group=3) == [(0, len(buffer))]
+
+
+def test_ranges_leave_out_trailing_whitespace() -> None:
+    """It ends the last range before the whitespace at the end of the input."""
+    buffer = b"a\nb\nc\n \n\n"
+    result = _slices(buffer, map_reduce.ranges(buffer, 3))
+    assert result == [b"a", b"b", b"c"]
+
+
+def _count_lines(text: str) -> int:
+    """Returns the number of lines in a range."""
+    return len(text.split("\n"))
+
+
+@pytest.fixture
+def lines_file(tmp_path: str) -> str:
+    """It writes a file of 50 lines, with a blank line at the end."""
+    file_path = path.join(tmp_path, "input.txt")
+    with open(file_path, "w") as f:
+        f.write(("x" * 10 + "\n") * 50)
+        f.write("\n")
+    return file_path
+
+
+def test_map_range_reads_only_its_range(lines_file: str) -> None:
+    """It maps the text between the offsets of the range."""
+    assert map_reduce._map_range(str.upper, lines_file, 11, 21) == "X" * 10
+
+
+def test_run_in_a_pool_of_processes(lines_file: str) -> None:
+    """It maps each range in a pool of processes, and reduces the results in order."""
+    chunks: list[list[int]] = []
+
+    def reducer(partials: list[int]) -> int:
+        """Records the partial answers, and adds them up."""
+        chunks.append(partials)
+        return sum(partials)
+
+    assert (
+        map_reduce.run(lines_file, _count_lines, reducer, workers=4, min_chunk_size=1)
+        == 50
+    )
+    assert len(chunks[0]) == 4
+
+
+def test_run_small_inputs_in_process(mocker: MockFixture, lines_file: str) -> None:
+    """It maps files too small to split in this process, as a single range."""
+    executor = mocker.patch.object(map_reduce, "ProcessPoolExecutor")
+    assert map_reduce.run(lines_file, _count_lines, map_reduce.total, workers=4) == 50
+    executor.assert_not_called()
+
+
+def test_run_does_not_read_the_input_in_this_process(
+    mocker: MockFixture, tmp_path: str
+) -> None:
+    """It only sends the ranges to the processes, so this process holds at most\
+         `COUNT_SIZE` bytes of the input at a time."""
+    mocker.patch.object(map_reduce, "COUNT_SIZE", 1 << 14)
+    file_path = path.join(tmp_path, "input.txt")
+    with open(file_path, "w") as f:
+        for _ in range(300000):
+            f.write("1000\n2000\n3000\n\n")
+
+    tracemalloc.start()
+    try:
+        lines = map_reduce.run(
+            file_path,
+            _count_lines,
+            map_reduce.total,
+            group=3,
+            workers=4,
+            min_chunk_size=1 << 18,
+        )
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert lines == 4 * 300000 - 1
+    assert peak < path.getsize(file_path) / 10
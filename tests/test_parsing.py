@@ -0,0 +1,56 @@
+"""Test cases for the parsing module."""
+import pytest
+
+from advent_of_code import parsing
+
+
+def test_ints_reads_every_number() -> None:
+    """It returns the numbers in order, whatever separates them."""
+    assert parsing.ints("2-4,6-8") == [2, 4, 6, 8]
+    assert parsing.ints("move 13 from 2 to 1\nmove 3 from 1 to 3") == [
+        13,
+        2,
+        1,
+        3,
+        1,
+        3,
+    ]
+    assert parsing.ints("no numbers here") == []
+
+
+def test_ints_reads_signs_when_asked() -> None:
+    """It only reads minus signs when the numbers are signed."""
+    assert parsing.ints("addx -5\naddx 3") == [5, 3]
+    assert parsing.ints("addx -5\naddx 3", signed=True) == [-5, 3]
+
+
+def test_ints_handles_text_outside_ascii() -> None:
+    """It still finds the numbers next to characters outside ASCII."""
+    assert parsing.ints("é12 – 7³") == [12, 7]
+
+
+def test_blocks_splits_on_blank_lines() -> None:
+    """It splits on runs of blank lines, keeping the indentation of the lines."""
+    text = "\n  [D]\n[N] [C]\n\n \nmove 1\nmove 2\n\n\nend\n"
+    assert parsing.blocks(text) == ["  [D]\n[N] [C]", "move 1\nmove 2", "end"]
+
+
+def test_columns_reads_fixed_width_columns() -> None:
+    """It reads one character from each column, padding short lines."""
+    drawing = ["    [D]", "[N] [C]    ", "[Z] [M] [P]"]
+    assert parsing.columns(drawing, width=4, offset=1) == [" NZ", "DCM", "  P"]
+    assert parsing.columns([], width=4) == []
+
+
+def test_digit_grid_reads_values_row_after_row() -> None:
+    """It returns the value of each digit and the width of the grid."""
+    cells, width = parsing.digit_grid("305\n255\n")
+    assert (cells, width) == (bytes([3, 0, 5, 2, 5, 5]), 3)
+    assert parsing.digit_grid("42") == (bytes([4, 2]), 2)
+
+
+@pytest.mark.parametrize("text", ["12\n345", "1a\n23", "12\n3456", "123\n4\n56789", ""])
+def test_digit_grid_rejects_invalid_grids(text: str) -> None:
+    """It raises a ValueError for grids that are not rectangles of digits."""
+    with pytest.raises(ValueError):
+        parsing.digit_grid(text)
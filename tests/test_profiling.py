@@ -0,0 +1,53 @@
+"""Test cases for the profiling module."""
+from os import path
+import pstats
+import time
+
+from mock import Mock, patch
+
+from advent_of_code import profiling
+
+
+def _allocate_then_free() -> int:
+    """Holds a large list for a while, then frees it before returning."""
+    numbers = [i for i in range(200000)]
+    time.sleep(profiling.SAMPLE_INTERVAL * 5)
+    return len(numbers)
+
+
+def test_profile_call_writes_pstats(tmp_path: str) -> None:
+    """It returns the function's result and writes readable statistics."""
+    pstats_path = path.join(tmp_path, "profiles", "test.pstats")
+    assert profiling.profile_call(_allocate_then_free, pstats_path) == 200000
+    stats = pstats.Stats(pstats_path)
+    assert any(
+        function[2] == "_allocate_then_free" for function in stats.stats  # type: ignore
+    )
+
+
+def test_trace_memory_call_finds_freed_allocations() -> None:
+    """It reports the allocation site at the peak, even if it was freed since."""
+    result, peak, sites = profiling.trace_memory_call(_allocate_then_free, top=3)
+    assert result == 200000
+    assert peak > 200000 * 8
+    assert len(sites) <= 3
+    assert "test_profiling.py" in sites[0]
+
+
+def test_trace_memory_call_for_quick_functions() -> None:
+    """It still returns the result when the function ends before any sample."""
+    result, peak, _ = profiling.trace_memory_call(lambda: 1)
+    assert result == 1 and peak >= 0
+
+
+def test_peak_rss_on_macos() -> None:
+    """It reads the peak resident memory in bytes, as reported by macOS."""
+    with patch.object(profiling.sys, "platform", "darwin"), patch(
+        "resource.getrusage", return_value=Mock(ru_maxrss=4096)
+    ):
+        assert profiling.peak_rss() == 4096
+
+
+def test_peak_rss() -> None:
+    """It returns the peak resident memory of the process in bytes."""
+    assert profiling.peak_rss() > 1024 * 1024
@@ -0,0 +1,234 @@
+"""Test cases for the registry module."""
+import json
+from os import getcwd, makedirs, path
+import subprocess  # noqa: S404
+import sys
+
+import pytest
+
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import input_sources, registry
+
+
+@pytest.fixture
+def test_inputs() -> input_sources.DirectorySource:
+    """Fixture to read inputs from the test inputs of 2022."""
+    return input_sources.DirectorySource(
+        path.join(getcwd(), "tests", "year_2022", "test_inputs"),
+        pattern="day_{day}_input.txt",
+    )
+
+
+@pytest.fixture
+def package_dir(tmp_path: str) -> str:
+    """Fixture to return a package folder with a few solutions in it."""
+    makedirs(path.join(tmp_path, "year_2000"))
+    with open(path.join(tmp_path, "year_2000", "day_10.py"), "w") as f:
+        f.write("def parse():\n    pass\n\n\ndef part_1():\n    pass\n\n\n")
+        f.write("def main():\n    pass\n")
+    with open(path.join(tmp_path, "year_2000", "day_11.py"), "w") as f:
+        for function in ("parse", "parse_lines", "part_1", "part_2", "main"):
+            f.write("def {}():\n    pass\n\n\n".format(function))
+    with open(path.join(tmp_path, "year_2000", "day_2.py"), "w") as f:
+        f.write("def main():\n    pass\n")
+    # Files without a main() function, or that are not solutions, are ignored
+    with open(path.join(tmp_path, "year_2000", "day_3.py"), "w") as f:
+        f.write("def helper():\n    pass\n")
+    with open(path.join(tmp_path, "year_2000", "notes.txt"), "w") as f:
+        f.write("def main():\n    pass\n")
+    with open(path.join(tmp_path, "year_2001"), "w") as f:
+        f.write("")
+    return str(tmp_path)
+
+
+def test_manifest_is_up_to_date() -> None:
+    """It lists every solution in the package. If not, regenerate the manifest with\
+         'python -m misc.generate_registry'."""
+    with open(registry.MANIFEST_PATH, "r") as f:
+        assert json.load(f) == registry.build_manifest()
+
+
+def test_build_manifest_parses_solutions(package_dir: str) -> None:
+    """It finds each solution's part functions, and its parser when every part can\
+         be solved from the parsed input. Days are sorted numerically."""
+    assert registry.build_manifest(package_dir) == {
+        "2000": {
+            "2": {
+                "module": "advent_of_code.year_2000.day_2",
+                "parts": {"1": "main", "2": "main"},
+            },
+            "10": {
+                "module": "advent_of_code.year_2000.day_10",
+                "parts": {"1": "part_1", "2": "main"},
+            },
+            "11": {
+                "module": "advent_of_code.year_2000.day_11",
+                "parts": {"1": "part_1", "2": "part_2"},
+                "parse": "parse",
+                "parse_lines": "parse_lines",
+            },
+        }
+    }
+
+
+def test_write_manifest(tmp_path: str) -> None:
+    """It writes the manifest as JSON."""
+    file_path = path.join(tmp_path, "solutions.json")
+    manifest = registry.write_manifest(file_path)
+    with open(file_path, "r") as f:
+        assert json.load(f) == manifest
+
+
+def test_load_manifest_without_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: str
+) -> None:
+    """It scans the package when the manifest file is missing."""
+    monkeypatch.setattr(registry, "_manifest", None)
+    monkeypatch.setattr(registry, "MANIFEST_PATH", path.join(tmp_path, "missing.json"))
+    assert registry.load_manifest() == registry.build_manifest()
+
+
+def test_get_solution() -> None:
+    """It returns the solution for solved days, however the day is written."""
+    solution = registry.get(year="2022", day=" 01")
+    assert solution is not None
+    assert (solution.year, solution.day) == ("2022", "1")
+    assert solution.module == "advent_of_code.year_2022.day_1"
+
+
+def test_get_unsolved_day() -> None:
+    """It returns None for days without a solution, or that are not numbers."""
+    assert registry.get(year="2022", day="26") is None
+    assert registry.get(year="1900", day="1") is None
+    assert registry.get(year="2022", day="one") is None
+
+
+def test_solutions_are_listed_in_order() -> None:
+    """It lists the solutions of a year by day."""
+    assert [s.day for s in registry.solutions(year="2022")] == [
+        str(day) for day in range(1, 12)
+    ]
+    assert registry.solutions(year="1900") == []
+    assert len(registry.solutions()) >= 11
+
+
+def test_part_from_main(
+    monkeypatch: pytest.MonkeyPatch, test_inputs: input_sources.DirectorySource
+) -> None:
+    """It answers each part from main() when there is no function for the part."""
+    monkeypatch.setattr(input_sources, "source", test_inputs)
+    solution = registry.Solution(
+        year="2022",
+        day="1",
+        module="advent_of_code.year_2022.day_1",
+        parts={"1": "main", "2": "main"},
+    )
+    assert solution.part("1")() == 24000
+    assert solution.part("2")() == 45000
+    assert solution.main()() == (24000, 45000)
+
+
+def test_part_from_function(
+    monkeypatch: pytest.MonkeyPatch, test_inputs: input_sources.DirectorySource
+) -> None:
+    """It reads and parses the input, and calls the part's own function."""
+    monkeypatch.setattr(input_sources, "source", test_inputs)
+    solution = registry.get(year="2022", day="1")
+    assert solution is not None and solution.parser == "parse"
+    assert solution.part("1")() == 24000
+    assert solution.part("2")() == 45000
+    with pytest.raises(KeyError):
+        solution.part("3")
+
+
+def test_parse_input_one_line_at_a_time(
+    monkeypatch: pytest.MonkeyPatch, test_inputs: input_sources.DirectorySource
+) -> None:
+    """It streams the input to solutions that parse it one line at a time, and reads\
+         the whole text for the others."""
+    monkeypatch.setattr(input_sources, "source", test_inputs)
+    read: list[str] = []
+
+    def get_input(year: str, day: str) -> str:
+        """Records the day whose whole input was read."""
+        read.append(day)
+        return "text"
+
+    monkeypatch.setattr(aoc_requests, "get_input", get_input)
+    assert registry.require("2022", "1").parse_input() == (
+        6000,
+        4000,
+        11000,
+        24000,
+        10000,
+    )
+    assert read == []
+    assert registry.require("2022", "6").parse_input() == "text"
+    assert read == ["6"]
+
+
+def test_part_without_parser(
+    monkeypatch: pytest.MonkeyPatch, test_inputs: input_sources.DirectorySource
+) -> None:
+    """It calls the part's function without arguments when the solution does not\
+         parse its input separately."""
+    monkeypatch.setattr(input_sources, "source", test_inputs)
+    solution = registry.Solution(
+        year="2022",
+        day="1",
+        module="advent_of_code.year_2022.day_1",
+        parts={"1": "get_input"},
+    )
+    assert str(solution.part("1")()).startswith("1000\n2000")
+
+
+def test_solve_from_parsed_input() -> None:
+    """It parses the input once, and solves any part from it."""
+    solution = registry.require(year="2022", day="1")
+    parsed = solution.parse("1\n\n2\n3\n\n4")
+    assert parsed == (1, 5, 4)
+    assert solution.solve("2", parsed) == 10
+    assert solution.solve("1", parsed) == 5
+
+
+def test_solve_without_parser() -> None:
+    """It serves the text to solutions that read their own input, and restores the\
+         input source."""
+    source = input_sources.source
+    solution = registry.Solution(
+        year="2022",
+        day="1",
+        module="advent_of_code.year_2022.day_1",
+        parts={"1": "main", "2": "main"},
+    )
+    text = solution.parse("1\n\n2\n3\n\n4")
+    assert text == "1\n\n2\n3\n\n4"
+    assert solution.solve("1", text) == 5
+    assert input_sources.source is source
+
+
+def test_load_module_without_solution() -> None:
+    """It raises 'ModuleNotFoundError' without trying to import anything."""
+    modules = set(sys.modules)
+    with pytest.raises(ModuleNotFoundError):
+        registry.load_module(year="2022", day="12")
+    assert set(sys.modules) == modules
+
+
+def test_solutions_import_without_the_cli() -> None:
+    """It imports every solution without the CLI, or the code that downloads inputs,\
+         so `solve` can be used on its own."""
+    completed = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            "-c",
+            "import importlib, sys\n"
+            "for day in range(1, 12):\n"
+            "    importlib.import_module('advent_of_code.year_2022.day_%d' % day)\n"
+            "print(sorted(m for m in sys.modules if m.endswith(('console', 'requests'))))",
+        ],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert completed.stdout.strip() == "[]"
@@ -0,0 +1,88 @@
+"""Test cases for the runner module."""
+from os import getcwd, path
+from unittest.mock import Mock
+
+import pytest
+
+from advent_of_code import input_sources, runner
+
+
+@pytest.fixture
+def test_inputs() -> input_sources.DirectorySource:
+    """Fixture to read inputs from the test inputs of 2022."""
+    return input_sources.DirectorySource(
+        path.join(getcwd(), "tests", "year_2022", "test_inputs"),
+        pattern="day_{day}_input.txt",
+    )
+
+
+def test_discover_solutions_finds_2022() -> None:
+    """It lists every solved day of 2022, in order."""
+    solutions = runner.discover_solutions(year="2022")
+    assert solutions == [("2022", str(day)) for day in range(1, 12)]
+
+
+def test_discover_solutions_for_unsolved_year() -> None:
+    """It returns no solutions for years without any."""
+    assert runner.discover_solutions(year="1900") == []
+
+
+def test_run_day_returns_answers_and_times(
+    test_inputs: input_sources.DirectorySource,
+) -> None:
+    """It runs the solution in the current process and times it."""
+    result = runner.run_day("2022", "1", text=test_inputs.read("2022", "1"))
+    assert result.error is None
+    assert result.answers == (24000, 45000)
+    assert len(result.wall_times) == len(result.cpu_times) == 2
+    assert result.wall_time > 0 and result.cpu_time >= 0
+
+
+def test_run_day_reports_errors(test_inputs: input_sources.DirectorySource) -> None:
+    """It returns the error instead of raising it."""
+    result = runner.run_day("2022", "12", text="")
+    assert result.answers == ()
+    assert result.error is not None and "ModuleNotFoundError" in result.error
+
+
+def test_run_all_runs_in_processes(
+    test_inputs: input_sources.DirectorySource,
+) -> None:
+    """It returns the results in the order the solutions were given."""
+    results = runner.run_all(
+        [("2022", "2"), ("2022", "1"), ("2022", "4")], source=test_inputs, max_workers=2
+    )
+    assert [(r.day, r.answers) for r in results] == [
+        ("2", (15, 12)),
+        ("1", (24000, 45000)),
+        ("4", (2, 4)),
+    ]
+
+
+def test_run_all_reads_inputs_in_this_process(
+    test_inputs: input_sources.DirectorySource,
+) -> None:
+    """It reads each input once, here, and sends only the text to the workers, so\
+         the source never has to be sent to them."""
+    # A mock cannot be sent to another process
+    source = Mock(spec=input_sources.InputSource)
+    source.read.side_effect = test_inputs.read
+    results = runner.run_all([("2022", "1"), ("2022", "2")], source=source)
+    assert [r.answers for r in results] == [(24000, 45000), (15, 12)]
+    assert source.read.call_count == 2
+
+
+def test_run_all_reports_unreadable_inputs(
+    test_inputs: input_sources.DirectorySource,
+) -> None:
+    """It fails the challenges whose input cannot be read, and runs the others."""
+    results = runner.run_all([("2022", "25"), ("2022", "4")], source=test_inputs)
+    assert results[0].error is not None and "FileNotFoundError" in results[0].error
+    assert results[1].answers == (2, 4)
+
+
+def test_run_all_without_solutions(
+    test_inputs: input_sources.DirectorySource,
+) -> None:
+    """It does nothing when there is nothing to run."""
+    assert runner.run_all([], source=test_inputs) == []
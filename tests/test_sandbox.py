@@ -0,0 +1,93 @@
+"""Test cases for the sandbox module."""
+import os
+import resource
+import sys
+import time
+
+from mock import patch
+import pytest
+
+from advent_of_code import registry, sandbox
+
+DAY_1_INPUT = "1000\n2000\n3000\n\n4000\n\n5000\n6000"
+
+
+@pytest.fixture
+def day_1() -> registry.Solution:
+    """Fixture to return the solution for 2022, day 1."""
+    return registry.require("2022", "1")
+
+
+def test_run_part_returns_answer(day_1: registry.Solution) -> None:
+    """It solves the part in another process, with the input it is given."""
+    result = sandbox.run_part(day_1, "2", DAY_1_INPUT, timeout=30)
+    assert result.status == sandbox.OK
+    assert result.answer == 6000 + 11000 + 4000
+    assert result.error is None
+    assert result.peak_rss is not None and result.peak_rss > 0
+    assert result.wall_time >= 0
+    assert result.parse_time is not None and result.parse_time >= 0
+
+
+def test_run_part_stops_at_timeout(day_1: registry.Solution) -> None:
+    """It kills the process when the part runs for too long."""
+    with patch(
+        "advent_of_code.year_2022.day_1.part_1_solution",
+        side_effect=lambda block_sums: time.sleep(30),
+    ):
+        result = sandbox.run_part(day_1, "1", DAY_1_INPUT, timeout=0.2)
+    assert result.status == sandbox.TIMEOUT
+    assert result.answer is None and result.peak_rss is None
+    assert 0.2 <= result.wall_time < 30
+
+
+@pytest.mark.skipif(sys.platform != "linux", reason="Memory limits need Linux")
+def test_run_part_stops_at_memory_limit(day_1: registry.Solution) -> None:
+    """It reports a part that allocates more than the memory limit."""
+    with patch(
+        "advent_of_code.year_2022.day_1.part_1_solution",
+        side_effect=lambda block_sums: len(bytearray(256 * 1024 * 1024)),
+    ):
+        limited = sandbox.run_part(day_1, "1", DAY_1_INPUT, max_memory=64 * 1024 * 1024)
+        unlimited = sandbox.run_part(day_1, "1", DAY_1_INPUT)
+    assert limited.status == sandbox.MEMORY_LIMIT
+    assert limited.peak_rss is not None and limited.peak_rss < 256 * 1024 * 1024
+    assert unlimited.status == sandbox.OK
+    assert unlimited.peak_rss is not None and unlimited.peak_rss > 256 * 1024 * 1024
+
+
+def test_run_part_reports_errors(day_1: registry.Solution) -> None:
+    """It returns the error raised by the solution."""
+    with patch(
+        "advent_of_code.year_2022.day_1.part_1_solution",
+        side_effect=ValueError("bad input"),
+    ):
+        result = sandbox.run_part(day_1, "1", DAY_1_INPUT)
+    assert result.status == sandbox.ERROR
+    assert result.error == "ValueError('bad input')"
+
+
+def test_run_part_reports_processes_that_exit(day_1: registry.Solution) -> None:
+    """It reports a process that exits without answering."""
+    with patch(
+        "advent_of_code.year_2022.day_1.part_1_solution",
+        side_effect=lambda block_sums: os._exit(3),
+    ):
+        result = sandbox.run_part(day_1, "1", DAY_1_INPUT)
+    assert result.status == sandbox.ERROR
+    assert result.error == "The process exited with code 3"
+
+
+def test_address_space_outside_linux() -> None:
+    """It returns 0 when the address space cannot be read."""
+    with patch("builtins.open", side_effect=FileNotFoundError):
+        assert sandbox._address_space() == 0
+
+
+def test_limit_memory_keeps_hard_limit() -> None:
+    """It never raises the limit above the hard limit."""
+    with patch("resource.getrlimit", return_value=(100, 200)), patch(
+        "resource.setrlimit"
+    ) as setrlimit_mock:
+        sandbox._limit_memory(1024)
+    setrlimit_mock.assert_called_once_with(resource.RLIMIT_AS, (200, 200))
@@ -0,0 +1,161 @@
+"""Test cases for the server module."""
+from os import getcwd, path
+import socket
+from threading import Thread
+from typing import Iterator
+from unittest.mock import Mock
+
+import pytest
+from pytest_mock import MockFixture
+
+from advent_of_code import server
+
+DAY_1_INPUT = path.join(
+    getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+)
+
+
+@pytest.fixture
+def address(tmp_path: str) -> Iterator[str]:
+    """Fixture to run a server on a Unix socket in a background thread, and return\
+         the socket path."""
+    socket_path = path.join(tmp_path, "aoc.sock")
+    solver = server.serve(socket_path)
+    thread = Thread(target=solver.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    yield socket_path
+    solver.shutdown()
+    thread.join()
+    solver.server_close()
+
+
+def test_parse_address() -> None:
+    """It returns a (host, port) pair for TCP addresses, and a path otherwise."""
+    assert server.parse_address("127.0.0.1:8765") == ("127.0.0.1", 8765)
+    assert server.parse_address("/tmp/aoc.sock") == "/tmp/aoc.sock"
+    assert server.parse_address("aoc:sock") == "aoc:sock"
+
+
+def test_ping(address: str) -> None:
+    """It answers that it is running."""
+    assert server.send_request(address, {"command": "ping"}) == {"ok": True}
+
+
+def test_solve_with_input_file(address: str) -> None:
+    """It solves every part of the puzzle with the input file."""
+    response = server.send_request(
+        address,
+        {"year": "2022", "day": "1", "input_file": DAY_1_INPUT},
+    )
+    assert response["answers"] == {"1": 24000, "2": 45000}
+    assert response["elapsed"] >= 0
+
+
+def test_solve_one_part_with_input_text(address: str) -> None:
+    """It only solves the requested part, with the input sent in the request."""
+    response = server.send_request(
+        address,
+        {"year": "2022", "day": "1", "part": "2", "input": "1\n\n2\n\n3\n"},
+    )
+    assert response["answers"] == {"2": 6}
+
+
+def test_input_source_is_read_once(address: str, mocker: MockFixture) -> None:
+    """It keeps inputs read from the input source for the next requests."""
+    get_input_mock = mocker.patch(
+        "advent_of_code.advent_of_code_requests.get_input", return_value="1\n\n2"
+    )
+    for _ in range(2):
+        response = server.send_request(
+            address, {"year": "2022", "day": "1", "part": "1"}
+        )
+        assert response["answers"] == {"1": 2}
+    get_input_mock.assert_called_once_with("2022", "1")
+
+
+def test_errors_are_returned(address: str) -> None:
+    """It answers with an error for bad requests, and keeps serving."""
+    assert "error" in server.send_request(address, {"year": "2022", "day": "26"})
+    assert "error" in server.send_request(address, {"command": "dance"})
+    assert "error" in server.send_request(address, {"day": "1"})
+    assert server.send_request(address, {"command": "ping"}) == {"ok": True}
+
+
+def test_several_requests_on_one_connection(
+    address: str,
+) -> None:
+    """It answers each line sent on the same connection."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(address)
+        client.sendall(b'{"command": "ping"}\n\n{"command": "ping"}\n')
+        with client.makefile("rb") as response:
+            assert response.readline() == b'{"ok": true}\n'
+            assert response.readline() == b'{"ok": true}\n'
+
+
+def test_shutdown_stops_server(tmp_path: str) -> None:
+    """It stops serving after a shutdown request, and removes the socket file."""
+    socket_path = path.join(tmp_path, "aoc.sock")
+    solver = server.serve(socket_path)
+    thread = Thread(target=solver.serve_forever, kwargs={"poll_interval": 0.05})
+    thread.start()
+    response = server.send_request(socket_path, {"command": "shutdown"})
+    thread.join(timeout=5)
+    solver.server_close()
+    assert response["stopping"] is True
+    assert not thread.is_alive() and not path.exists(socket_path)
+
+
+def test_stale_socket_file_is_replaced(tmp_path: str) -> None:
+    """It starts even if a socket file was left behind."""
+    socket_path = path.join(tmp_path, "aoc.sock")
+    with open(socket_path, "w") as f:
+        f.write("")
+    with server.serve(socket_path) as solver:
+        assert solver.socket.getsockname() == socket_path
+
+
+def test_tcp_server() -> None:
+    """It serves on a TCP socket when given a host and port."""
+    with server.serve("127.0.0.1:0") as solver:
+        thread = Thread(target=solver.serve_forever, kwargs={"poll_interval": 0.05})
+        thread.start()
+        response = server.send_request(
+            solver.socket.getsockname(), {"year": "2022", "day": "1", "input": "5"}
+        )
+        solver.shutdown()
+        thread.join()
+    assert response["answers"] == {"1": 5, "2": 5}
+
+
+@pytest.mark.parametrize(
+    "host, loopback",
+    [("127.0.0.1", True), ("127.1.2.3", True), ("::1", True), ("localhost", True)]
+    + [("0.0.0.0", False), ("192.168.1.2", False), ("", False), ("example", False)],
+)
+def test_is_loopback(host: str, loopback: bool) -> None:
+    """It only accepts hosts that other machines cannot connect to."""
+    assert server.is_loopback(host) is loopback
+
+
+def test_tcp_server_only_listens_on_loopback(mocker: MockFixture) -> None:
+    """It refuses to listen on addresses other machines could reach."""
+    tcp_server = mocker.patch.object(server, "TcpSolverServer")
+    with pytest.raises(ValueError, match="loopback"):
+        server.serve("0.0.0.0:8765")
+    tcp_server.assert_not_called()
+
+
+def test_send_request_without_answer(mocker: MockFixture) -> None:
+    """It raises 'ConnectionError' when the server hangs up without answering."""
+    client = mocker.patch("socket.socket").return_value.__enter__.return_value
+    client.makefile.return_value.__enter__.return_value = Mock(
+        readline=Mock(return_value=b"")
+    )
+    with pytest.raises(ConnectionError):
+        server.send_request("/tmp/aoc.sock", {"command": "ping"})
+
+
+def test_default_address() -> None:
+    """It listens in the .conf folder of the working directory by default."""
+    assert server.default_address() == path.join(getcwd(), ".conf", "aoc.sock")
@@ -0,0 +1,87 @@
+"""Test cases for the tracing module."""
+import json
+from os import path
+from typing import Iterator
+
+from mock import patch
+import pytest
+
+from advent_of_code import advent_of_code_requests as aoc_requests
+from advent_of_code import input_sources, tracing
+
+
+@pytest.fixture
+def tracer() -> Iterator[tracing.Tracer]:
+    """Fixture to record spans for the duration of a test."""
+    with patch.object(tracing, "tracer", tracing.Tracer()) as active:
+        yield active
+
+
+def test_instrument_does_nothing_when_not_tracing() -> None:
+    """It runs the block without recording it when there is no tracer."""
+    assert tracing.tracer is None
+    with tracing.instrument("parse"):
+        pass
+
+
+def test_instrument_records_nested_spans(tracer: tracing.Tracer) -> None:
+    """It records a complete event for each span, inner spans first."""
+    with tracing.instrument("outer", day="1"):
+        with tracing.instrument("inner"):
+            pass
+    inner, outer = tracer.events
+    assert (inner["name"], outer["name"]) == ("inner", "outer")
+    assert outer["ph"] == "X" and outer["args"] == {"day": "1"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_instrument_records_failed_spans(tracer: tracing.Tracer) -> None:
+    """It records the span even when the block raises an error."""
+    with pytest.raises(ValueError):
+        with tracing.instrument("parse"):
+            raise ValueError()
+    assert [event["name"] for event in tracer.events] == ["parse"]
+
+
+def test_traced_records_each_call(tracer: tracing.Tracer) -> None:
+    """It records a span named after the phase, with the function's module."""
+
+    @tracing.traced("part_1")
+    def solve(value: int, double: bool = False) -> int:
+        """Returns the value, doubled if asked."""
+        return value * 2 if double else value
+
+    assert solve(2, double=True) == 4
+    assert solve.__name__ == "solve"
+    assert tracer.events[0]["name"] == "part_1"
+    assert tracer.events[0]["args"] == {"module": __name__}
+
+
+def test_traced_calls_function_when_not_tracing() -> None:
+    """It only calls the function when there is no tracer."""
+    assert tracing.traced("part_1")(lambda: 42)() == 42
+
+
+def test_get_input_is_traced(tracer: tracing.Tracer) -> None:
+    """It records reading the input, with the year and day."""
+    with patch.object(input_sources, "source", input_sources.TextSource("1\n2")):
+        aoc_requests.get_input("2022", "1")
+        list(aoc_requests.get_input_lines("2022", "1"))
+    assert [event["name"] for event in tracer.events] == [
+        "get_input",
+        "get_input_lines",
+    ]
+    assert tracer.events[0]["args"] == {"year": "2022", "day": "1"}
+
+
+def test_write_chrome_trace(tracer: tracing.Tracer, tmp_path: str) -> None:
+    """It writes the spans as a Chrome trace."""
+    with tracing.instrument("parse"):
+        pass
+    file_path = path.join(tmp_path, "trace.json")
+    tracer.write(file_path)
+    with open(file_path, "r") as f:
+        trace = json.load(f)
+    assert trace["traceEvents"] == tracer.events
+    assert trace["displayTimeUnit"] == "ms"
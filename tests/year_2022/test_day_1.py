@@ -5,6 +5,7 @@ from unittest.mock import Mock
 from pytest import fixture
 from pytest_mock import MockFixture
 
+from advent_of_code import map_reduce
 from advent_of_code.year_2022 import day_1
 
 
@@ -16,20 +17,50 @@ def mock_get_input(mocker: MockFixture) -> Mock:
     )
     mock = mocker.patch("advent_of_code.advent_of_code_requests.get_input")
     with open(input_file, "r") as f:
-        mock.return_value = f.read()
+        mock.return_value = f.read().rstrip("\n")
+    # main() reads the input one line at a time
+    mocker.patch(
+        "advent_of_code.advent_of_code_requests.get_input_lines",
+        side_effect=lambda *args, **kwargs: iter(mock.return_value.split("\n")),
+    )
     return mock
 
 
-def test_solution_1(mock_get_input: Mock) -> None:
+@fixture
+def parsed(mock_get_input: Mock) -> tuple[int, ...]:
+    """It parses the test input."""
+    return day_1.parse(day_1.get_input())
+
+
+def test_solution_1(parsed: tuple[int, ...]) -> None:
     """It verifies the first part with the test input."""
-    assert day_1.part_1_solution() == 24000
+    assert day_1.part_1_solution(parsed) == 24000
 
 
-def test_solution_2(mock_get_input: Mock) -> None:
+def test_solution_2(parsed: tuple[int, ...]) -> None:
     """It verifies the second part with the test input."""
-    assert day_1.part_2_solution() == 45000
+    assert day_1.part_2_solution(parsed) == 45000
 
 
 def test_main(mock_get_input: Mock) -> None:
-    """It verifies both parts with the test input."""
+    """It verifies both parts with the test input, read one line at a time."""
     assert day_1.main() == (24000, 45000)
+    mock_get_input.assert_not_called()
+
+
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_1.solve(text, 1) == 24000
+    assert day_1.solve(text, 2) == 45000
+    mock_get_input.assert_not_called()
+
+
+def test_solve_chunked(mocker: MockFixture) -> None:
+    """It gives the same answers with the input file split across processes."""
+    mocker.patch.object(map_reduce, "MIN_CHUNK_SIZE", 1)
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_1_input.txt"
+    )
+    assert day_1.solve_chunked(input_file, 1, workers=3) == 24000
+    assert day_1.solve_chunked(input_file, 2, workers=3) == 45000
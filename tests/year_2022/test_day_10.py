@@ -21,23 +21,37 @@ def mock_get_input(mocker: MockFixture, part: int) -> Mock:
     mock = mocker.patch("advent_of_code.advent_of_code_requests.get_input")
     with open(input_file, "r") as f:
         mock.return_value = f.read().rstrip("\n")
+    # main() reads the input one line at a time
+    mocker.patch(
+        "advent_of_code.advent_of_code_requests.get_input_lines",
+        side_effect=lambda *args, **kwargs: iter(mock.return_value.split("\n")),
+    )
     return mock
 
 
+@fixture
+def parsed(mock_get_input: Mock) -> tuple[day_10.Signal, ...]:
+    """It parses the test input."""
+    return day_10.parse(day_10.get_input())
+
+
 @mark.parametrize("part", [1])
-def test_solution_1_part_1(mock_get_input: Mock) -> None:
+def test_solution_1_part_1(parsed: tuple[day_10.Signal, ...]) -> None:
     """It verifies the first part with a test input."""
-    assert day_10.part_1_solution(signal_cycles=[5]) == 20
+    assert day_10.part_1_solution(parsed, signal_cycles=[5]) == 20
 
 
 @mark.parametrize("part", [2])
-def test_solution_1_part_2(mock_get_input: Mock) -> None:
+def test_solution_1_part_2(parsed: tuple[day_10.Signal, ...]) -> None:
     """It verifies the first part with a test input."""
-    assert day_10.part_1_solution(signal_cycles=[20, 60, 100, 140, 180, 220]) == 13140
+    assert (
+        day_10.part_1_solution(parsed, signal_cycles=[20, 60, 100, 140, 180, 220])
+        == 13140
+    )
 
 
 @mark.parametrize("part", [2])
-def test_solution_2(mock_get_input: Mock) -> None:
+def test_solution_2(parsed: tuple[day_10.Signal, ...]) -> None:
     """It verifies the second part with a test input."""
     expected_result = linesep + linesep.join(
         [
@@ -49,7 +63,7 @@ def test_solution_2(mock_get_input: Mock) -> None:
             "%%%%%%%       %%%%%%%       %%%%%%%     ",
         ]
     )
-    assert day_10.part_2_solution() == expected_result
+    assert day_10.part_2_solution(parsed) == expected_result
 
 
 @mark.parametrize("part", [2])
@@ -66,3 +80,19 @@ def test_main(mock_get_input: Mock) -> None:
         ]
     )
     assert day_10.main() == (13140, expected_result)
+    mock_get_input.assert_not_called()
+
+
+@mark.parametrize("part", [2])
+def test_part_1_function(parsed: tuple[day_10.Signal, ...]) -> None:
+    """It verifies the first part can be solved on its own."""
+    assert day_10.part_1(parsed) == 13140
+
+
+@mark.parametrize("part", [2])
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_10.solve(text, 1) == 13140
+    assert str(day_10.solve(text, 2)).startswith(linesep + "%%  %%  %%")
+    mock_get_input.assert_not_called()
@@ -20,18 +20,51 @@ def mock_get_input(mocker: MockFixture) -> Mock:
     return mock
 
 
-def test_solution_1(mock_get_input: Mock) -> None:
+@fixture
+def parsed(mock_get_input: Mock) -> tuple[day_11.Monkey, ...]:
+    """It parses the test input."""
+    return day_11.parse(day_11.get_input())
+
+
+def test_solution_1(parsed: tuple[day_11.Monkey, ...]) -> None:
     """It verifies the first part with a test input."""
-    s = day_11.return_two_most_active_monkeys(reduce_stress_level=True, cycles=20)
+    s = day_11.return_two_most_active_monkeys(
+        parsed, reduce_stress_level=True, cycles=20
+    )
     assert s[0] * s[1] == 10605
 
 
-def test_solution_2(mock_get_input: Mock) -> None:
+def test_solution_2(parsed: tuple[day_11.Monkey, ...]) -> None:
     """It verifies the second part with a test input."""
-    s = day_11.return_two_most_active_monkeys(reduce_stress_level=False, cycles=10000)
+    s = day_11.return_two_most_active_monkeys(
+        parsed, reduce_stress_level=False, cycles=10000
+    )
     assert s[0] * s[1] == 2713310158
 
 
 def test_main(mock_get_input: Mock) -> None:
     """It verifies both parts with the test input in the test input document."""
     assert day_11.main() == (10605, 2713310158)
+
+
+def test_part_1_function(parsed: tuple[day_11.Monkey, ...]) -> None:
+    """It verifies the first part can be solved on its own."""
+    assert day_11.part_1(parsed) == 10605
+
+
+def test_parts_do_not_change_the_input(parsed: tuple[day_11.Monkey, ...]) -> None:
+    """It throws items between copies of the monkeys, so the parsed input can be\
+         reused."""
+    items = [list(monkey.items) for monkey in parsed]
+    assert day_11.part_1(parsed) == 10605
+    assert day_11.part_1(parsed) == 10605
+    assert [monkey.items for monkey in parsed] == items
+    assert all(monkey.inspect_count == 0 for monkey in parsed)
+
+
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_11.solve(text, 1) == 10605
+    assert day_11.solve(text, 2) == 2713310158
+    mock_get_input.assert_not_called()
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 from pytest import fixture
 from pytest_mock import MockFixture
 
+from advent_of_code import map_reduce
 from advent_of_code.year_2022 import day_3
 
 
@@ -16,20 +17,50 @@ def mock_get_input(mocker: MockFixture) -> Mock:
     )
     mock = mocker.patch("advent_of_code.advent_of_code_requests.get_input")
     with open(input_file, "r") as f:
-        mock.return_value = f.read().strip()
+        mock.return_value = f.read().rstrip("\n")
+    # main() reads the input one line at a time
+    mocker.patch(
+        "advent_of_code.advent_of_code_requests.get_input_lines",
+        side_effect=lambda *args, **kwargs: iter(mock.return_value.split("\n")),
+    )
     return mock
 
 
-def test_solution_1(mock_get_input: Mock) -> None:
+@fixture
+def parsed(mock_get_input: Mock) -> tuple[str, ...]:
+    """It parses the test input."""
+    return day_3.parse(day_3.get_input())
+
+
+def test_solution_1(parsed: tuple[str, ...]) -> None:
     """It verifies the first part with the test input."""
-    assert day_3.part_1_solution() == 157
+    assert day_3.part_1_solution(parsed) == 157
 
 
-def test_solution_2(mock_get_input: Mock) -> None:
+def test_solution_2(parsed: tuple[str, ...]) -> None:
     """It verifies the second part with the test input."""
-    assert day_3.part_2_solution() == 70
+    assert day_3.part_2_solution(parsed) == 70
 
 
 def test_main(mock_get_input: Mock) -> None:
-    """It verifies both parts with the test input."""
+    """It verifies both parts with the test input, read one line at a time."""
     assert day_3.main() == (157, 70)
+    mock_get_input.assert_not_called()
+
+
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_3.solve(text, 1) == 157
+    assert day_3.solve(text, 2) == 70
+    mock_get_input.assert_not_called()
+
+
+def test_solve_chunked(mocker: MockFixture) -> None:
+    """It gives the same answers with the input file split across processes."""
+    mocker.patch.object(map_reduce, "MIN_CHUNK_SIZE", 1)
+    input_file = path.join(
+        getcwd(), "tests", "year_2022", "test_inputs", "day_3_input.txt"
+    )
+    assert day_3.solve_chunked(input_file, 1, workers=3) == 157
+    assert day_3.solve_chunked(input_file, 2, workers=3) == 70
@@ -20,16 +20,40 @@ def mock_get_input(mocker: MockFixture) -> Mock:
     return mock
 
 
-def test_solution_1(mock_get_input: Mock) -> None:
+@fixture
+def parsed(mock_get_input: Mock) -> tuple[day_5.Stacks, tuple[day_5.Move, ...]]:
+    """It parses the test input."""
+    return day_5.parse(day_5.get_input())
+
+
+def test_solution_1(parsed: tuple[day_5.Stacks, tuple[day_5.Move, ...]]) -> None:
     """It verifies the first part with the test input."""
-    assert day_5.part_1_solution() == "CMZ"
+    assert day_5.part_1_solution(parsed) == "CMZ"
 
 
-def test_solution_2(mock_get_input: Mock) -> None:
+def test_solution_2(parsed: tuple[day_5.Stacks, tuple[day_5.Move, ...]]) -> None:
     """It verifies the second part with the test input."""
-    assert day_5.part_2_solution() == "MCD"
+    assert day_5.part_2_solution(parsed) == "MCD"
 
 
 def test_main(mock_get_input: Mock) -> None:
     """It verifies both parts with the test input."""
     assert day_5.main() == ("CMZ", "MCD")
+
+
+def test_parts_do_not_change_the_input(
+    parsed: tuple[day_5.Stacks, tuple[day_5.Move, ...]]
+) -> None:
+    """It moves crates on copies of the stacks, so the parsed input can be reused."""
+    assert day_5.part_1(parsed) == "CMZ"
+    assert day_5.part_2(parsed) == "MCD"
+    assert day_5.part_1(parsed) == "CMZ"
+    assert parsed[0] == ("ZN", "MCD", "P")
+
+
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_5.solve(text, 1) == "CMZ"
+    assert day_5.solve(text, 2) == "MCD"
+    mock_get_input.assert_not_called()
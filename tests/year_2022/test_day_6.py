@@ -24,67 +24,89 @@ def mock_get_input(mocker: MockFixture, part: int) -> Mock:
     return mock
 
 
+@fixture
+def parsed(mock_get_input: Mock) -> str:
+    """It parses the test input."""
+    return day_6.parse(day_6.get_input())
+
+
 @mark.parametrize("part", [1])
-def test_solution_1_test_1(mock_get_input: Mock) -> None:
+def test_solution_1_test_1(parsed: str) -> None:
     """It verifies the first part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=4) == 7
+    assert day_6.detect_distinct_char_sequence(parsed, scope=4) == 7
 
 
 @mark.parametrize("part", [2])
-def test_solution_1_test_2(mock_get_input: Mock) -> None:
+def test_solution_1_test_2(parsed: str) -> None:
     """It verifies the first part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=4) == 5
+    assert day_6.detect_distinct_char_sequence(parsed, scope=4) == 5
 
 
 @mark.parametrize("part", [3])
-def test_solution_1_test_3(mock_get_input: Mock) -> None:
+def test_solution_1_test_3(parsed: str) -> None:
     """It verifies the first part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=4) == 6
+    assert day_6.detect_distinct_char_sequence(parsed, scope=4) == 6
 
 
 @mark.parametrize("part", [4])
-def test_solution_1_test_4(mock_get_input: Mock) -> None:
+def test_solution_1_test_4(parsed: str) -> None:
     """It verifies the first part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=4) == 10
+    assert day_6.detect_distinct_char_sequence(parsed, scope=4) == 10
 
 
 @mark.parametrize("part", [5])
-def test_solution_1_test_5(mock_get_input: Mock) -> None:
+def test_solution_1_test_5(parsed: str) -> None:
     """It verifies the first part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=4) == 11
+    assert day_6.detect_distinct_char_sequence(parsed, scope=4) == 11
 
 
 @mark.parametrize("part", [1])
-def test_solution_2_test_1(mock_get_input: Mock) -> None:
+def test_solution_2_test_1(parsed: str) -> None:
     """It verifies the second part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=14) == 19
+    assert day_6.detect_distinct_char_sequence(parsed, scope=14) == 19
 
 
 @mark.parametrize("part", [2])
-def test_solution_2_test_2(mock_get_input: Mock) -> None:
+def test_solution_2_test_2(parsed: str) -> None:
     """It verifies the second part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=14) == 23
+    assert day_6.detect_distinct_char_sequence(parsed, scope=14) == 23
 
 
 @mark.parametrize("part", [3])
-def test_solution_2_test_3(mock_get_input: Mock) -> None:
+def test_solution_2_test_3(parsed: str) -> None:
     """It verifies the second part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=14) == 23
+    assert day_6.detect_distinct_char_sequence(parsed, scope=14) == 23
 
 
 @mark.parametrize("part", [4])
-def test_solution_2_test_4(mock_get_input: Mock) -> None:
+def test_solution_2_test_4(parsed: str) -> None:
     """It verifies the second part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=14) == 29
+    assert day_6.detect_distinct_char_sequence(parsed, scope=14) == 29
 
 
 @mark.parametrize("part", [5])
-def test_solution_2_test_5(mock_get_input: Mock) -> None:
+def test_solution_2_test_5(parsed: str) -> None:
     """It verifies the second part with a test input."""
-    assert day_6.detect_distinct_char_sequence(scope=14) == 26
+    assert day_6.detect_distinct_char_sequence(parsed, scope=14) == 26
 
 
 @mark.parametrize("part", [1])
 def test_main(mock_get_input: Mock) -> None:
     """It verifies both parts with the test input in the test input document."""
     assert day_6.main() == (7, 19)
+
+
+@mark.parametrize("part", [1])
+def test_part_functions(parsed: str) -> None:
+    """It verifies each part can be solved on its own."""
+    assert day_6.part_1(parsed) == 7
+    assert day_6.part_2(parsed) == 19
+
+
+@mark.parametrize("part", [1])
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_6.solve(text, 1) == 7
+    assert day_6.solve(text, 2) == 19
+    mock_get_input.assert_not_called()
@@ -1,5 +1,5 @@
 """Test case for the year 2022, day 7."""
-from importlib import reload
+from concurrent.futures import ThreadPoolExecutor
 from os import getcwd, path
 from unittest.mock import Mock
 
@@ -21,17 +21,65 @@ def mock_get_input(mocker: MockFixture) -> Mock:
     return mock
 
 
-def test_solution_1(mock_get_input: Mock) -> None:
+@fixture
+def parsed(mock_get_input: Mock) -> day_7.Node:
+    """It parses the test input."""
+    return day_7.parse(day_7.get_input())
+
+
+def test_solution_1(parsed: day_7.Node) -> None:
     """It verifies the first part with a test input."""
-    assert day_7.part_1_solution()[0] == 95437
+    assert day_7.part_1_solution(parsed) == 95437
 
 
-def test_solution_2(mock_get_input: Mock) -> None:
+def test_solution_2(parsed: day_7.Node) -> None:
     """It verifies the second part with a test input."""
-    assert day_7.part_2_solution(day_7.part_1_solution()[1]) == 24933642
+    assert day_7.part_2_solution(parsed) == 24933642
 
 
 def test_main(mock_get_input: Mock) -> None:
     """It verifies both parts with the test input in the test input document."""
-    reload(day_7)
     assert day_7.main() == (95437, 24933642)
+
+
+def test_compute_dir_sizes_returns_a_new_list(parsed: day_7.Node) -> None:
+    """It does not share the list of small directories between calls."""
+    first = day_7.compute_dir_sizes(day_7.Node("a", "dir", 0))
+    first.append(parsed)
+    assert day_7.compute_dir_sizes(day_7.Node("b", "dir", 0)) == []
+
+
+def test_deep_file_system() -> None:
+    """It adds up the sizes of a tree deeper than the recursion limit."""
+    depth = 5000
+    commands = ["$ cd /"]
+    for level in range(depth):
+        commands += ["$ ls", "dir d{}".format(level), "1 f", "$ cd d{}".format(level)]
+    text = "\n".join(commands)
+    # The directory at each level holds a file of size 1 on every level below it
+    assert day_7.solve(text, 1) == sum(range(depth))
+    assert day_7.parse(text).node_size == depth
+
+
+def test_part_functions(parsed: day_7.Node) -> None:
+    """It verifies each part can be solved on its own, and more than once."""
+    assert day_7.part_1(parsed) == 95437
+    assert day_7.part_1(parsed) == 95437
+    assert day_7.part_2(parsed) == 24933642
+    assert parsed.node_size == 48381165
+
+
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_7.solve(text, 1) == 95437
+    assert day_7.solve(text, 2) == 24933642
+    mock_get_input.assert_not_called()
+
+
+def test_solve_from_threads(mock_get_input: Mock) -> None:
+    """It gives the same answers when solving from several threads at once."""
+    text = mock_get_input.return_value
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        answers = list(executor.map(day_7.solve, [text] * 8, [1, 2] * 4))
+    assert answers == [95437, 24933642] * 4
@@ -5,6 +5,7 @@ from unittest.mock import Mock
 from pytest import fixture
 from pytest_mock import MockFixture
 
+from advent_of_code import grid
 from advent_of_code.year_2022 import day_8
 
 
@@ -20,16 +21,30 @@ def mock_get_input(mocker: MockFixture) -> Mock:
     return mock
 
 
-def test_solution_1(mock_get_input: Mock) -> None:
+@fixture
+def parsed(mock_get_input: Mock) -> grid.Grid:
+    """It parses the test input."""
+    return day_8.parse(day_8.get_input())
+
+
+def test_solution_1(parsed: grid.Grid) -> None:
     """It verifies the first part with a test input."""
-    assert day_8.part_1_solution() == 21
+    assert day_8.part_1_solution(parsed) == 21
 
 
-def test_solution_2(mock_get_input: Mock) -> None:
+def test_solution_2(parsed: grid.Grid) -> None:
     """It verifies the second part with a test input."""
-    assert day_8.part_2_solution() == 8
+    assert day_8.part_2_solution(parsed) == 8
 
 
 def test_main(mock_get_input: Mock) -> None:
     """It verifies both parts with the test input in the test input document."""
     assert day_8.main() == (21, 8)
+
+
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_8.solve(text, 1) == 21
+    assert day_8.solve(text, 2) == 8
+    mock_get_input.assert_not_called()
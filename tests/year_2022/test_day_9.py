@@ -21,28 +21,56 @@ def mock_get_input(mocker: MockFixture, part: int) -> Mock:
     mock = mocker.patch("advent_of_code.advent_of_code_requests.get_input")
     with open(input_file, "r") as f:
         mock.return_value = f.read().rstrip("\n")
+    # main() reads the input one line at a time
+    mocker.patch(
+        "advent_of_code.advent_of_code_requests.get_input_lines",
+        side_effect=lambda *args, **kwargs: iter(mock.return_value.split("\n")),
+    )
     return mock
 
 
+@fixture
+def parsed(mock_get_input: Mock) -> tuple[day_9.Instruction, ...]:
+    """It parses the test input."""
+    return day_9.parse(day_9.get_input())
+
+
 @mark.parametrize("part", [1])
-def test_solution_1(mock_get_input: Mock) -> None:
+def test_solution_1(parsed: tuple[day_9.Instruction, ...]) -> None:
     """It verifies the first part with a test input."""
-    assert day_9.count_distinct_coordinates_for_last_knot(knot_count=2) == 13
+    assert day_9.count_distinct_coordinates_for_last_knot(parsed, knot_count=2) == 13
 
 
 @mark.parametrize("part", [1])
-def test_solution_2_part_1(mock_get_input: Mock) -> None:
+def test_solution_2_part_1(parsed: tuple[day_9.Instruction, ...]) -> None:
     """It verifies the second part with a test input."""
-    assert day_9.count_distinct_coordinates_for_last_knot(knot_count=10) == 1
+    assert day_9.count_distinct_coordinates_for_last_knot(parsed, knot_count=10) == 1
 
 
 @mark.parametrize("part", [2])
-def test_solution_2_part_2(mock_get_input: Mock) -> None:
+def test_solution_2_part_2(parsed: tuple[day_9.Instruction, ...]) -> None:
     """It verifies the second part with a test input."""
-    assert day_9.count_distinct_coordinates_for_last_knot(knot_count=10) == 36
+    assert day_9.count_distinct_coordinates_for_last_knot(parsed, knot_count=10) == 36
 
 
 @mark.parametrize("part", [1])
 def test_main(mock_get_input: Mock) -> None:
     """It verifies both parts with the test input in the test input document."""
     assert day_9.main() == (13, 1)
+    mock_get_input.assert_not_called()
+
+
+@mark.parametrize("part", [2])
+def test_part_functions(parsed: tuple[day_9.Instruction, ...]) -> None:
+    """It verifies each part can be solved on its own."""
+    assert day_9.part_1(parsed) == 88
+    assert day_9.part_2(parsed) == 36
+
+
+@mark.parametrize("part", [2])
+def test_solve(mock_get_input: Mock) -> None:
+    """It solves each part from the input given as text, without reading the input."""
+    text = mock_get_input.return_value
+    assert day_9.solve(text, 1) == 88
+    assert day_9.solve(text, 2) == 36
+    mock_get_input.assert_not_called()